@@ -1,14 +1,69 @@
+import asyncio
+import functools
 import hashlib
-import json
+import struct
+import threading
 import time
 import pandas as pd
-from typing import Dict, Any
-from openai import OpenAI
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from openai import OpenAI, AsyncOpenAI, RateLimitError
+
+from ..utils.rate_limiter import TokenBucket
 
 
 class AICommentaryGenerator:
     """Generate market commentary using OpenAI API"""
     
+    # Prompt pieces are constant, so build them once per class
+    _LANGUAGE_INSTRUCTIONS = {
+        "en": "Generate a professional market commentary in English",
+        "sv": "Generera en professionell marknadskommentar på svenska"
+    }
+    
+    _PERIOD_CONTEXT = {
+        "en": {
+            "1d": "today's trading",
+            "5d": "this week",
+            "1mo": "this month",
+            "3mo": "this quarter",
+            "6mo": "6 months",
+            "1y": "this year"
+        },
+        "sv": {
+            "1d": "dagens handel",
+            "5d": "denna vecka",
+            "1mo": "denna månad",
+            "3mo": "detta kvartal",
+            "6mo": "6 månader",
+            "1y": "detta år"
+        }
+    }
+    
+    _PROMPT_TEMPLATE = """{instruction} for stock {symbol} based on {context}:
+
+Current Price: ${current_price:.2f}
+20-day SMA: ${sma_20:.2f}
+50-day SMA: ${sma_50:.2f}
+RSI: {rsi:.1f}
+Trend: {trend}
+Price Change: {price_change:.2f}%
+
+Provide 2-3 sentences focusing on:
+1. Current price movement and trend
+2. Technical indicator signals
+
+Keep it professional and avoid direct investment advice."""
+    
+    _FALLBACK_TEMPLATES = {
+        "en": "{symbol} is trading at ${price:.2f}. "
+              "Price change: {change:+.2f}%. "
+              "Current trend appears {trend}.",
+        "sv": "{symbol} handlas för ${price:.2f}. "
+              "Prisförändring: {change:+.2f}%. "
+              "Nuvarande trend verkar {trend}."
+    }
+    
     def __init__(self, api_key: str):
         """
         Initialize the AI commentary generator.
@@ -17,13 +72,21 @@ class AICommentaryGenerator:
             api_key: OpenAI API key for authentication
         """
         self.client = OpenAI(api_key=api_key)
-        self.last_call_time = 0
-        self.min_interval = 2.0  # 2 seconds between API calls for rate limiting
+        self.async_client = AsyncOpenAI(api_key=api_key)
+        self.min_interval = 2.0  # Average seconds between API calls once the burst is spent
+        self.rate_limiter = TokenBucket(rate=1 / self.min_interval, capacity=3)
+        
+        # In-process memo of successful commentaries keyed by content hash,
+        # locked because the generator is shared across sessions and threads
+        self.memo_ttl = 24 * 3600  # Matches the SQLite commentary max age
+        self.memo_maxsize = 512
+        self._memo: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
     
     def generate_commentary(self, symbol: str, indicators: Dict[str, Any], 
                           period: str, language: str = "en") -> str:
         """
-        Generate AI commentary with caching and rate limiting.
+        Generate AI commentary with in-process memoization and rate limiting.
         
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
@@ -35,35 +98,176 @@ class AICommentaryGenerator:
             Generated market commentary as string
         """
         try:
-            # Simple rate limiting for API calls
-            elapsed = time.time() - self.last_call_time
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
+            # Identical analyses in this process skip the API entirely
+            content_hash = self._create_content_hash(symbol, indicators, period, language)
+            cached = self._memo_get(content_hash)
+            if cached is not None:
+                return cached
             
-            self.last_call_time = time.time()
+            # Token-bucket rate limiting for API calls
+            self.rate_limiter.acquire()
             
             # Build the prompt
             prompt = self._build_prompt(symbol, indicators, period, language)
             
             # Make API call
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-                temperature=0.7
+                **self._completion_params(prompt)
             )
+            self.rate_limiter.increase_rate()
             
-            # Handle potential None response content
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("OpenAI API returned empty response")
-            
-            return content.strip()
+            commentary = self._extract_content(response)
+            self._memo_set(content_hash, commentary)
+            return commentary
             
+        except RateLimitError:
+            # Back off the shared limiter when OpenAI throttles us
+            self.rate_limiter.decrease_rate()
+            return self._get_fallback_commentary(symbol, indicators, period, language)
         except Exception as e:
             # Return fallback commentary on error
             return self._get_fallback_commentary(symbol, indicators, period, language)
     
+    async def generate_commentary_async(self, symbol: str, indicators: Dict[str, Any],
+                                        period: str, language: str = "en") -> str:
+        """
+        Generate AI commentary without blocking the event loop.
+        
+        Each call reserves its own token before awaiting, so concurrent callers
+        share one rate budget but their network round-trips overlap instead of
+        running back to back.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            indicators: Technical indicators dictionary
+            period: Time period for analysis (e.g., '1mo', '3mo')
+            language: Language for commentary ('en' or 'sv')
+            
+        Returns:
+            Generated market commentary as string
+        """
+        try:
+            content_hash = self._create_content_hash(symbol, indicators, period, language)
+            cached = self._memo_get(content_hash)
+            if cached is not None:
+                return cached
+            
+            await self.rate_limiter.acquire_async()
+            
+            prompt = self._build_prompt(symbol, indicators, period, language)
+            
+            response = await self.async_client.chat.completions.create(
+                **self._completion_params(prompt)
+            )
+            self.rate_limiter.increase_rate()
+            
+            commentary = self._extract_content(response)
+            self._memo_set(content_hash, commentary)
+            return commentary
+            
+        except RateLimitError:
+            self.rate_limiter.decrease_rate()
+            return self._get_fallback_commentary(symbol, indicators, period, language)
+        except Exception:
+            # Return fallback commentary on error
+            return self._get_fallback_commentary(symbol, indicators, period, language)
+    
+    async def generate_many(self, jobs: List[Tuple[str, Dict[str, Any], str, str]]) -> List[str]:
+        """
+        Generate commentary for several symbols concurrently.
+        
+        Args:
+            jobs: List of (symbol, indicators, period, language) tuples
+            
+        Returns:
+            List of commentaries in the same order as jobs
+        """
+        results = await asyncio.gather(
+            *(self.generate_commentary_async(*job) for job in jobs),
+            return_exceptions=True
+        )
+        
+        # generate_commentary_async already falls back on API errors, but keep
+        # one failed job from taking down the whole batch
+        return [
+            self._get_fallback_commentary(*job) if isinstance(result, BaseException) else result
+            for job, result in zip(jobs, results)
+        ]
+    
+    def _memo_get(self, content_hash: str) -> Optional[str]:
+        """
+        Look up a memoized commentary if it has not expired.
+        
+        Args:
+            content_hash: Hash from _create_content_hash
+            
+        Returns:
+            Memoized commentary or None if missing or expired
+        """
+        with self._memo_lock:
+            entry = self._memo.get(content_hash)
+            if entry is None:
+                return None
+            
+            commentary, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._memo[content_hash]
+                return None
+            
+            self._memo.move_to_end(content_hash)
+            return commentary
+    
+    def _memo_set(self, content_hash: str, commentary: str) -> None:
+        """
+        Memoize a commentary, evicting the least recently used entry when full.
+        
+        Args:
+            content_hash: Hash from _create_content_hash
+            commentary: Commentary text returned by the API
+        """
+        with self._memo_lock:
+            self._memo[content_hash] = (commentary, time.monotonic() + self.memo_ttl)
+            self._memo.move_to_end(content_hash)
+            if len(self._memo) > self.memo_maxsize:
+                self._memo.popitem(last=False)
+    
+    def _completion_params(self, prompt: str) -> Dict[str, Any]:
+        """
+        Build the chat completion request parameters for a prompt.
+        
+        Args:
+            prompt: Prompt text to send
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        return {
+            'model': "gpt-3.5-turbo",
+            'messages': [{"role": "user", "content": prompt}],
+            'max_tokens': 200,
+            'temperature': 0.7
+        }
+    
+    def _extract_content(self, response: Any) -> str:
+        """
+        Extract the commentary text from a chat completion response.
+        
+        Args:
+            response: OpenAI chat completion response
+            
+        Returns:
+            Stripped commentary text
+            
+        Raises:
+            ValueError: If the response has no content
+        """
+        # Handle potential None response content
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError("OpenAI API returned empty response")
+        
+        return content.strip()
+    
     def _build_prompt(self, symbol: str, indicators: Dict[str, Any], 
                      period: str, language: str) -> str:
         """
@@ -78,45 +282,26 @@ class AICommentaryGenerator:
         Returns:
             Formatted prompt string for OpenAI API
         """
-        lang_instructions = {
-            "en": "Generate a professional market commentary in English",
-            "sv": "Generera en professionell marknadskommentar på svenska"
-        }
-        
-        instruction = lang_instructions.get(language, lang_instructions["en"])
-        
-        period_context = {
-            "1d": "today's trading" if language == "en" else "dagens handel",
-            "5d": "this week" if language == "en" else "denna vecka",
-            "1mo": "this month" if language == "en" else "denna månad",
-            "3mo": "this quarter" if language == "en" else "detta kvartal",
-            "6mo": "6 months" if language == "en" else "6 månader",
-            "1y": "this year" if language == "en" else "detta år"
-        }
-        
+        instruction = self._LANGUAGE_INSTRUCTIONS.get(language, self._LANGUAGE_INSTRUCTIONS["en"])
+        period_context = self._PERIOD_CONTEXT.get(language, self._PERIOD_CONTEXT["en"])
         context = period_context.get(period, f"the {period} period")
         
-        prompt = f"""{instruction} for stock {symbol} based on {context}:
-
-Current Price: ${indicators.get('current_price', 0):.2f}
-20-day SMA: ${indicators.get('sma_20', 0):.2f}
-50-day SMA: ${indicators.get('sma_50', 0):.2f}
-RSI: {indicators.get('rsi', 0):.1f}
-Trend: {indicators.get('trend', 'neutral')}
-Price Change: {indicators.get('price_change_1d', {}).get('percent', 0):.2f}%
-
-Provide 2-3 sentences focusing on:
-1. Current price movement and trend
-2. Technical indicator signals
-
-Keep it professional and avoid direct investment advice."""
-        
-        return prompt
+        return self._PROMPT_TEMPLATE.format(
+            instruction=instruction,
+            symbol=symbol,
+            context=context,
+            current_price=indicators.get('current_price', 0),
+            sma_20=indicators.get('sma_20', 0),
+            sma_50=indicators.get('sma_50', 0),
+            rsi=indicators.get('rsi', 0),
+            trend=indicators.get('trend', 'neutral'),
+            price_change=indicators.get('price_change_1d', {}).get('percent', 0)
+        )
     
     def _create_content_hash(self, symbol: str, indicators: Dict[str, Any], 
                            period: str, language: str) -> str:
         """
-        Create MD5 hash for caching commentary based on key parameters.
+        Create BLAKE2b hash for caching commentary based on key parameters.
         
         Args:
             symbol: Stock symbol
@@ -125,21 +310,21 @@ Keep it professional and avoid direct investment advice."""
             language: Language for commentary
             
         Returns:
-            MD5 hash string for cache key
+            128-bit hex digest string for cache key
         """
         # Use key indicator values for hash (rounded for stability)
-        key_data = {
-            'symbol': symbol,
-            'period': period,
-            'language': language,
-            'current_price': round(indicators.get('current_price', 0), 2),
-            'trend': indicators.get('trend', ''),
-            'rsi': round(indicators.get('rsi') or 0, 0),  # Handle None RSI values
-            'price_change': round(indicators.get('price_change_1d', {}).get('percent', 0), 1)
-        }
+        text_fields = '\0'.join((symbol, period, language, indicators.get('trend', '')))
+        numeric_fields = struct.pack(
+            '<ddd',
+            round(indicators.get('current_price', 0), 2),
+            round(indicators.get('rsi') or 0, 0),  # Handle None RSI values
+            round(indicators.get('price_change_1d', {}).get('percent', 0), 1)
+        )
         
-        content = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(content.encode()).hexdigest()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(text_fields.encode())
+        digest.update(numeric_fields)
+        return digest.hexdigest()
     
     def _get_fallback_commentary(self, symbol: str, indicators: Dict[str, Any], 
                                period: str, language: str) -> str:
@@ -155,14 +340,32 @@ Keep it professional and avoid direct investment advice."""
         Returns:
             Template-based fallback commentary
         """
-        templates = {
-            "en": f"{symbol} is trading at ${indicators.get('current_price', 0):.2f}. "
-                  f"Price change: {indicators.get('price_change_1d', {}).get('percent', 0):+.2f}%. "
-                  f"Current trend appears {indicators.get('trend', 'neutral')}.",
-            
-            "sv": f"{symbol} handlas för ${indicators.get('current_price', 0):.2f}. "
-                  f"Prisförändring: {indicators.get('price_change_1d', {}).get('percent', 0):+.2f}%. "
-                  f"Nuvarande trend verkar {indicators.get('trend', 'neutral')}."
-        }
+        # Round to the displayed precision so repeat fallbacks hit the memo
+        return self._render_fallback(
+            symbol,
+            round(indicators.get('current_price', 0), 2),
+            round(indicators.get('price_change_1d', {}).get('percent', 0), 2),
+            indicators.get('trend', 'neutral'),
+            language if language in self._FALLBACK_TEMPLATES else "en"
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _render_fallback(symbol: str, price: float, change: float,
+                         trend: str, language: str) -> str:
+        """
+        Format the fallback template for one language, memoized on its inputs.
         
-        return templates.get(language, templates["en"])
+        Args:
+            symbol: Stock symbol
+            price: Current price rounded to cents
+            change: 1-day percent change rounded to 2 decimals
+            trend: Trend label
+            language: Supported language code
+            
+        Returns:
+            Template-based fallback commentary
+        """
+        return AICommentaryGenerator._FALLBACK_TEMPLATES[language].format(
+            symbol=symbol, price=price, change=change, trend=trend
+        )
@@ -3,11 +3,131 @@ Technical Indicator Calculator
 
 This module provides calculations for essential technical indicators used in stock analysis.
 It includes methods for calculating Simple Moving Average (SMA), Relative Strength Index (RSI),
-price changes, and trend analysis.
+price changes, and trend analysis. The SMA and RSI series kernels are compiled with numba when
+it is installed.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
+
+from ..utils.jit import njit
+
+
+# Bars of history used to warm up the Wilder RSI recursion. Older bars carry
+# a weight of at most (13/14)^235 ~ 3e-8 for the default 14-bar window, so
+# capping the input keeps RSI cost constant for long periods like '5y'/'max'.
+RSI_LOOKBACK = 250
+
+
+@njit(cache=True)
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """Convert smoothed average gain/loss into an RSI value"""
+    if avg_loss == 0:
+        # No losses: RSI = 100 if there are gains, RSI = 50 if no movement
+        return 100.0 if avg_gain > 0 else 50.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True)
+def _wilder_pass(values: np.ndarray, window: int, out: np.ndarray) -> Tuple[float, float]:
+    """
+    Wilder smoothing over values, optionally writing the RSI at every bar.
+    
+    Seeds with the simple mean of window deltas, then applies
+    avg = (avg * (window - 1) + current) / window for every later delta.
+    A NaN delta invalidates the averages and restarts the seed, so like a
+    pandas rolling window the RSI is NaN until window valid deltas follow.
+    
+    Args:
+        values: Close prices
+        window: RSI window
+        out: Array receiving the RSI per bar, or an empty array to skip it
+    
+    Returns:
+        Smoothed (avg_gain, avg_loss) at the last bar, NaN while reseeding
+    """
+    write = len(out) > 0
+    avg_gain = np.nan
+    avg_loss = np.nan
+    seed_gain = 0.0
+    seed_loss = 0.0
+    seeded = 0
+    for i in range(1, len(values)):
+        delta = values[i] - values[i - 1]
+        if np.isnan(delta):
+            avg_gain = np.nan
+            avg_loss = np.nan
+            seed_gain = 0.0
+            seed_loss = 0.0
+            seeded = 0
+            continue
+        
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if seeded < window:
+            seed_gain += gain
+            seed_loss += loss
+            seeded += 1
+            if seeded < window:
+                continue
+            avg_gain = seed_gain / window
+            avg_loss = seed_loss / window
+        else:
+            avg_gain = (avg_gain * (window - 1) + gain) / window
+            avg_loss = (avg_loss * (window - 1) + loss) / window
+        
+        if write:
+            out[i] = _rsi_from_averages(avg_gain, avg_loss)
+    
+    return avg_gain, avg_loss
+
+
+@njit(cache=True)
+def _wilder_averages(values: np.ndarray, window: int) -> Tuple[float, float]:
+    """Wilder-smoothed average gain and loss at the last bar (NaN-aware)"""
+    return _wilder_pass(values, window, np.empty(0))
+
+
+@njit(cache=True)
+def _wilder_rsi_series(values: np.ndarray, window: int) -> np.ndarray:
+    """Full Wilder RSI series; NaN for the first window entries and after any gap"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window + 1:
+        _wilder_pass(values, window, out)
+    return out
+
+
+@njit(cache=True)
+def _sma_series(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean via a running sum; NaN until a full window of valid values.
+    
+    Matches pandas rolling(window).mean(): any window containing a NaN
+    yields NaN, and the sum recovers once the NaN leaves the window.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    total = 0.0
+    nan_count = 0
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            total += value
+        
+        if i >= window:
+            old = values[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                total -= old
+        
+        if i >= window - 1 and nan_count == 0:
+            out[i] = total / window
+    return out
 
 
 class TechnicalCalculator:
@@ -25,14 +145,12 @@ class TechnicalCalculator:
         Returns:
             Latest SMA value or None if insufficient data
         """
-        if len(prices) < window:
-            return None
-        return float(prices.rolling(window=window).mean().iloc[-1])
+        return TechnicalCalculator._sma_tail(prices.to_numpy(dtype=np.float64, copy=False), window)
     
     @staticmethod
     def calculate_rsi(prices: pd.Series, window: int = 14) -> Optional[float]:
         """
-        Calculate Relative Strength Index - return latest value
+        Calculate Relative Strength Index with Wilder smoothing - return latest value
         
         Args:
             prices: Series of stock prices
@@ -41,29 +159,71 @@ class TechnicalCalculator:
         Returns:
             Latest RSI value or None if insufficient data
         """
-        if len(prices) < window + 1:
+        return TechnicalCalculator._rsi_tail(prices.to_numpy(dtype=np.float64, copy=False), window)
+    
+    @staticmethod
+    def _sma_tail(values: np.ndarray, window: int) -> Optional[float]:
+        """Latest SMA from a float64 array, averaging only the tail slice"""
+        if len(values) < window:
             return None
+        return float(values[-window:].mean())
+    
+    @staticmethod
+    def _rsi_tail(values: np.ndarray, window: int) -> Optional[float]:
+        """Latest Wilder RSI from a float64 array"""
+        if len(values) < window + 1:
+            return None
+        lookback = max(RSI_LOOKBACK, window * 10 + 1)
+        avg_gain, avg_loss = _wilder_averages(values[-lookback:], window)
+        return float(_rsi_from_averages(avg_gain, avg_loss))
+    
+    @staticmethod
+    def calculate_sma_series(prices: pd.Series, window: int) -> pd.Series:
+        """
+        Calculate the full Simple Moving Average series for charting
         
-        delta = prices.diff()
-        # Calculate gains and losses for RSI using pandas methods
-        gains = delta.clip(lower=0.0)  # Keep positive values, set negative to 0
-        losses = (-delta).clip(lower=0.0)  # Keep losses as positive values
-        
-        gain = gains.rolling(window=window).mean()
-        loss = losses.rolling(window=window).mean()
-        
-        # Handle division by zero cases
-        latest_gain = gain.iloc[-1]
-        latest_loss = loss.iloc[-1]
+        Args:
+            prices: Series of stock prices
+            window: Number of periods for the moving average
+            
+        Returns:
+            SMA series aligned with prices; leading values are NaN
+        """
+        values = prices.to_numpy(dtype=np.float64, copy=False)
+        return pd.Series(_sma_series(values, window), index=prices.index, name=f'SMA_{window}')
+    
+    @staticmethod
+    def calculate_rsi_series(prices: pd.Series, window: int = 14) -> pd.Series:
+        """
+        Calculate the full Wilder RSI series for charting
         
-        if latest_loss == 0:
-            # No losses: RSI = 100 if there are gains, RSI = 50 if no movement
-            rsi_value = 100.0 if latest_gain > 0 else 50.0
-        else:
-            rs = latest_gain / latest_loss
-            rsi_value = 100 - (100 / (1 + rs))
+        Args:
+            prices: Series of stock prices
+            window: Number of periods for RSI calculation (default 14)
+            
+        Returns:
+            RSI series aligned with prices; leading values are NaN
+        """
+        values = prices.to_numpy(dtype=np.float64, copy=False)
+        return pd.Series(_wilder_rsi_series(values, window), index=prices.index, name='RSI')
+    
+    def calculate_indicator_series(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Calculate the full SMA and RSI series used by the charts
         
-        return float(rsi_value)
+        Args:
+            data: DataFrame with stock data including a 'Close' column
+            
+        Returns:
+            Dictionary with 'sma_20', 'sma_50' and 'rsi' float64 arrays aligned
+            with the data; leading values are NaN
+        """
+        close = data['Close'].to_numpy(dtype=np.float64, copy=False)
+        return {
+            'sma_20': _sma_series(close, 20),
+            'sma_50': _sma_series(close, 50),
+            'rsi': _wilder_rsi_series(close, 14)
+        }
     
     def calculate_indicators(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -77,18 +237,21 @@ class TechnicalCalculator:
             
         Note:
             volume_avg calculates the mean of the last 20 volume entries, or all available
-            entries if fewer than 20 records are provided.
+            entries if fewer than 20 records are provided. Every indicator reads only a
+            bounded tail of the data, so cost does not grow with the requested period.
         """
-        close_prices = data['Close']
+        # Extract the columns once and derive every indicator from the same arrays
+        close = data['Close'].to_numpy(dtype=np.float64, copy=False)
+        volume = data['Volume'].to_numpy(dtype=np.float64, copy=False)
         
         indicators = {
-            'current_price': float(close_prices.iloc[-1]),
-            'sma_20': self.calculate_sma(close_prices, 20),
-            'sma_50': self.calculate_sma(close_prices, 50),
-            'rsi': self.calculate_rsi(close_prices),
-            'volume_avg': float(data['Volume'].tail(20).mean()),
-            'price_change_1d': self._calculate_price_change(close_prices, 1),
-            'price_change_5d': self._calculate_price_change(close_prices, 5)
+            'current_price': float(close[-1]),
+            'sma_20': self._sma_tail(close, 20),
+            'sma_50': self._sma_tail(close, 50),
+            'rsi': self._rsi_tail(close, 14),
+            'volume_avg': float(np.nanmean(volume[-20:])),
+            'price_change_1d': self._calculate_price_change(close, 1),
+            'price_change_5d': self._calculate_price_change(close, 5)
         }
         
         # Add trend analysis
@@ -96,12 +259,12 @@ class TechnicalCalculator:
         
         return indicators
     
-    def _calculate_price_change(self, prices: pd.Series, days: int) -> Dict[str, float]:
+    def _calculate_price_change(self, prices: Union[pd.Series, np.ndarray], days: int) -> Dict[str, float]:
         """
         Calculate price change over specified days
         
         Args:
-            prices: Series of stock prices
+            prices: Series or array of stock prices
             days: Number of days to look back
             
         Returns:
@@ -110,8 +273,9 @@ class TechnicalCalculator:
         if len(prices) < days + 1:
             return {'amount': 0.0, 'percent': 0.0}
         
-        current = float(prices.iloc[-1])
-        previous = float(prices.iloc[-(days + 1)])
+        values = np.asarray(prices, dtype=np.float64)
+        current = float(values[-1])
+        previous = float(values[-(days + 1)])
         amount = current - previous
         percent = (amount / previous) * 100 if previous != 0 else 0.0
         
@@ -134,17 +298,12 @@ class TechnicalCalculator:
         sma_50 = indicators.get('sma_50')
         current = indicators.get('current_price')
         
-        if not all([sma_20 is not None, sma_50 is not None, current is not None]):
+        if sma_20 is None or sma_50 is None or current is None:
             return 'insufficient_data'
         
-        # Safe type assertion after null check - we know these are not None
-        sma_20_val = float(sma_20)  # type: ignore
-        sma_50_val = float(sma_50)  # type: ignore  
-        current_val = float(current)  # type: ignore
-        
-        if current_val > sma_20_val > sma_50_val:
+        # Values are already floats from calculate_indicators
+        if current > sma_20 > sma_50:
             return 'bullish'
-        elif current_val < sma_20_val < sma_50_val:
+        if current < sma_20 < sma_50:
             return 'bearish'
-        else:
-            return 'neutral'
+        return 'neutral'
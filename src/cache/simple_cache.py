@@ -1,10 +1,18 @@
 import sqlite3
-import json
+import threading
 import time
 import pandas as pd
-from typing import Optional
+from typing import Iterable, Optional, Tuple, Union
 from pathlib import Path
-from io import StringIO
+from io import BytesIO
+
+
+# SQL is kept in constants so sqlite3's per-connection statement cache
+# reuses the compiled statements on every call
+_SELECT_SQL = 'SELECT data, timestamp FROM cache WHERE key = ?'
+_UPSERT_SQL = 'INSERT OR REPLACE INTO cache (key, data, timestamp) VALUES (?, ?, ?)'
+_DELETE_SQL = 'DELETE FROM cache WHERE key = ?'
+_CLEANUP_SQL = 'DELETE FROM cache WHERE timestamp < ?'
 
 
 class SimpleCache:
@@ -17,13 +25,19 @@ class SimpleCache:
             db_path: Path to SQLite database file. Use ':memory:' for in-memory testing.
         """
         self.db_path = db_path
-        self._connection = None
+        self._ensure_db_directory()
+        
+        # One persistent autocommit connection shared by all Streamlit threads,
+        # serialized by a lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._configure_connection()
         
-        # For in-memory databases, maintain a persistent connection
-        if self.db_path == ':memory:':
-            self._connection = sqlite3.connect(self.db_path)
-        else:
-            self._ensure_db_directory()
+        # Background cleanup thread, started on demand
+        self._cleanup_stop = threading.Event()
+        self._cleanup_thread: Optional[threading.Thread] = None
         
         self._init_db()
     
@@ -32,43 +46,45 @@ class SimpleCache:
         if self.db_path != ':memory:':
             Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
     
+    def _configure_connection(self):
+        """Apply performance pragmas to the persistent connection"""
+        # WAL lets readers proceed during writes; NORMAL sync is safe with WAL
+        # (in-memory databases ignore journal_mode)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('PRAGMA temp_store=MEMORY')
+        self._connection.execute('PRAGMA mmap_size=268435456')
+    
     def _init_db(self):
         """Initialize database with simple schema"""
-        if self._connection:
-            # Use persistent connection for in-memory database
+        with self._lock:
             self._connection.execute('''
                 CREATE TABLE IF NOT EXISTS cache (
                     key TEXT PRIMARY KEY,
-                    data TEXT NOT NULL,
+                    data BLOB NOT NULL,
                     timestamp REAL NOT NULL
                 )
             ''')
-            self._connection.commit()
-        else:
-            # Use context manager for file-based database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS cache (
-                        key TEXT PRIMARY KEY,
-                        data TEXT NOT NULL,
-                        timestamp REAL NOT NULL
-                    )
-                ''')
-                conn.commit()
-    
-    def get_stock_data(self, symbol: str, period: str, max_age_hours: int = 1) -> Optional[pd.DataFrame]:
+            # Lets cleanup_old_data range-scan instead of reading every row
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS idx_cache_timestamp ON cache(timestamp)'
+            )
+    
+    def get_stock_data(self, symbol: str, period: str, max_age_hours: int = 1,
+                       now: Optional[float] = None) -> Optional[pd.DataFrame]:
         """Retrieve cached stock data if fresh
         
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
             period: Time period (e.g., '1d', '5d', '1mo')
             max_age_hours: Maximum age in hours before data is considered stale
+            now: Wall-clock time to measure age against (default: time.time())
             
         Returns:
             DataFrame with stock data if found and fresh, None otherwise
         """
         key = f"stock_{symbol}_{period}"
-        return self._get_dataframe(key, max_age_hours)
+        return self._get_dataframe(key, max_age_hours, now)
     
     def set_stock_data(self, symbol: str, period: str, data: pd.DataFrame):
         """Cache stock data
@@ -81,18 +97,20 @@ class SimpleCache:
         key = f"stock_{symbol}_{period}"
         self._set_dataframe(key, data)
     
-    def get_commentary(self, content_hash: str, max_age_hours: int = 24) -> Optional[str]:
+    def get_commentary(self, content_hash: str, max_age_hours: int = 24,
+                       now: Optional[float] = None) -> Optional[str]:
         """Retrieve cached AI commentary
         
         Args:
             content_hash: Hash of the content used to generate commentary
             max_age_hours: Maximum age in hours before commentary is considered stale
+            now: Wall-clock time to measure age against (default: time.time())
             
         Returns:
             Cached commentary text if found and fresh, None otherwise
         """
         key = f"commentary_{content_hash}"
-        return self._get_text(key, max_age_hours)
+        return self._get_text(key, max_age_hours, now)
     
     def set_commentary(self, content_hash: str, commentary: str):
         """Cache AI commentary
@@ -104,105 +122,165 @@ class SimpleCache:
         key = f"commentary_{content_hash}"
         self._set_text(key, commentary)
     
-    def _get_dataframe(self, key: str, max_age_hours: int) -> Optional[pd.DataFrame]:
+    def set_many(self, stock_data: Iterable[Tuple[str, str, pd.DataFrame]] = (),
+                 commentaries: Iterable[Tuple[str, str]] = ()):
+        """Cache several stock frames and commentaries in a single transaction
+        
+        Args:
+            stock_data: (symbol, period, DataFrame) tuples to cache
+            commentaries: (content_hash, commentary) tuples to cache
+        """
+        rows = [
+            (f"stock_{symbol}_{period}", sqlite3.Binary(self._serialize_dataframe(data)))
+            for symbol, period, data in stock_data
+        ]
+        rows.extend(
+            (f"commentary_{content_hash}", commentary)
+            for content_hash, commentary in commentaries
+        )
+        if not rows:
+            return
+        
+        now = time.time()
+        with self._lock:
+            connection = self._open_connection()
+            # Explicit transaction so the batch costs one commit, not one per row
+            with connection:
+                connection.execute('BEGIN')
+                connection.executemany(
+                    _UPSERT_SQL, [(key, data, now) for key, data in rows]
+                )
+    
+    def _get_dataframe(self, key: str, max_age_hours: int,
+                       now: Optional[float] = None) -> Optional[pd.DataFrame]:
         """Get DataFrame from cache if fresh
         
         Args:
             key: Cache key
             max_age_hours: Maximum age in hours
+            now: Wall-clock time to measure age against (default: time.time())
             
         Returns:
             DataFrame if found and fresh, None otherwise
         """
-        data_json = self._get_text(key, max_age_hours)
-        if data_json:
+        blob = self._get_blob(key, max_age_hours, now)
+        if blob is not None:
             try:
-                # Use StringIO and orient='split' to preserve data types and index information
-                return pd.read_json(StringIO(data_json), orient='split')
-            except (ValueError, TypeError):
-                # Remove corrupted data
+                # Parquet preserves dtypes, timezone and index losslessly
+                return pd.read_parquet(BytesIO(blob))
+            except (ValueError, TypeError, OSError):
+                # Remove corrupted or legacy JSON data
                 self._delete(key)
         return None
     
     def _set_dataframe(self, key: str, data: pd.DataFrame):
-        """Store DataFrame as JSON
+        """Store DataFrame as a Parquet blob
         
         Args:
             key: Cache key
             data: DataFrame to store
         """
-        # Use orient='split' to preserve data types and index information
-        self._set_text(key, data.to_json(orient='split'))
+        self._set_blob(key, self._serialize_dataframe(data))
+    
+    def _serialize_dataframe(self, data: pd.DataFrame) -> bytes:
+        """Encode a DataFrame as zstd-compressed Parquet
+        
+        Args:
+            data: DataFrame to encode
+            
+        Returns:
+            Parquet bytes
+        """
+        buffer = BytesIO()
+        data.to_parquet(buffer, engine='pyarrow', compression='zstd')
+        return buffer.getvalue()
     
-    def _get_text(self, key: str, max_age_hours: int) -> Optional[str]:
+    def _get_blob(self, key: str, max_age_hours: int,
+                  now: Optional[float] = None) -> Optional[bytes]:
+        """Get binary data from cache if fresh
+        
+        Args:
+            key: Cache key
+            max_age_hours: Maximum age in hours
+            now: Wall-clock time to measure age against (default: time.time())
+            
+        Returns:
+            Cached bytes if found and fresh, None otherwise
+        """
+        return self._get_value(key, max_age_hours, now)
+    
+    def _set_blob(self, key: str, data: bytes):
+        """Store binary data with timestamp
+        
+        Args:
+            key: Cache key
+            data: Bytes to store
+        """
+        self._set_value(key, sqlite3.Binary(data))
+    
+    def _get_text(self, key: str, max_age_hours: int,
+                  now: Optional[float] = None) -> Optional[str]:
         """Get text data from cache if fresh
         
         Args:
             key: Cache key
             max_age_hours: Maximum age in hours
+            now: Wall-clock time to measure age against (default: time.time())
             
         Returns:
             Cached text if found and fresh, None otherwise
         """
-        if self._connection:
-            # Use persistent connection for in-memory database
-            cursor = self._connection.execute(
-                'SELECT data, timestamp FROM cache WHERE key = ?', (key,)
-            )
-        else:
-            # Use context manager for file-based database
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    'SELECT data, timestamp FROM cache WHERE key = ?', (key,)
-                )
-                row = cursor.fetchone()
-                
-                if row:
-                    data, timestamp = row
-                    age_hours = (time.time() - timestamp) / 3600
-                    if age_hours <= max_age_hours:
-                        return data
-                    else:
-                        # Clean up stale data
-                        conn.execute('DELETE FROM cache WHERE key = ?', (key,))
-                        conn.commit()
-                return None
+        return self._get_value(key, max_age_hours, now)
+    
+    def _set_text(self, key: str, data: str):
+        """Store text data with timestamp
         
-        # Handle in-memory database case
-        row = cursor.fetchone()
-        if row:
+        Args:
+            key: Cache key
+            data: Text data to store
+        """
+        self._set_value(key, data)
+    
+    def _get_value(self, key: str, max_age_hours: int,
+                   now: Optional[float] = None) -> Optional[Union[str, bytes]]:
+        """Get stored value from cache if fresh
+        
+        Args:
+            key: Cache key
+            max_age_hours: Maximum age in hours
+            now: Wall-clock time to measure age against (default: time.time())
+            
+        Returns:
+            Cached value if found and fresh, None otherwise
+        """
+        with self._lock:
+            connection = self._open_connection()
+            row = connection.execute(_SELECT_SQL, (key,)).fetchone()
+            if row is None:
+                return None
+            
+            # Timestamps are persisted, so they must be wall-clock rather than
+            # monotonic (whose origin resets on reboot)
             data, timestamp = row
-            age_hours = (time.time() - timestamp) / 3600
+            if now is None:
+                now = time.time()
+            age_hours = (now - timestamp) / 3600
             if age_hours <= max_age_hours:
                 return data
-            else:
-                # Clean up stale data
-                self._connection.execute('DELETE FROM cache WHERE key = ?', (key,))
-                self._connection.commit()
-        return None
+            
+            # Clean up stale data
+            connection.execute(_DELETE_SQL, (key,))
+            return None
 
-    def _set_text(self, key: str, data: str):
-        """Store text data with timestamp
+    def _set_value(self, key: str, data: Union[str, bytes]):
+        """Store a text or binary value with timestamp
         
         Args:
             key: Cache key
-            data: Text data to store
+            data: Value to store
         """
-        if self._connection:
-            # Use persistent connection for in-memory database
-            self._connection.execute(
-                'INSERT OR REPLACE INTO cache (key, data, timestamp) VALUES (?, ?, ?)',
-                (key, data, time.time())
-            )
-            self._connection.commit()
-        else:
-            # Use context manager for file-based database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    'INSERT OR REPLACE INTO cache (key, data, timestamp) VALUES (?, ?, ?)',
-                    (key, data, time.time())
-                )
-                conn.commit()
+        with self._lock:
+            self._open_connection().execute(_UPSERT_SQL, (key, data, time.time()))
 
     def _delete(self, key: str):
         """Delete cache entry
@@ -210,15 +288,21 @@ class SimpleCache:
         Args:
             key: Cache key to delete
         """
-        if self._connection:
-            # Use persistent connection for in-memory database
-            self._connection.execute('DELETE FROM cache WHERE key = ?', (key,))
-            self._connection.commit()
-        else:
-            # Use context manager for file-based database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('DELETE FROM cache WHERE key = ?', (key,))
-                conn.commit()
+        with self._lock:
+            self._open_connection().execute(_DELETE_SQL, (key,))
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Return the persistent connection; the caller must hold self._lock
+        
+        Returns:
+            The open connection
+            
+        Raises:
+            sqlite3.ProgrammingError: If the cache has been closed
+        """
+        if self._connection is None:
+            raise sqlite3.ProgrammingError("cache is closed")
+        return self._connection
     
     def cleanup_old_data(self, max_age_hours: int = 168) -> int:
         """Remove old cache entries
@@ -227,27 +311,64 @@ class SimpleCache:
             max_age_hours: Maximum age in hours (default: 168 = 1 week)
             
         Returns:
-            Number of deleted entries
+            Number of deleted entries (0 once the cache has been closed)
         """
         cutoff = time.time() - (max_age_hours * 3600)
         
-        if self._connection:
-            # Use persistent connection for in-memory database
-            cursor = self._connection.execute('DELETE FROM cache WHERE timestamp < ?', (cutoff,))
-            deleted = cursor.rowcount
-            self._connection.commit()
-            return deleted
-        else:
-            # For file-based database, we need to handle the connection directly
-            # to get the rowcount before the connection closes
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute('DELETE FROM cache WHERE timestamp < ?', (cutoff,))
-                deleted = cursor.rowcount
-                conn.commit()
-                return deleted
+        with self._lock:
+            # close() clears the connection under this lock, so a background
+            # sweep racing it sees either a live connection or None
+            if self._connection is None:
+                return 0
+            cursor = self._connection.execute(_CLEANUP_SQL, (cutoff,))
+            return cursor.rowcount
+    
+    def start_background_cleanup(self, interval_hours: float = 1, max_age_hours: int = 168):
+        """Periodically remove old entries on a daemon thread
+        
+        Keeps garbage collection out of the request path. Calling this again
+        while the thread is running has no effect.
+        
+        Args:
+            interval_hours: Hours between cleanup runs (default: 1)
+            max_age_hours: Maximum entry age passed to cleanup_old_data (default: 168)
+        """
+        if self._cleanup_thread is not None and self._cleanup_thread.is_alive():
+            return
+        
+        self._cleanup_stop.clear()
+        self._cleanup_thread = threading.Thread(
+            target=self._cleanup_loop,
+            args=(interval_hours * 3600, max_age_hours),
+            name='simple-cache-cleanup',
+            daemon=True
+        )
+        self._cleanup_thread.start()
+    
+    def _cleanup_loop(self, interval_seconds: float, max_age_hours: int):
+        """Run cleanup_old_data every interval until stopped
+        
+        Args:
+            interval_seconds: Seconds between cleanup runs
+            max_age_hours: Maximum entry age in hours
+        """
+        while not self._cleanup_stop.wait(interval_seconds):
+            # close() sets the stop event before closing, and a sweep racing it
+            # finds the connection cleared under the lock and deletes nothing
+            try:
+                self.cleanup_old_data(max_age_hours)
+            except sqlite3.Error:
+                # A failed sweep is retried on the next interval
+                continue
     
     def close(self):
-        """Close the persistent connection if it exists"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Stop background cleanup and close the persistent connection if it exists"""
+        self._cleanup_stop.set()
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join(timeout=1)
+            self._cleanup_thread = None
+        
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
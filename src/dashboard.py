@@ -6,9 +6,16 @@ all backend operations including data fetching, technical analysis,
 AI commentary generation, and caching.
 """
 
+import asyncio
 import logging
-import re
-from typing import Dict, Any, List, Optional
+import string
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, List, Mapping, Optional, Tuple, Union
+
+import pandas as pd
 
 from .config import Config
 from .cache.simple_cache import SimpleCache
@@ -17,16 +24,45 @@ from .analysis.technical_calculator import TechnicalCalculator
 from .ai.commentary_generator import AICommentaryGenerator
 
 
+# Characters allowed in a normalized symbol (dots/dashes for e.g. BRK.A, BF-B)
+SYMBOL_CHARS = frozenset(string.ascii_uppercase + string.digits + '.-')
+
+# Periods accepted by yfinance, in display order
+VALID_PERIODS = ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max')
+_VALID_PERIOD_SET = frozenset(VALID_PERIODS)
+
+
 class StockDashboard:
     """Main coordinator for stock dashboard operations"""
     
+    # Read-only so the shared instance can be handed out on every rerun
+    _POPULAR: Tuple[Mapping[str, str], ...] = tuple(
+        MappingProxyType({'symbol': symbol, 'name': name})
+        for symbol, name in (
+            ('AAPL', 'Apple Inc.'),
+            ('GOOGL', 'Alphabet Inc.'),
+            ('MSFT', 'Microsoft Corp.'),
+            ('TSLA', 'Tesla Inc.'),
+            ('AMZN', 'Amazon.com Inc.'),
+            ('NVDA', 'NVIDIA Corp.'),
+            ('META', 'Meta Platforms Inc.'),
+        )
+    )
+    
     def __init__(self, config: Optional[Config] = None):
         """Initialize the stock dashboard with all required components"""
         self.config = config or Config()
         self.cache = SimpleCache(self.config.db_path)
+        self.cache.start_background_cleanup()
         self.data_provider = YFinanceProvider()
         self.calculator = TechnicalCalculator()
         
+        # LRU of calculated indicators keyed by the identity of the latest bar,
+        # locked because the instance is shared by every session and worker thread
+        self._indicator_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._indicator_lock = threading.Lock()
+        self.indicator_cache_size = 128
+        
         # Ensure we have a valid API key
         if not self.config.openai_api_key:
             raise ValueError("OpenAI API key is required")
@@ -55,54 +91,356 @@ class StockDashboard:
             Exception: If data fetching or analysis fails
         """
         try:
-            # Input validation
+            # One clock reading covers every freshness check in this request
+            now = time.time()
+            market_data = self.get_market_data(symbol, period, now=now)
+            commentary = self.get_commentary(
+                market_data['symbol'], market_data['period'], market_data['indicators'],
+                language, now=now
+            )
+            return {**market_data, 'commentary': commentary}
+            
+        except Exception as e:
+            self.logger.error(f"Error analyzing {symbol}: {str(e)}")
+            raise
+    
+    def get_market_data(self, symbol: str, period: str = "1mo",
+                        now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Load price data and indicators, independent of commentary language.
+        
+        The full SMA/RSI series are computed here, once per load, so the charts
+        only have to plot them.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            period: Time period for analysis
+            now: Wall-clock time for the cache freshness check
+            
+        Returns:
+            Dictionary containing symbol, period, data, indicators, series, and last_updated
+            
+        Raises:
+            ValueError: If symbol or period is invalid
+            Exception: If data fetching fails
+        """
+        symbol = self._validate_symbol(symbol)
+        period = self._validate_period(period)
+        
+        self.logger.info(f"Analyzing {symbol} for {period}")
+        
+        data = self._load_stock_data(symbol, period, now=now)
+        indicators = self._get_indicators(symbol, period, data)
+        
+        return self._build_market_data(symbol, period, data, indicators)
+    
+    def get_commentary(self, symbol: str, period: str, indicators: Dict[str, Any],
+                       language: str = "en", now: Optional[float] = None) -> str:
+        """
+        Get AI commentary for calculated indicators, using the commentary cache.
+        
+        Args:
+            symbol: Validated stock symbol
+            period: Validated time period
+            indicators: Indicators from get_market_data
+            language: Language for commentary ('en', 'sv')
+            now: Wall-clock time for the cache freshness check
+            
+        Returns:
+            AI or fallback commentary text
+        """
+        content_hash = self.ai_generator._create_content_hash(
+            symbol, indicators, period, language
+        )
+        commentary = self.cache.get_commentary(content_hash, max_age_hours=24, now=now)
+        
+        if commentary is None:
+            self.logger.info("Generating fresh AI commentary")
+            commentary = self.ai_generator.generate_commentary(
+                symbol, indicators, period, language
+            )
+            self.cache.set_commentary(content_hash, commentary)
+        else:
+            self.logger.info("Using cached AI commentary")
+        
+        return commentary
+    
+    async def get_stock_analysis_async(self, symbol: str, period: str = "1mo",
+                                       language: str = "en") -> Dict[str, Any]:
+        """
+        Async variant of get_stock_analysis for concurrent multi-symbol use.
+        
+        Data fetching runs in a worker thread and commentary uses the async
+        OpenAI client, so several analyses can wait on the network at once.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            period: Time period for analysis
+            language: Language for commentary ('en', 'sv')
+            
+        Returns:
+            Same dictionary as get_stock_analysis
+            
+        Raises:
+            ValueError: If symbol or period is invalid
+            Exception: If data fetching or analysis fails
+        """
+        return await self._analyze_async(symbol, period, language)
+    
+    async def _analyze_async(self, symbol: str, period: str, language: str,
+                             pending_writes: Optional[Dict[str, list]] = None) -> Dict[str, Any]:
+        """
+        Core of get_stock_analysis_async with optional deferred cache writes.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            period: Time period for analysis
+            language: Language for commentary ('en', 'sv')
+            pending_writes: If given, cache writes are appended to its
+                'stock_data'/'commentaries' lists instead of written immediately
+            
+        Returns:
+            Same dictionary as get_stock_analysis
+        """
+        try:
             symbol = self._validate_symbol(symbol)
             period = self._validate_period(period)
             
             self.logger.info(f"Analyzing {symbol} for {period}")
             
-            # Try to get cached data
-            data = self.cache.get_stock_data(symbol, period, self.config.cache_hours)
-            
-            # Fetch fresh data if needed
-            if data is None:
-                self.logger.info(f"Fetching fresh data for {symbol}")
-                data = self.data_provider.fetch_stock_data(symbol, period)
-                self.cache.set_stock_data(symbol, period, data)
-            else:
-                self.logger.info(f"Using cached data for {symbol}")
+            now = time.time()
+            data = await asyncio.to_thread(
+                self._load_stock_data, symbol, period, pending_writes, now
+            )
             
-            # Calculate indicators
-            indicators = self.calculator.calculate_indicators(data)
+            # Indicators are CPU-bound and cheap, keep them on the event loop
+            indicators = self._get_indicators(symbol, period, data)
             
-            # Generate AI commentary (with caching)
             content_hash = self.ai_generator._create_content_hash(
                 symbol, indicators, period, language
             )
-            commentary = self.cache.get_commentary(content_hash, max_age_hours=24)
+            commentary = self.cache.get_commentary(content_hash, max_age_hours=24, now=now)
             
             if commentary is None:
                 self.logger.info("Generating fresh AI commentary")
-                commentary = self.ai_generator.generate_commentary(
+                commentary = await self.ai_generator.generate_commentary_async(
                     symbol, indicators, period, language
                 )
-                self.cache.set_commentary(content_hash, commentary)
+                if pending_writes is None:
+                    self.cache.set_commentary(content_hash, commentary)
+                else:
+                    pending_writes['commentaries'].append((content_hash, commentary))
             else:
                 self.logger.info("Using cached AI commentary")
             
-            return {
-                'symbol': symbol,
-                'period': period,
-                'data': data,
-                'indicators': indicators,
-                'commentary': commentary,
-                'last_updated': data.index[-1].strftime('%Y-%m-%d %H:%M:%S')
-            }
+            return self._build_analysis(symbol, period, data, indicators, commentary)
             
         except Exception as e:
             self.logger.error(f"Error analyzing {symbol}: {str(e)}")
             raise
     
+    async def get_stock_analyses(self, symbols: List[str], period: str = "1mo",
+                                 language: str = "en") -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Analyze several symbols concurrently.
+        
+        Args:
+            symbols: Stock symbols to analyze
+            period: Time period for analysis
+            language: Language for commentary ('en', 'sv')
+            
+        Returns:
+            List aligned with symbols; each entry is the analysis dictionary or
+            the exception raised for that symbol
+        """
+        pending_writes = self._new_write_batch()
+        try:
+            return await asyncio.gather(
+                *(self._analyze_async(symbol, period, language, pending_writes)
+                  for symbol in symbols),
+                return_exceptions=True
+            )
+        finally:
+            # Persist every fetched frame and commentary in one transaction
+            self.cache.set_many(**pending_writes)
+    
+    async def iter_stock_analyses(self, symbols: List[str], period: str = "1mo",
+                                  language: str = "en"
+                                  ) -> AsyncIterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+        """
+        Analyze several symbols concurrently, yielding each as soon as it finishes.
+        
+        Lets the UI render the first result after a single round-trip instead of
+        waiting for the slowest symbol.
+        
+        Args:
+            symbols: Stock symbols to analyze
+            period: Time period for analysis
+            language: Language for commentary ('en', 'sv')
+            
+        Yields:
+            (symbol, analysis dictionary or raised exception) in completion order
+        """
+        pending_writes = self._new_write_batch()
+        
+        async def analyze(symbol: str):
+            try:
+                return symbol, await self._analyze_async(symbol, period, language, pending_writes)
+            except Exception as e:
+                return symbol, e
+        
+        try:
+            for next_result in asyncio.as_completed([analyze(symbol) for symbol in symbols]):
+                yield await next_result
+        finally:
+            self.cache.set_many(**pending_writes)
+    
+    def preload_stock_data(self, symbols: List[str], period: str = "1mo") -> int:
+        """
+        Warm the cache for a watchlist with batched fetches.
+        
+        Symbols that are invalid or already cached are skipped; the rest are
+        fetched through the provider's fetch_many and written in a single
+        cache transaction, so later analyses of them hit the cache.
+        
+        Args:
+            symbols: Stock symbols to preload
+            period: Time period to preload
+            
+        Returns:
+            Number of symbols fetched and cached
+        """
+        period = self._validate_period(period)
+        now = time.time()
+        
+        missing = []
+        for symbol in symbols:
+            try:
+                symbol = self._validate_symbol(symbol)
+            except ValueError:
+                continue
+            if self.cache.get_stock_data(symbol, period, self.config.cache_hours, now=now) is None:
+                missing.append(symbol)
+        
+        if not missing:
+            return 0
+        
+        self.logger.info(f"Preloading {len(missing)} symbols for {period}")
+        fetched = self.data_provider.fetch_many(missing, period)
+        self.cache.set_many(stock_data=[(symbol, period, data) for symbol, data in fetched.items()])
+        return len(fetched)
+    
+    @staticmethod
+    def _new_write_batch() -> Dict[str, list]:
+        """Create an empty batch of deferred cache writes for SimpleCache.set_many"""
+        return {'stock_data': [], 'commentaries': []}
+    
+    def _load_stock_data(self, symbol: str, period: str,
+                         pending_writes: Optional[Dict[str, list]] = None,
+                         now: Optional[float] = None) -> pd.DataFrame:
+        """
+        Get stock data from cache, fetching and caching fresh data if needed.
+        
+        Args:
+            symbol: Validated stock symbol
+            period: Validated time period
+            pending_writes: If given, fresh data is queued on its 'stock_data'
+                list instead of being written immediately
+            now: Wall-clock time for the cache freshness check
+            
+        Returns:
+            DataFrame with OHLCV data
+        """
+        # Try to get cached data
+        data = self.cache.get_stock_data(symbol, period, self.config.cache_hours, now=now)
+        
+        # Fetch fresh data if needed
+        if data is None:
+            self.logger.info(f"Fetching fresh data for {symbol}")
+            data = self.data_provider.fetch_stock_data(symbol, period)
+            if pending_writes is None:
+                self.cache.set_stock_data(symbol, period, data)
+            else:
+                pending_writes['stock_data'].append((symbol, period, data))
+        else:
+            self.logger.info(f"Using cached data for {symbol}")
+        
+        return data
+    
+    def _get_indicators(self, symbol: str, period: str, data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Calculate indicators, reusing the previous result if the data is unchanged.
+        
+        The key covers the period and row count as well as the last bar's
+        timestamp and close, since the live bar's price moves intraday
+        without a new timestamp.
+        
+        Args:
+            symbol: Validated stock symbol
+            period: Validated time period
+            data: DataFrame with OHLCV data
+            
+        Returns:
+            Dictionary of calculated indicators (a copy, so callers may mutate it)
+        """
+        key = (symbol, period, len(data), data.index[-1].value, float(data['Close'].iloc[-1]))
+        
+        with self._indicator_lock:
+            indicators = self._indicator_cache.get(key)
+            if indicators is not None:
+                self._indicator_cache.move_to_end(key)
+                return dict(indicators)
+        
+        # Calculated outside the lock so other sessions are not held up
+        indicators = self.calculator.calculate_indicators(data)
+        with self._indicator_lock:
+            self._indicator_cache[key] = indicators
+            self._indicator_cache.move_to_end(key)
+            if len(self._indicator_cache) > self.indicator_cache_size:
+                self._indicator_cache.popitem(last=False)
+        
+        return dict(indicators)
+    
+    def _build_market_data(self, symbol: str, period: str, data: pd.DataFrame,
+                           indicators: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Assemble the market data dictionary shared by the sync and async paths.
+        
+        Args:
+            symbol: Validated stock symbol
+            period: Validated time period
+            data: DataFrame with OHLCV data
+            indicators: Calculated technical indicators
+            
+        Returns:
+            Dictionary containing symbol, period, data, indicators, series, and last_updated
+        """
+        return {
+            'symbol': symbol,
+            'period': period,
+            'data': data,
+            'indicators': indicators,
+            'series': self.calculator.calculate_indicator_series(data),
+            'last_updated': data.index[-1].strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    def _build_analysis(self, symbol: str, period: str, data: pd.DataFrame,
+                        indicators: Dict[str, Any], commentary: str) -> Dict[str, Any]:
+        """
+        Assemble the analysis result dictionary.
+        
+        Args:
+            symbol: Validated stock symbol
+            period: Validated time period
+            data: DataFrame with OHLCV data
+            indicators: Calculated technical indicators
+            commentary: AI or fallback commentary
+            
+        Returns:
+            Same dictionary as get_stock_analysis
+        """
+        return {**self._build_market_data(symbol, period, data, indicators), 'commentary': commentary}
+    
     def validate_symbol_quick(self, symbol: str) -> bool:
         """
         Quick symbol validation for UI.
@@ -118,22 +456,14 @@ class StockDashboard:
         except Exception:
             return False
     
-    def get_popular_symbols(self) -> List[Dict[str, str]]:
+    def get_popular_symbols(self) -> Tuple[Mapping[str, str], ...]:
         """
         Get list of popular symbols for UI.
         
         Returns:
-            List of dictionaries with 'symbol' and 'name' keys
-        """
-        return [
-            {'symbol': 'AAPL', 'name': 'Apple Inc.'},
-            {'symbol': 'GOOGL', 'name': 'Alphabet Inc.'},
-            {'symbol': 'MSFT', 'name': 'Microsoft Corp.'},
-            {'symbol': 'TSLA', 'name': 'Tesla Inc.'},
-            {'symbol': 'AMZN', 'name': 'Amazon.com Inc.'},
-            {'symbol': 'NVDA', 'name': 'NVIDIA Corp.'},
-            {'symbol': 'META', 'name': 'Meta Platforms Inc.'}
-        ]
+            Immutable sequence of read-only mappings with 'symbol' and 'name' keys
+        """
+        return self._POPULAR
     
     def _validate_symbol(self, symbol: str) -> str:
         """
@@ -155,7 +485,7 @@ class StockDashboard:
         symbol = symbol.strip().upper()
         
         # Basic validation - alphanumeric, dots allowed for some symbols
-        if not re.match(r'^[A-Z0-9\.-]+$', symbol):
+        if not symbol or not SYMBOL_CHARS.issuperset(symbol):
             raise ValueError(f"Invalid symbol format: {symbol}")
         
         # Length check
@@ -177,14 +507,12 @@ class StockDashboard:
         Raises:
             ValueError: If period is invalid
         """
-        valid_periods = ['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max']
-        
         if not period or not isinstance(period, str):
             raise ValueError("Period must be a non-empty string")
         
         period = period.lower().strip()
         
-        if period not in valid_periods:
-            raise ValueError(f"Invalid period: {period}. Valid periods: {valid_periods}")
+        if period not in _VALID_PERIOD_SET:
+            raise ValueError(f"Invalid period: {period}. Valid periods: {list(VALID_PERIODS)}")
         
         return period
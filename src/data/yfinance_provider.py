@@ -5,30 +5,86 @@ Provides stock data fetching functionality using the yfinance library
 with rate limiting and validation capabilities.
 """
 
+import functools
+import re
+import time
+import numpy as np
 import yfinance as yf
 import pandas as pd
-import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ..utils.rate_limiter import TokenBucket
+
+
+# Symbols fetched concurrently per rate-limit token in fetch_many
+DOWNLOAD_CHUNK_SIZE = 20
+
+# Corporate-action columns added by Ticker.history that the dashboard never reads
+_ACTION_COLUMNS = ['Dividends', 'Stock Splits', 'Capital Gains']
+
+# Uppercase letters, digits and dots (e.g. BRK.A), at most 5 characters
+_SYMBOL_RE = re.compile(r"[A-Z0-9.]{1,5}")
+
+
+@functools.lru_cache(maxsize=256)
+def _clean_symbol_cached(symbol: str) -> str:
+    """
+    Normalize and validate a raw symbol string.
+    
+    Memoized because the same few symbols are cleaned on every rerun.
+    Invalid symbols raise, and exceptions are never cached.
+    
+    Args:
+        symbol: Raw symbol string
+    
+    Returns:
+        Cleaned symbol in uppercase
+    
+    Raises:
+        ValueError: If symbol format is invalid
+    """
+    # Clean and validate charset and length in a single match
+    cleaned = symbol.upper().strip()
+    
+    if _SYMBOL_RE.fullmatch(cleaned):
+        return cleaned
+    
+    # Work out which rule failed only on the error path
+    if not cleaned:
+        raise ValueError("Symbol cannot be empty")
+    
+    if len(cleaned) > 5:
+        raise ValueError(f"Symbol too long: {cleaned} (max 5 characters)")
+    
+    raise ValueError(f"Invalid symbol format: {cleaned}")
 
 
 class YFinanceProvider:
     """
-    Simple Yahoo Finance data provider with basic rate limiting.
+    Simple Yahoo Finance data provider with token-bucket rate limiting.
     
     This class provides methods to fetch historical stock data and validate
-    stock symbols using the yfinance library. It includes basic rate limiting
-    to avoid overwhelming the Yahoo Finance API.
+    stock symbols using the yfinance library. Calls are rate limited to avoid
+    overwhelming the Yahoo Finance API, while short bursts (such as a validate
+    followed by a fetch) proceed without waiting.
     """
     
-    def __init__(self, min_interval: float = 1.0):
+    def __init__(self, min_interval: float = 1.0, burst: int = 5):
         """
         Initialize the YFinanceProvider.
         
         Args:
-            min_interval: Minimum interval in seconds between API calls (default: 1.0)
+            min_interval: Sustained interval in seconds between API calls (default: 1.0)
+            burst: Number of calls allowed back-to-back before waiting (default: 5)
         """
-        self.last_call_time = 0
         self.min_interval = min_interval
+        self.rate_limiter = TokenBucket(rate=1.0 / min_interval, capacity=burst)
+        
+        # Symbols known to be valid, mapped to when that was last confirmed
+        self.valid_ttl = 600.0
+        self._valid_cache: Dict[str, float] = {}
     
     def fetch_stock_data(self, symbol: str, period: str) -> pd.DataFrame:
         """
@@ -40,35 +96,130 @@ class YFinanceProvider:
         
         Returns:
             DataFrame containing historical stock data with columns:
-            Open, High, Low, Close, Volume, Dividends, Stock Splits
+            Open, High, Low, Close, Volume
         
         Raises:
             ValueError: If symbol is invalid, no data found, or insufficient data
         """
+        # Validate and clean symbol before spending a rate-limit token
+        symbol = self._clean_symbol(symbol)
+        
         # Apply rate limiting
         self._apply_rate_limiting()
         
-        # Validate and clean symbol
-        symbol = self._clean_symbol(symbol)
+        return self._fetch_history(symbol, period)
+    
+    def _fetch_history(self, symbol: str, period: str) -> pd.DataFrame:
+        """
+        Download and check one cleaned symbol's history without rate limiting.
+        
+        Shared by fetch_stock_data and fetch_many so both return frames of the
+        same shape (exchange timezone, integer Volume, no action columns).
+        
+        Args:
+            symbol: Cleaned stock symbol
+            period: Time period
         
+        Returns:
+            DataFrame with Open, High, Low, Close, Volume columns
+        
+        Raises:
+            ValueError: If the fetch fails, no data is found, or data is insufficient
+        """
+        # Only the network call is guarded; our own checks below raise directly
         try:
-            # Fetch data from Yahoo Finance
             ticker = yf.Ticker(symbol)
             data = ticker.history(period=period)
-            
-            if data.empty:
-                raise ValueError(f"No data found for symbol: {symbol}")
-            
-            # Validate data quality
-            if len(data) < 5:  # Need minimum data for indicators
-                raise ValueError(f"Insufficient data for {symbol}: only {len(data)} days available")
-            
-            return data
-            
+        except ValueError:
+            raise
         except Exception as e:
-            if isinstance(e, ValueError):
-                raise  # Re-raise our custom ValueError messages
-            raise ValueError(f"Failed to fetch data for {symbol}: {str(e)}")
+            raise ValueError(f"Failed to fetch data for {symbol}: {str(e)}") from e
+        
+        rows = len(data.index)
+        if rows == 0:
+            raise ValueError(f"No data found for symbol: {symbol}")
+        
+        # Validate data quality
+        if rows < 5:  # Need minimum data for indicators
+            raise ValueError(f"Insufficient data for {symbol}: only {rows} days available")
+        
+        self._mark_valid(symbol)
+        
+        # Drop unused action columns so caches and copies stay small
+        data = data.drop(columns=_ACTION_COLUMNS, errors='ignore')
+        return self._ensure_contiguous_columns(data)
+    
+    def fetch_many(self, symbols: List[str], period: str) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch stock data for several symbols, a chunk at a time.
+        
+        Yahoo's chart endpoint serves one symbol per request, so the
+        DOWNLOAD_CHUNK_SIZE symbols of a chunk are fetched concurrently and the
+        rate limit is paid once per chunk rather than once per symbol. Each
+        symbol goes through the same history path as fetch_stock_data, so the
+        frames are identical to single-symbol fetches and can share its cache
+        entries (yf.download would strip timezones and turn Volume into floats).
+        
+        Args:
+            symbols: Stock symbols to fetch
+            period: Time period (e.g., "1d", "5d", "1mo", "3mo", "6mo", "1y")
+        
+        Returns:
+            Dictionary mapping each cleaned symbol to its DataFrame. Symbols that
+            fail to fetch, have no data or have fewer than 5 rows are omitted.
+        
+        Raises:
+            ValueError: If any symbol is invalid
+        """
+        # Validate and clean every symbol up front, dropping duplicates
+        cleaned = list(dict.fromkeys(self._clean_symbol(symbol) for symbol in symbols))
+        
+        results: Dict[str, pd.DataFrame] = {}
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_CHUNK_SIZE) as pool:
+            for chunk in self._chunks(cleaned, DOWNLOAD_CHUNK_SIZE):
+                self._apply_rate_limiting()
+                
+                for symbol, frame in zip(chunk, pool.map(self._try_fetch_history, chunk, repeat(period))):
+                    if frame is not None:
+                        results[symbol] = frame
+        
+        return results
+    
+    def _try_fetch_history(self, symbol: str, period: str) -> Optional[pd.DataFrame]:
+        """Fetch one symbol's history for fetch_many, returning None if unavailable"""
+        try:
+            return self._fetch_history(symbol, period)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+        """Yield successive lists of at most size items"""
+        iterator = iter(items)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
+    
+    @staticmethod
+    def _ensure_contiguous_columns(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Make every numeric column contiguous in memory.
+        
+        Indicator kernels scan one column at a time; a column backed by a
+        strided view of a row-major array is copied once here instead of
+        being re-strided on every pass. Frames that are already contiguous
+        (the common case) are returned unchanged.
+        
+        Args:
+            data: DataFrame with stock data
+        
+        Returns:
+            DataFrame whose numeric columns are C-contiguous
+        """
+        for column in data.columns:
+            values = data[column].to_numpy(copy=False)
+            if values.dtype.kind in 'biuf' and not values.flags['C_CONTIGUOUS']:
+                data[column] = np.ascontiguousarray(values)
+        return data
     
     def validate_symbol(self, symbol: str) -> bool:
         """
@@ -84,29 +235,39 @@ class YFinanceProvider:
             # Basic format validation
             symbol = self._clean_symbol(symbol)
             
+            # Recently fetched or validated symbols need no network call
+            confirmed_at = self._valid_cache.get(symbol)
+            if confirmed_at is not None and time.monotonic() - confirmed_at < self.valid_ttl:
+                return True
+            
             # Apply rate limiting
             self._apply_rate_limiting()
             
             # Try to fetch just one day of data for validation
             ticker = yf.Ticker(symbol)
             data = ticker.history(period="1d")
-            return not data.empty
+            if data.empty:
+                return False
+            
+            self._mark_valid(symbol)
+            return True
             
         except Exception:
             # Any exception during validation means invalid symbol
             return False
     
+    def _mark_valid(self, symbol: str) -> None:
+        """Record that a cleaned symbol just returned data."""
+        self._valid_cache[symbol] = time.monotonic()
+    
     def _apply_rate_limiting(self) -> None:
         """
         Apply rate limiting to prevent overwhelming the API.
         
-        Ensures minimum interval between consecutive API calls.
+        Blocks only once the burst allowance is spent, then spaces calls
+        min_interval apart on average.
         """
-        elapsed = time.time() - self.last_call_time
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        
-        self.last_call_time = time.time()
+        self.rate_limiter.acquire()
     
     def _clean_symbol(self, symbol: str) -> str:
         """
@@ -121,20 +282,8 @@ class YFinanceProvider:
         Raises:
             ValueError: If symbol format is invalid
         """
+        # Type check first: unhashable inputs cannot reach the cache
         if not symbol or not isinstance(symbol, str):
             raise ValueError("Symbol must be a non-empty string")
         
-        # Clean and validate
-        cleaned = symbol.upper().strip()
-        
-        if not cleaned:
-            raise ValueError("Symbol cannot be empty")
-        
-        if len(cleaned) > 5:
-            raise ValueError(f"Symbol too long: {cleaned} (max 5 characters)")
-        
-        # Basic alphanumeric validation (allow dots for some symbols like BRK.A)
-        if not all(c.isalnum() or c == '.' for c in cleaned):
-            raise ValueError(f"Invalid symbol format: {cleaned}")
-        
-        return cleaned
+        return _clean_symbol_cached(symbol)
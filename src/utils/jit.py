@@ -0,0 +1,31 @@
+"""
+JIT Compilation Helpers
+
+Optional numba support for numeric kernels. When numba is installed, njit
+compiles the decorated function to machine code; otherwise it is a no-op
+decorator and the kernel runs as plain Python.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """
+    Compile a function with numba.njit if available, else return it unchanged.
+
+    Supports both bare (@njit) and parameterized (@njit(cache=True)) usage.
+    """
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func):
+        return func
+    return decorator
@@ -0,0 +1,86 @@
+"""
+Rate Limiter Module
+
+Provides a thread-safe token-bucket rate limiter shared by the API clients.
+Tokens refill continuously at a fixed rate up to a burst capacity, so callers
+only wait when the quota is actually exhausted.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter with optional adaptive rate control.
+
+    Each acquire consumes one token. When the bucket is empty the caller
+    reserves the next token and waits until it has been refilled, which keeps
+    concurrent callers correctly spaced without holding the lock while sleeping.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, min_rate: Optional[float] = None,
+                 rate_step: Optional[float] = None):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Refill rate in tokens per second
+            capacity: Maximum number of tokens (burst size, default: 1.0)
+            min_rate: Lower bound for decrease_rate (default: rate / 8)
+            rate_step: Amount added by increase_rate (default: rate / 10)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 8
+        self.rate_step = rate_step if rate_step is not None else rate / 10
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Consume one token, reserving it ahead of time if none is available.
+
+        Returns:
+            Seconds the caller must wait before proceeding (0.0 if none)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def decrease_rate(self) -> None:
+        """Halve the refill rate after the server reports throttling."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def increase_rate(self) -> None:
+        """Additively restore the refill rate after a successful call."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.rate_step)
@@ -7,29 +7,41 @@ and backend integration.
 """
 
 import streamlit as st
+import html
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the parent directory to the Python path for package imports
-parent_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
-sys.path.append(parent_path)
+# Add the parent directory to the Python path for package imports. Streamlit
+# re-executes this script on every rerun, so only add it once per process.
+PARENT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PARENT_PATH not in sys.path:
+    sys.path.append(PARENT_PATH)
 
 from utils.session import initialize_session
 from components.sidebar import render_controls, get_display_preferences
-from components.charts import render_price_chart, render_indicators_chart, render_rsi_gauge, render_trend_indicator
+from components.charts import (
+    render_price_chart, render_indicators_chart, render_rsi_gauge, render_trend_indicator,
+    build_price_chart_figure, build_indicators_chart_figure, build_rsi_gauge_figure, chart_series
+)
 from components.display import (
     render_ai_commentary, render_analysis_summary, render_last_updated_timestamp,
     apply_mobile_responsive_layout, show_mobile_navigation_hint
 )
 from components.metrics import render_key_metrics, render_price_metrics
 from components.errors import handle_analysis_error, show_no_data_message
-from src.dashboard import StockDashboard
-from config.ui_config import PERFORMANCE
+from config.ui_config import PERFORMANCE, POPULAR_STOCKS, COLORS
 
 
 @st.cache_resource
 def get_dashboard_instance():
     """Get a cached instance of the StockDashboard."""
+    # Imported here so the backend's OpenAI/yfinance import cost is paid after
+    # set_page_config, behind the initialization spinner, instead of before
+    # the first paint
+    from src.dashboard import StockDashboard
+    
     try:
         return StockDashboard()
     except Exception as e:
@@ -37,6 +49,72 @@ def get_dashboard_instance():
         st.stop()
 
 
+@st.cache_resource(ttl=PERFORMANCE['cache_ttl'], show_spinner=False)
+def start_popular_stocks_preload(_dashboard, period):
+    """
+    Warm the backend cache for every popular stock on a background thread.
+    
+    Cached per period, so the batch starts at most once per cache_ttl across
+    all sessions, and the script never waits for it.
+    
+    Args:
+        _dashboard: StockDashboard instance (excluded from the cache key)
+        period: Time period to preload
+    
+    Returns:
+        threading.Thread: The daemon thread running the preload
+    """
+    symbols = [symbol for group in POPULAR_STOCKS.values() for symbol in group]
+    
+    def preload():
+        try:
+            _dashboard.preload_stock_data(symbols, period)
+        except Exception:
+            # Preloading is an optimization; analyses fall back to per-symbol fetches
+            pass
+    
+    thread = threading.Thread(target=preload, name=f"preload-popular-{period}", daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_data(ttl=PERFORMANCE['cache_ttl'], show_spinner=False)
+def load_market_data(_dashboard, symbol, period):
+    """
+    Load price data and indicators, cached per (symbol, period).
+    
+    Language and display toggles rerun the script without changing these
+    arguments, so they are served from this cache instead of refetching.
+    
+    Args:
+        _dashboard: StockDashboard instance (excluded from the cache key)
+        symbol: Stock symbol
+        period: Time period
+    
+    Returns:
+        dict: Symbol, period, data, indicators and last_updated
+    """
+    return _dashboard.get_market_data(symbol, period)
+
+
+@st.cache_data(ttl=PERFORMANCE['cache_ttl'], show_spinner=False)
+def load_commentary(_dashboard, symbol, period, indicators, language):
+    """
+    Load AI commentary, cached per (symbol, period, indicators, language).
+    
+    Args:
+        _dashboard: StockDashboard instance (excluded from the cache key)
+        symbol: Stock symbol
+        period: Time period
+        indicators: Indicators returned by load_market_data
+        language: Language preference
+    
+    Returns:
+        str: Commentary text
+    """
+    return _dashboard.get_commentary(symbol, period, indicators, language)
+
+
 def render_analysis(dashboard, symbol, period, language):
     """
     Render the complete stock analysis with loading indicators and enhanced UI.
@@ -48,21 +126,14 @@ def render_analysis(dashboard, symbol, period, language):
         language: Language preference
     """
     try:
-        # Show loading spinner with custom messages
-        loading_messages = [
-            f"🔍 Fetching {symbol} data...",
-            "📊 Calculating technical indicators...",
-            "🤖 Generating AI commentary...",
-            "✨ Finalizing analysis..."
-        ]
-        
         # Get analysis data with enhanced loading feedback
         with st.spinner("🔄 Analyzing stock data..."):
-            # Add a small delay to show spinner for better UX
-            import time
-            time.sleep(PERFORMANCE.get('spinner_delay', 0.5))
-            
-            analysis = dashboard.get_stock_analysis(symbol, period, language)
+            market_data = load_market_data(dashboard, symbol, period)
+            commentary = load_commentary(
+                dashboard, market_data['symbol'], market_data['period'],
+                market_data['indicators'], language
+            )
+            analysis = {**market_data, 'commentary': commentary}
         
         # Get display preferences
         display_prefs = get_display_preferences()
@@ -75,8 +146,8 @@ def render_analysis(dashboard, symbol, period, language):
         indicators = analysis.get('indicators', {})
         commentary = analysis.get('commentary', '')
         
-        # Check if we have valid data
-        if stock_data is None or stock_data.empty:
+        # Check once that we have data; the layouts below rely on it
+        if stock_data is None or len(stock_data.index) == 0:
             st.warning("⚠️ No data available for the selected symbol and period.")
             return
         
@@ -89,116 +160,212 @@ def render_analysis(dashboard, symbol, period, language):
         
         # Create responsive layout
         # On mobile, stack vertically; on desktop, use columns
-        is_mobile = st.session_state.get('is_mobile', False)
-        
-        if is_mobile:
-            # Mobile layout - vertical stacking
-            render_mobile_layout(stock_data, indicators, commentary, analysis, display_prefs)
-        else:
-            # Desktop layout - columns
-            render_desktop_layout(stock_data, indicators, commentary, analysis, display_prefs)
+        layout = MOBILE_LAYOUT if st.session_state.get('is_mobile', False) else DESKTOP_LAYOUT
+        render_layout(layout, stock_data, indicators, commentary, analysis, display_prefs)
         
     except Exception as e:
         handle_analysis_error(e, symbol)
 
 
-def render_desktop_layout(stock_data, indicators, commentary, analysis, display_prefs):
-    """Render desktop layout with columns based on display preferences."""
-    # Create main layout with two columns
-    col1, col2 = st.columns([2, 1])
+def build_chart_figures(stock_data, indicators, display_prefs, series=None):
+    """
+    Build the enabled Plotly figures concurrently on worker threads.
     
-    # Left column - Charts
-    with col1:
-        # Price Charts section
-        if display_prefs.get('show_price_charts', True):
-            st.markdown("### 📊 Price Analysis")
-            with st.spinner("📈 Rendering price chart..."):
-                render_price_chart(stock_data, indicators)
-        
-        # Technical Indicators Chart section
-        if display_prefs.get('show_technical_indicators', True) and indicators and 'rsi' in indicators:
-            st.markdown("### 📉 Technical Indicators")
-            with st.spinner("📊 Rendering technical indicators..."):
-                render_indicators_chart(indicators, stock_data)
-    
-    # Right column - Metrics and Commentary
-    with col2:
-        # Technical Indicators - RSI Gauge
-        if display_prefs.get('show_technical_indicators', True) and indicators and 'rsi' in indicators:
-            st.markdown("### ⚖️ RSI Gauge")
-            render_rsi_gauge(indicators['rsi'])
-            st.markdown("---")
+    Only figure construction runs off the main thread; rendering with
+    st.plotly_chart, and any st.cache_data series fallback, stay on the
+    script thread.
+    
+    Args:
+        stock_data: Non-empty DataFrame with OHLCV data
+        indicators: Dictionary of technical indicators
+        display_prefs: Display preference flags
+        series: Precomputed indicator series from get_market_data (optional)
+    
+    Returns:
+        dict: Figure per chart name ('price', 'indicators', 'rsi_gauge'). A chart
+        that failed to build maps to None so its renderer rebuilds it and shows
+        the error inline.
+    """
+    show_price = display_prefs.get('show_price_charts', True)
+    show_indicators = (display_prefs.get('show_technical_indicators', True)
+                       and indicators and indicators.get('rsi') is not None)
+    if not (show_price or show_indicators):
+        return {}
+    
+    if series is None:
+        series = chart_series(stock_data)
+    
+    jobs = {}
+    if show_price:
+        jobs['price'] = (build_price_chart_figure, stock_data, indicators, series)
+    if show_indicators:
+        jobs['indicators'] = (build_indicators_chart_figure, indicators, stock_data, series)
+        jobs['rsi_gauge'] = (build_rsi_gauge_figure, indicators['rsi'])
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {name: executor.submit(builder, *args) for name, (builder, *args) in jobs.items()}
+    
+    figures = {}
+    for name, future in futures.items():
+        try:
+            figures[name] = future.result()
+        except Exception:
+            figures[name] = None
+    return figures
+
+
+# Analysis sections: heading, display preference that enables it, extra
+# requirement on the data, and renderer. Renderers take the shared context
+# built by render_layout.
+SECTIONS = {
+    'price_chart': (
+        "### 📊 Price Analysis", 'show_price_charts', None,
+        lambda ctx: render_price_chart(ctx['stock_data'], ctx['indicators'],
+                                       fig=ctx['figures'].get('price'), series=ctx['series'])
+    ),
+    'indicators_chart': (
+        "### 📉 Technical Indicators", 'show_technical_indicators', 'rsi',
+        lambda ctx: render_indicators_chart(ctx['indicators'], ctx['stock_data'],
+                                            fig=ctx['figures'].get('indicators'),
+                                            series=ctx['series'])
+    ),
+    'rsi_gauge': (
+        "### ⚖️ RSI Gauge", 'show_technical_indicators', 'rsi',
+        lambda ctx: render_rsi_gauge(ctx['indicators']['rsi'],
+                                     fig=ctx['figures'].get('rsi_gauge'))
+    ),
+    'key_metrics': (
+        "### 📊 Key Metrics", 'show_metrics_analysis', None,
+        lambda ctx: render_key_metrics(ctx['indicators'], show_title=False)
+    ),
+    'price_metrics': (
+        "### 💰 Price Metrics", 'show_metrics_analysis', None,
+        lambda ctx: render_price_metrics(ctx['stock_data'], show_title=False)
+    ),
+    'ai_commentary': (
+        "### 🤖 AI Analysis", 'show_ai_commentary', 'commentary',
+        lambda ctx: render_ai_commentary(ctx['commentary'], show_title=False)
+    ),
+    'summary': (
+        None, 'show_technical_summary', None,
+        lambda ctx: render_analysis_summary(ctx['analysis'])
+    ),
+}
+
+# Layouts are rows of (column widths or None for full width, columns). Each
+# column lists (section name, divider) where divider is 'before', 'after' or None.
+DESKTOP_LAYOUT = (
+    ([2, 1], (
+        (('price_chart', None), ('indicators_chart', None)),
+        (('rsi_gauge', 'after'), ('key_metrics', 'after'), ('price_metrics', 'after'),
+         ('ai_commentary', 'after')),
+    )),
+    (None, (
+        (('summary', None),),
+    )),
+)
+
+MOBILE_LAYOUT = (
+    (None, (
+        (('rsi_gauge', 'after'), ('key_metrics', 'after'), ('price_chart', None),
+         ('indicators_chart', None), ('price_metrics', None), ('ai_commentary', None),
+         ('summary', 'before')),
+    )),
+)
+
+
+def _section_enabled(name, context, display_prefs):
+    """Check a section's display preference and data requirement."""
+    _, pref_key, requires, _ = SECTIONS[name]
+    if not display_prefs.get(pref_key, True):
+        return False
+    if requires == 'rsi':
+        return bool(context['indicators']) and 'rsi' in context['indicators']
+    if requires == 'commentary':
+        return bool(context['commentary'])
+    return True
+
+
+def _render_column(items, context, display_prefs):
+    """Render one column's sections in order, skipping disabled ones."""
+    for name, divider in items:
+        if not _section_enabled(name, context, display_prefs):
+            continue
         
-        # Metrics & Analysis section
-        if display_prefs.get('show_metrics_analysis', True):
-            st.markdown("### 📊 Key Metrics")
-            render_key_metrics(indicators, show_title=False)
-            
+        title, _, _, render = SECTIONS[name]
+        if divider == 'before':
             st.markdown("---")
-            
-            # Additional price metrics
-            if stock_data is not None and not stock_data.empty:
-                st.markdown("### 💰 Price Metrics")
-                render_price_metrics(stock_data, show_title=False)
-                st.markdown("---")
-        
-        # AI Commentary section
-        if display_prefs.get('show_ai_commentary', True) and commentary:
-            st.markdown("### 🤖 AI Analysis")
-            render_ai_commentary(commentary, show_title=False)
+        if title:
+            st.markdown(title)
+        render(context)
+        if divider == 'after':
             st.markdown("---")
-    
-    # Full-width sections at the bottom
-    # Technical Summary section
-    if display_prefs.get('show_technical_summary', True):
-        with st.spinner("📋 Preparing analysis summary..."):
-            render_analysis_summary(analysis)
 
 
-def render_mobile_layout(stock_data, indicators, commentary, analysis, display_prefs):
-    """Render mobile-friendly vertical layout based on display preferences."""
+def render_layout(layout, stock_data, indicators, commentary, analysis, display_prefs):
+    """
+    Render the analysis sections in the given layout.
     
-    # Technical Indicators - RSI Gauge first (if available and enabled)
-    if display_prefs.get('show_technical_indicators', True) and indicators and 'rsi' in indicators:
-        st.markdown("### ⚖️ RSI Gauge")
-        render_rsi_gauge(indicators['rsi'])
-        st.markdown("---")
+    Expects non-empty stock_data; render_analysis checks this before calling.
     
-    # Metrics & Analysis section
-    if display_prefs.get('show_metrics_analysis', True):
-        st.markdown("### 📊 Key Metrics")
-        render_key_metrics(indicators, show_title=False)
-        st.markdown("---")
+    Args:
+        layout: DESKTOP_LAYOUT or MOBILE_LAYOUT
+        stock_data: DataFrame with OHLCV data
+        indicators: Dictionary of technical indicators
+        commentary: AI commentary text
+        analysis: Full analysis dictionary
+        display_prefs: Display preference flags
+    """
+    series = analysis.get('series')
+    with st.spinner("📈 Rendering charts..."):
+        figures = build_chart_figures(stock_data, indicators, display_prefs, series)
     
-    # Price Charts section
-    if display_prefs.get('show_price_charts', True):
-        st.markdown("### 📊 Price Analysis")
-        with st.spinner("📈 Loading chart..."):
-            render_price_chart(stock_data, indicators)
-    
-    # Technical Indicators Chart section
-    if display_prefs.get('show_technical_indicators', True) and indicators and 'rsi' in indicators:
-        st.markdown("### 📉 Technical Indicators")
-        with st.spinner("📊 Loading indicators..."):
-            render_indicators_chart(indicators, stock_data)
-    
-    # Metrics & Analysis - Price metrics
-    if display_prefs.get('show_metrics_analysis', True) and stock_data is not None and not stock_data.empty:
-        st.markdown("### 💰 Price Metrics")
-        render_price_metrics(stock_data, show_title=False)
-    
-    # AI Commentary section
-    if display_prefs.get('show_ai_commentary', True) and commentary:
-        st.markdown("### 🤖 AI Analysis")
-        render_ai_commentary(commentary, show_title=False)
-        st.markdown("### 🤖 AI Analysis")
-        render_ai_commentary(commentary, show_title=False)
-    
-    # Technical Summary section
-    if display_prefs.get('show_technical_summary', True):
-        st.markdown("---")
-        with st.spinner("📋 Loading summary..."):
-            render_analysis_summary(analysis)
+    context = {
+        'stock_data': stock_data,
+        'indicators': indicators,
+        'series': series,
+        'commentary': commentary,
+        'analysis': analysis,
+        'figures': figures,
+    }
+    
+    for widths, columns in layout:
+        if widths is None:
+            for items in columns:
+                _render_column(items, context, display_prefs)
+            continue
+        
+        for container, items in zip(st.columns(widths), columns):
+            with container:
+                _render_column(items, context, display_prefs)
+
+
+def render_selection_banner(symbol, period, language):
+    """
+    Render the current symbol, period and language in a single markdown element.
+    
+    Args:
+        symbol: Stock symbol
+        period: Time period
+        language: Language preference
+    """
+    box_style = (
+        "flex: 1 1 0; min-width: 150px; padding: 0.75rem 1rem; border-radius: 0.5rem; "
+        f"background-color: {COLORS['light_bg']}; border-left: 4px solid {COLORS['primary']};"
+    )
+    items = (
+        ("📊", "Symbol", symbol),
+        ("⏰", "Period", period.upper()),
+        ("🌐", "Language", 'English' if language == 'en' else 'Swedish'),
+    )
+    boxes = "".join(
+        f"<div style='{box_style}'>{icon} <b>{label}:</b> {html.escape(value)}</div>"
+        for icon, label, value in items
+    )
+    st.markdown(
+        f"<div style='display: flex; flex-wrap: wrap; gap: 12px;'>{boxes}</div>",
+        unsafe_allow_html=True
+    )
 
 
 def render_welcome_screen():
@@ -248,15 +415,8 @@ def main():
     
     # Main content area
     if symbol:
-        # Display current selections with enhanced styling
-        with st.container():
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.info(f"📊 **Symbol:** {symbol}")
-            with col2:
-                st.info(f"⏰ **Period:** {period.upper()}")
-            with col3:
-                st.info(f"🌐 **Language:** {'English' if language == 'en' else 'Swedish'}")
+        # Display current selections as one flex row (a single element per rerun)
+        render_selection_banner(symbol, period, language)
         
         st.markdown("---")
         
@@ -280,6 +440,10 @@ def main():
                 """,
                 unsafe_allow_html=True
             )
+    
+    # Warm the popular-stock cache only after the page has rendered, so the
+    # sidebar buttons load from the cache without delaying the first paint
+    start_popular_stocks_preload(dashboard, period)
 
 
 if __name__ == "__main__":
@@ -8,283 +8,410 @@ using Plotly, including candlestick charts, moving averages, and volume charts.
 import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 from utils.formatters import format_currency, format_volume
-from config.ui_config import COLORS, RSI_LEVELS, TREND_INDICATORS, CHART_CONFIG
+from config.ui_config import COLORS, RSI_LEVELS, TREND_INDICATORS, CHART_CONFIG, PERFORMANCE
 
 
-def render_price_chart(stock_data, indicators):
+# Static layout settings shared by every rerun; only titles and data vary per call
+_COLOR_UP = '#00D4AA'
+_COLOR_DOWN = '#FF6B6B'
+_LINE_SMA_20 = dict(color='#FFA726', width=2)
+_LINE_SMA_50 = dict(color='#AB47BC', width=2)
+_LINE_SERIES = dict(color='#2196F3', width=2)
+_SUBPLOT_TITLES = ('Price & Moving Averages', 'Volume')
+_ROW_WIDTH = (0.7, 0.3)
+
+_TRANSPARENT_BG = dict(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+_GRID = dict(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
+
+_PRICE_LAYOUT = dict(
+    title={'text': "Stock Price Analysis", 'x': 0.5, 'xanchor': 'center', 'font': {'size': 20}},
+    xaxis_rangeslider_visible=False,
+    height=600,
+    showlegend=True,
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    margin=dict(l=0, r=0, t=50, b=0),
+    **_TRANSPARENT_BG
+)
+
+_RSI_LAYOUT = dict(
+    title={'text': "Relative Strength Index (RSI)", 'x': 0.5, 'xanchor': 'center', 'font': {'size': 16}},
+    height=300,
+    xaxis_title="Date",
+    yaxis_title="RSI",
+    yaxis=dict(range=[0, 100]),
+    showlegend=False,
+    margin=dict(l=0, r=0, t=50, b=0),
+    **_TRANSPARENT_BG
+)
+
+_GAUGE_LAYOUT = dict(height=300, margin=dict(l=20, r=20, t=40, b=20), **_TRANSPARENT_BG)
+
+_GAUGE_STEPS = (
+    {'range': [0, RSI_LEVELS['oversold']], 'color': COLORS['success']},
+    {'range': [RSI_LEVELS['oversold'], RSI_LEVELS['overbought']], 'color': COLORS['neutral']},
+    {'range': [RSI_LEVELS['overbought'], 100], 'color': COLORS['danger']}
+)
+
+_PERFORMANCE_LAYOUT = dict(
+    xaxis_title="Date",
+    yaxis_title="Performance (%)",
+    height=300,
+    showlegend=False,
+    margin=dict(l=0, r=0, t=40, b=0),
+    **_TRANSPARENT_BG
+)
+
+
+def _sma_values(close_values, window):
+    """Rolling SMA of close prices; pure, so figure builders may call it off-thread."""
+    # Imported here so numba's import cost is not paid before the first paint
+    from src.analysis.technical_calculator import TechnicalCalculator
+    return TechnicalCalculator.calculate_sma_series(pd.Series(close_values), window).to_numpy()
+
+
+def _rsi_values(close_values, window=14):
+    """Wilder RSI of close prices; pure, so figure builders may call it off-thread."""
+    from src.analysis.technical_calculator import TechnicalCalculator
+    return TechnicalCalculator.calculate_rsi_series(pd.Series(close_values), window=window).to_numpy()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def sma_series_values(close_values, window):
+    """
+    Rolling SMA of close prices, cached across reruns.
+    
+    Keyed on the raw close array rather than the DataFrame, so widget
+    interactions that leave the data unchanged skip the rolling work.
+    Call it on the script thread only; st.cache_data needs its context.
+    
+    Args:
+        close_values (np.ndarray): Close prices
+        window (int): Moving average window
+    
+    Returns:
+        np.ndarray: SMA values aligned with close_values (leading NaNs)
+    """
+    return _sma_values(close_values, window)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def rsi_series_values(close_values, window=14):
+    """
+    Wilder RSI of close prices, cached across reruns.
+    
+    Call it on the script thread only; st.cache_data needs its context.
+    
+    Args:
+        close_values (np.ndarray): Close prices
+        window (int): RSI window (default 14)
+    
+    Returns:
+        np.ndarray: RSI values aligned with close_values (leading NaNs)
+    """
+    return _rsi_values(close_values, window)
+
+
+def chart_series(stock_data):
+    """
+    Compute the SMA/RSI series the chart builders plot, on the script thread.
+    
+    Used when the backend did not precompute them, so the cached helpers run
+    before the figures are built on worker threads.
+    
+    Args:
+        stock_data: DataFrame with OHLCV data
+    
+    Returns:
+        dict: 'sma_20', 'sma_50' and 'rsi' arrays aligned with stock_data
+    """
+    close_values = stock_data['Close'].to_numpy(dtype=np.float64)
+    return {
+        'sma_20': sma_series_values(close_values, 20),
+        'sma_50': sma_series_values(close_values, 50),
+        'rsi': rsi_series_values(close_values, 14),
+    }
+
+
+def render_price_chart(stock_data, indicators, fig=None, key="price_chart", series=None):
     """
     Render an interactive price chart with candlesticks, moving averages, and volume.
     
     Args:
         stock_data: DataFrame with OHLCV data (Open, High, Low, Close, Volume)
         indicators: Dictionary containing technical indicators including SMAs
+        fig: Figure already built by build_price_chart_figure (optional)
+        key: Stable element key so reruns update the existing chart in place
+        series: Precomputed indicator series from get_market_data (optional)
     """
     if stock_data is None or stock_data.empty:
         st.warning("⚠️ No price data available for chart.")
         return
     
     try:
-        # Create subplots with secondary y-axis for volume
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.1,
-            subplot_titles=('Price & Moving Averages', 'Volume'),
-            row_width=[0.7, 0.3]
-        )
-        
-        # Add candlestick chart
-        fig.add_trace(
-            go.Candlestick(
-                x=stock_data.index,
-                open=stock_data['Open'],
-                high=stock_data['High'],
-                low=stock_data['Low'],
-                close=stock_data['Close'],
-                name="Price",
-                increasing_line_color='#00D4AA',
-                decreasing_line_color='#FF6B6B'
-            ),
-            row=1, col=1
-        )
-        
-        # Add moving averages if available
-        # Since backend only returns latest values, we'll calculate the series for plotting
-        close_prices = stock_data['Close']
-        
-        if indicators and 'sma_20' in indicators and indicators['sma_20'] is not None:
-            # Calculate SMA 20 series for plotting
-            sma_20_series = close_prices.rolling(window=20).mean()
-            if not sma_20_series.isna().all():
-                fig.add_trace(
-                    go.Scatter(
-                        x=sma_20_series.index,
-                        y=sma_20_series.values,
-                        mode='lines',
-                        name='SMA 20',
-                        line=dict(color='#FFA726', width=2)
-                    ),
-                    row=1, col=1
-                )
-        
-        if indicators and 'sma_50' in indicators and indicators['sma_50'] is not None:
-            # Calculate SMA 50 series for plotting
-            sma_50_series = close_prices.rolling(window=50).mean()
-            if not sma_50_series.isna().all():
-                fig.add_trace(
-                    go.Scatter(
-                        x=sma_50_series.index,
-                        y=sma_50_series.values,
-                        mode='lines',
-                        name='SMA 50',
-                        line=dict(color='#AB47BC', width=2)
-                    ),
-                    row=1, col=1
-                )
-        
-        # Add volume chart
-        colors = ['#00D4AA' if close >= open_price else '#FF6B6B' 
-                 for close, open_price in zip(stock_data['Close'], stock_data['Open'])]
-        
-        fig.add_trace(
-            go.Bar(
-                x=stock_data.index,
-                y=stock_data['Volume'],
-                name="Volume",
-                marker_color=colors,
-                opacity=0.7
-            ),
-            row=2, col=1
-        )
-        
-        # Update layout
-        fig.update_layout(
-            title={
-                'text': "Stock Price Analysis",
-                'x': 0.5,
-                'xanchor': 'center',
-                'font': {'size': 20}
-            },
-            xaxis_rangeslider_visible=False,
-            height=600,
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            ),
-            margin=dict(l=0, r=0, t=50, b=0),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        # Update x-axis
-        fig.update_xaxes(
-            title_text="Date",
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(128,128,128,0.2)',
-            row=2, col=1
-        )
-        
-        # Update y-axes
-        fig.update_yaxes(
-            title_text="Price ($)",
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(128,128,128,0.2)',
-            row=1, col=1
-        )
-        
-        fig.update_yaxes(
-            title_text="Volume",
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(128,128,128,0.2)',
-            row=2, col=1
-        )
+        if fig is None:
+            fig = build_price_chart_figure(stock_data, indicators, series)
         
         # Display the chart
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key=key)
         
     except Exception as e:
         st.error(f"❌ Error rendering price chart: {str(e)}")
 
 
-def render_indicators_chart(indicators, stock_data=None):
+def downsample_ohlcv(stock_data, max_points):
+    """
+    Aggregate OHLCV rows into at most max_points equal-sized buckets.
+    
+    Each bucket keeps the first open, highest high, lowest low, last close
+    and total volume, so candles still show every extreme. Series that
+    already fit are returned unchanged.
+    
+    Args:
+        stock_data (DataFrame): OHLCV data
+        max_points (int): Maximum number of rows to keep
+    
+    Returns:
+        tuple: (DataFrame indexed by bucket start, np.ndarray of the row
+        position that ends each bucket, or None if nothing was aggregated)
+    """
+    n = len(stock_data.index)
+    if n <= max_points:
+        return stock_data, None
+    
+    step = -(-n // max_points)  # ceil division
+    starts = np.arange(0, n, step)
+    ends = np.minimum(starts + step, n) - 1
+    
+    aggregated = pd.DataFrame({
+        'Open': stock_data['Open'].to_numpy()[starts],
+        'High': np.maximum.reduceat(stock_data['High'].to_numpy(), starts),
+        'Low': np.minimum.reduceat(stock_data['Low'].to_numpy(), starts),
+        'Close': stock_data['Close'].to_numpy()[ends],
+        'Volume': np.add.reduceat(stock_data['Volume'].to_numpy(), starts),
+    }, index=stock_data.index[starts])
+    return aggregated, ends
+
+
+def _indicator_series(series, name, compute, close_values, window):
+    """Return the backend's precomputed series, or compute it from close prices."""
+    if series is not None and series.get(name) is not None:
+        return series[name]
+    return compute(close_values, window)
+
+
+def build_price_chart_figure(stock_data, indicators, series=None):
+    """
+    Build the candlestick, moving average and volume figure without rendering it.
+    
+    Touches no Streamlit state, so it can run on a worker thread. Series longer
+    than PERFORMANCE['max_data_points'] are bucketed so the browser payload is
+    bounded; moving averages are computed at full resolution first.
+    
+    Args:
+        stock_data: DataFrame with OHLCV data (Open, High, Low, Close, Volume)
+        indicators: Dictionary containing technical indicators including SMAs
+        series: Precomputed indicator series from get_market_data (optional)
+    
+    Returns:
+        go.Figure: Price chart figure
+    """
+    close_values = stock_data['Close'].to_numpy(dtype=np.float64)
+    plot_data, bucket_ends = downsample_ohlcv(stock_data, PERFORMANCE['max_data_points'])
+    
+    def line_points(values):
+        # Sample full-resolution values at each bucket's closing row (matching
+        # the candle's close) but plot them at the candle's x, so lines and
+        # candles line up; float32 halves the serialized payload and is ample
+        # precision for a chart line
+        if bucket_ends is None:
+            return stock_data.index, values.astype(np.float32)
+        return plot_data.index, values[bucket_ends].astype(np.float32)
+    
+    # Create subplots with secondary y-axis for volume
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.1,
+        subplot_titles=_SUBPLOT_TITLES,
+        row_width=_ROW_WIDTH
+    )
+    
+    # Add candlestick chart
+    fig.add_trace(
+        go.Candlestick(
+            x=plot_data.index,
+            open=plot_data['Open'],
+            high=plot_data['High'],
+            low=plot_data['Low'],
+            close=plot_data['Close'],
+            name="Price",
+            increasing_line_color=_COLOR_UP,
+            decreasing_line_color=_COLOR_DOWN
+        ),
+        row=1, col=1
+    )
+    
+    # Add moving averages if available, preferring the backend's full series
+    if indicators and 'sma_20' in indicators and indicators['sma_20'] is not None:
+        sma_20_values = _indicator_series(series, 'sma_20', _sma_values, close_values, 20)
+        # The window yields values from index 19 on; no need to scan for NaNs
+        if len(sma_20_values) >= 20:
+            sma_x, sma_y = line_points(sma_20_values)
+            fig.add_trace(
+                go.Scatter(
+                    x=sma_x,
+                    y=sma_y,
+                    mode='lines',
+                    name='SMA 20',
+                    line=_LINE_SMA_20
+                ),
+                row=1, col=1
+            )
+    
+    if indicators and 'sma_50' in indicators and indicators['sma_50'] is not None:
+        sma_50_values = _indicator_series(series, 'sma_50', _sma_values, close_values, 50)
+        if len(sma_50_values) >= 50:
+            sma_x, sma_y = line_points(sma_50_values)
+            fig.add_trace(
+                go.Scatter(
+                    x=sma_x,
+                    y=sma_y,
+                    mode='lines',
+                    name='SMA 50',
+                    line=_LINE_SMA_50
+                ),
+                row=1, col=1
+            )
+    
+    # Add volume chart
+    colors = np.where(plot_data['Close'].to_numpy() >= plot_data['Open'].to_numpy(),
+                      _COLOR_UP, _COLOR_DOWN)
+    
+    fig.add_trace(
+        go.Bar(
+            x=plot_data.index,
+            y=plot_data['Volume'],
+            name="Volume",
+            marker_color=colors,
+            opacity=0.7
+        ),
+        row=2, col=1
+    )
+    
+    # Update layout
+    fig.update_layout(**_PRICE_LAYOUT)
+    
+    # Update axes
+    fig.update_xaxes(title_text="Date", row=2, col=1, **_GRID)
+    fig.update_yaxes(title_text="Price ($)", row=1, col=1, **_GRID)
+    fig.update_yaxes(title_text="Volume", row=2, col=1, **_GRID)
+    
+    return fig
+
+
+def render_indicators_chart(indicators, stock_data=None, fig=None, key="rsi_chart", series=None):
     """
     Render a chart showing technical indicators like RSI.
     
     Args:
         indicators: Dictionary containing technical indicators
         stock_data: DataFrame with stock data (needed for RSI calculation)
+        fig: Figure already built by build_indicators_chart_figure (optional)
+        key: Stable element key so reruns update the existing chart in place
+        series: Precomputed indicator series from get_market_data (optional)
     """
     if not indicators:
         return
     
     try:
-        # Check if we have RSI data to display and stock data to calculate series
-        if 'rsi' in indicators and indicators['rsi'] is not None and stock_data is not None:
-            close_prices = stock_data['Close']
-            
-            # Calculate RSI series for plotting (replicating backend calculation)
-            delta = close_prices.diff()
-            gains = delta.clip(lower=0.0)
-            losses = (-delta).clip(lower=0.0)
-            
-            gain = gains.rolling(window=14).mean()
-            loss = losses.rolling(window=14).mean()
-            
-            # Calculate RSI series
-            rs = gain / loss
-            rsi_series = 100 - (100 / (1 + rs))
-            
-            # Only plot if we have valid data
-            if not rsi_series.isna().all():
-                fig = go.Figure()
-                
-                # Add RSI line
-                fig.add_trace(
-                    go.Scatter(
-                        x=rsi_series.index,
-                        y=rsi_series.values,
-                        mode='lines',
-                        name='RSI',
-                        line=dict(color='#2196F3', width=2)
-                    )
-                )
-                
-                # Add overbought/oversold lines
-                fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
-                fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
-                fig.add_hline(y=50, line_dash="dot", line_color="gray", annotation_text="Neutral (50)")
-                
-                # Update layout
-                fig.update_layout(
-                    title={
-                        'text': "Relative Strength Index (RSI)",
-                        'x': 0.5,
-                        'xanchor': 'center',
-                        'font': {'size': 16}
-                    },
-                    height=300,
-                    xaxis_title="Date",
-                    yaxis_title="RSI",
-                    yaxis=dict(range=[0, 100]),
-                    showlegend=False,
-                    margin=dict(l=0, r=0, t=50, b=0),
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)'
-                )
-                
-                # Update grid
-                fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-                fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
+        if fig is None:
+            fig = build_indicators_chart_figure(indicators, stock_data, series)
+        
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True, key=key)
+        
     except Exception as e:
         st.error(f"❌ Error rendering indicators chart: {str(e)}")
 
 
-def render_rsi_gauge(rsi_value):
+def build_indicators_chart_figure(indicators, stock_data=None, series=None):
+    """
+    Build the RSI line chart without rendering it.
+    
+    Touches no Streamlit state, so it can run on a worker thread.
+    
+    Args:
+        indicators: Dictionary containing technical indicators
+        stock_data: DataFrame with stock data (needed for RSI calculation)
+        series: Precomputed indicator series from get_market_data (optional)
+    
+    Returns:
+        go.Figure or None: RSI figure, or None if there is nothing to plot
+    """
+    # Check if we have RSI data to display and stock data to calculate series
+    if not indicators or indicators.get('rsi') is None or stock_data is None:
+        return None
+    
+    close_values = stock_data['Close'].to_numpy(dtype=np.float64)
+    
+    # The first RSI value needs 14 deltas; shorter data has nothing to plot
+    if len(close_values) <= 14:
+        return None
+    
+    # Wilder RSI series, from the backend when it was precomputed
+    rsi_values = _indicator_series(series, 'rsi', _rsi_values, close_values, 14)
+    
+    fig = go.Figure()
+    
+    # Add RSI line (WebGL, so long histories render in one draw call)
+    fig.add_trace(
+        go.Scattergl(
+            x=stock_data.index,
+            y=rsi_values.astype(np.float32),
+            mode='lines',
+            name='RSI',
+            line=_LINE_SERIES
+        )
+    )
+    
+    # Add overbought/oversold lines
+    fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
+    fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
+    fig.add_hline(y=50, line_dash="dot", line_color="gray", annotation_text="Neutral (50)")
+    
+    # Update layout
+    fig.update_layout(**_RSI_LAYOUT)
+    
+    # Update grid
+    fig.update_xaxes(**_GRID)
+    fig.update_yaxes(**_GRID)
+    
+    return fig
+
+
+def render_rsi_gauge(rsi_value, fig=None, key="rsi_gauge"):
     """
     Render an RSI gauge visualization.
     
     Args:
         rsi_value (float): Current RSI value (0-100)
+        fig: Figure already built by build_rsi_gauge_figure (optional)
+        key: Stable element key so reruns update the existing chart in place
     """
     if rsi_value is None:
         st.warning("⚠️ RSI data not available")
         return
     
     try:
-        # Determine RSI status and color
-        if rsi_value >= RSI_LEVELS['overbought']:
-            status = "Overbought"
-            color = COLORS['danger']
-        elif rsi_value <= RSI_LEVELS['oversold']:
-            status = "Oversold"
-            color = COLORS['success']
-        else:
-            status = "Neutral"
-            color = COLORS['neutral']
+        status, color = _rsi_status(rsi_value)
         
-        # Create gauge chart
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = rsi_value,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': f"RSI: {status}"},
-            delta = {'reference': RSI_LEVELS['neutral']},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': color},
-                'steps': [
-                    {'range': [0, RSI_LEVELS['oversold']], 'color': COLORS['success']},
-                    {'range': [RSI_LEVELS['oversold'], RSI_LEVELS['overbought']], 'color': COLORS['neutral']},
-                    {'range': [RSI_LEVELS['overbought'], 100], 'color': COLORS['danger']}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': rsi_value
-                }
-            }
-        ))
-        
-        fig.update_layout(
-            height=300,
-            margin=dict(l=20, r=20, t=40, b=20),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)'
-        )
+        if fig is None:
+            fig = build_rsi_gauge_figure(rsi_value)
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key=key)
         
         # Add interpretation text
         st.markdown(
@@ -297,6 +424,53 @@ def render_rsi_gauge(rsi_value):
         st.error(f"❌ Error rendering RSI gauge: {str(e)}")
 
 
+def _rsi_status(rsi_value):
+    """Return the (status label, color) for an RSI value."""
+    if rsi_value >= RSI_LEVELS['overbought']:
+        return "Overbought", COLORS['danger']
+    if rsi_value <= RSI_LEVELS['oversold']:
+        return "Oversold", COLORS['success']
+    return "Neutral", COLORS['neutral']
+
+
+def build_rsi_gauge_figure(rsi_value):
+    """
+    Build the RSI gauge figure without rendering it.
+    
+    Touches no Streamlit state, so it can run on a worker thread.
+    
+    Args:
+        rsi_value (float): Current RSI value (0-100)
+    
+    Returns:
+        go.Figure: RSI gauge figure
+    """
+    status, color = _rsi_status(rsi_value)
+    
+    # Create gauge chart
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = rsi_value,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': f"RSI: {status}"},
+        delta = {'reference': RSI_LEVELS['neutral']},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': color},
+            'steps': _GAUGE_STEPS,
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': rsi_value
+            }
+        }
+    ))
+    
+    fig.update_layout(**_GAUGE_LAYOUT)
+    
+    return fig
+
+
 def render_trend_indicator(stock_data, indicators=None):
     """
     Render a trend indicator based on price movement and technical indicators.
@@ -365,10 +539,10 @@ def create_mini_chart(data, title="", height=150):
         
         fig.add_trace(
             go.Scatter(
-                x=list(range(len(data))),
-                y=data,
+                x=np.arange(len(data), dtype=np.int32),
+                y=np.ascontiguousarray(data, dtype=np.float32),
                 mode='lines',
-                line=dict(color='#2196F3', width=2),
+                line=_LINE_SERIES,
                 showlegend=False
             )
         )
@@ -390,59 +564,68 @@ def create_mini_chart(data, title="", height=150):
         return None
 
 
-def create_price_performance_chart(stock_data, period_label):
+def create_price_performance_chart(stock_data, period_label, key="perf_chart"):
     """
     Create a performance chart showing price movement over time.
     
     Args:
         stock_data (DataFrame): Stock price data
         period_label (str): Time period label for the chart
+        key (str): Stable element key so reruns update the existing chart in place
     """
     if stock_data is None or stock_data.empty:
         return
     
     try:
-        # Calculate percentage change from start
-        start_price = stock_data['Close'].iloc[0]
-        performance = ((stock_data['Close'] - start_price) / start_price * 100)
-        
-        fig = go.Figure()
-        
-        # Determine color based on overall performance
-        final_performance = performance.iloc[-1]
-        line_color = COLORS['success'] if final_performance >= 0 else COLORS['danger']
-        
-        fig.add_trace(
-            go.Scatter(
-                x=stock_data.index,
-                y=performance,
-                mode='lines',
-                line=dict(color=line_color, width=3),
-                fill='tonexty' if final_performance >= 0 else 'tozeroy',
-                fillcolor=f"{line_color}20",
-                name=f"Performance ({period_label})"
-            )
-        )
-        
-        # Add zero line
-        fig.add_hline(y=0, line_dash="dash", line_color=COLORS['neutral'])
-        
-        fig.update_layout(
-            title=f"Price Performance - {period_label}",
-            xaxis_title="Date",
-            yaxis_title="Performance (%)",
-            height=300,
-            showlegend=False,
-            margin=dict(l=0, r=0, t=40, b=0),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        # Update grid
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor=COLORS['grid'])
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor=COLORS['grid'])
-        
-        st.plotly_chart(fig, use_container_width=True)
+        fig = build_price_performance_figure(stock_data, period_label)
+        st.plotly_chart(fig, use_container_width=True, key=key)
         
     except Exception as e:
         st.error(f"❌ Error creating performance chart: {str(e)}")
+
+
+def build_price_performance_figure(stock_data, period_label):
+    """
+    Build the price performance figure without rendering it.
+    
+    Touches no Streamlit state, so it can run on a worker thread.
+    
+    Args:
+        stock_data (DataFrame): Non-empty stock price data
+        period_label (str): Time period label for the chart
+    
+    Returns:
+        go.Figure: Performance figure
+    """
+    # Calculate percentage change from start on the raw close array
+    close_values = stock_data['Close'].to_numpy(dtype=np.float64)
+    performance = (close_values - close_values[0]) * (100.0 / close_values[0])
+    
+    fig = go.Figure()
+    
+    # Determine color based on overall performance
+    final_performance = performance[-1]
+    line_color = COLORS['success'] if final_performance >= 0 else COLORS['danger']
+    
+    fig.add_trace(
+        go.Scattergl(
+            x=stock_data.index,
+            y=performance,
+            mode='lines',
+            line=dict(color=line_color, width=3),
+            fill='tonexty' if final_performance >= 0 else 'tozeroy',
+            fillcolor=f"{line_color}20",
+            name=f"Performance ({period_label})"
+        )
+    )
+    
+    # Add zero line
+    fig.add_hline(y=0, line_dash="dash", line_color=COLORS['neutral'])
+    
+    fig.update_layout(title=f"Price Performance - {period_label}", **_PERFORMANCE_LAYOUT)
+    
+    # Update grid
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor=COLORS['grid'])
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor=COLORS['grid'])
+    
+    return fig
@@ -6,12 +6,22 @@ technical summaries, and other analysis information with mobile responsiveness.
 """
 
 import streamlit as st
+import html
+from bisect import bisect_right
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
+from functools import lru_cache
 from utils.formatters import format_currency, format_percentage, format_number
 from config.ui_config import COLORS, MOBILE_CONFIG
 
 
+_COMMENTARY_OPEN = (
+    '<div style="background-color: #f0f2f6; border-left: 4px solid #1f77b4; '
+    'padding: 1rem; border-radius: 0.5rem; margin: 1rem 0;">'
+)
+
+
 def render_ai_commentary(commentary_text, show_title=True):
     """
     Display AI-generated commentary in a styled block.
@@ -28,25 +38,14 @@ def render_ai_commentary(commentary_text, show_title=True):
         if show_title:
             st.subheader("🤖 AI Market Commentary")
         
-        # Create a styled container for the commentary
+        # Styled container and commentary in one element. The blank lines end
+        # the HTML block so the text inside is still parsed as markdown; the
+        # text is escaped since raw HTML is enabled for the wrapper.
         st.markdown(
-            """
-            <div style="
-                background-color: #f0f2f6;
-                border-left: 4px solid #1f77b4;
-                padding: 1rem;
-                border-radius: 0.5rem;
-                margin: 1rem 0;
-            ">
-            """,
+            f"{_COMMENTARY_OPEN}\n\n{html.escape(commentary_text, quote=False)}\n\n</div>",
             unsafe_allow_html=True
         )
         
-        # Display the commentary text
-        st.markdown(commentary_text)
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-        
         # Add a small disclaimer
         st.caption("💡 This commentary is AI-generated and should not be considered as financial advice.")
         
@@ -68,94 +67,22 @@ def render_technical_summary(indicators):
     try:
         st.subheader("📈 Technical Summary")
         
-        # Prepare data for the summary table
-        summary_data = []
-        
-        # Current Price
-        current_price = indicators.get('current_price')
-        if current_price is not None:
-            summary_data.append({
-                'Indicator': '💰 Current Price',
-                'Value': format_currency(current_price),
-                'Description': 'Latest trading price'
-            })
-        
-        # Moving Averages
-        sma_20 = indicators.get('sma_20')
-        if sma_20 is not None:
-            summary_data.append({
-                'Indicator': '📈 SMA 20',
-                'Value': format_currency(sma_20),
-                'Description': '20-day Simple Moving Average'
-            })
-        
-        sma_50 = indicators.get('sma_50')
-        if sma_50 is not None:
-            summary_data.append({
-                'Indicator': '📊 SMA 50',
-                'Value': format_currency(sma_50),
-                'Description': '50-day Simple Moving Average'
-            })
-        
-        # RSI
-        rsi_current = indicators.get('rsi')
-        if rsi_current is not None:
-            rsi_interpretation = "Neutral"
-            if rsi_current > 70:
-                rsi_interpretation = "Overbought"
-            elif rsi_current < 30:
-                rsi_interpretation = "Oversold"
-            
-            summary_data.append({
-                'Indicator': '📉 RSI',
-                'Value': f"{rsi_current:.1f}",
-                'Description': f'Relative Strength Index ({rsi_interpretation})'
-            })
-        
-        # Trend Analysis
-        trend = indicators.get('trend', 'Unknown')
-        if trend != 'Unknown':
-            trend_icon = '📈' if trend.lower() == 'bullish' else '📉' if trend.lower() == 'bearish' else '➡️'
-            summary_data.append({
-                'Indicator': f'{trend_icon} Trend',
-                'Value': trend.capitalize(),
-                'Description': 'Overall market trend direction'
-            })
-        
-        # Volume Analysis
-        avg_volume = indicators.get('volume_avg')
-        if avg_volume is not None:
-            summary_data.append({
-                'Indicator': '📊 Avg Volume',
-                'Value': format_number(avg_volume, 0),
-                'Description': '20-day average trading volume'
-            })
-        
-        # Price changes
-        price_change_1d = indicators.get('price_change_1d', {})
-        if price_change_1d.get('percent') is not None:
-            change_1d = price_change_1d.get('percent', 0)
-            summary_data.append({
-                'Indicator': '📊 1-Day Change',
-                'Value': f"{change_1d:+.2f}%",
-                'Description': 'Price change from previous day'
-            })
-        
-        price_change_5d = indicators.get('price_change_5d', {})
-        if price_change_5d.get('percent') is not None:
-            change_5d = price_change_5d.get('percent', 0)
-            summary_data.append({
-                'Indicator': '📊 5-Day Change',
-                'Value': f"{change_5d:+.2f}%",
-                'Description': 'Price change over 5 days'
-            })
+        # The table only depends on these scalars, so reruns reuse the cached frame
+        df = technical_summary_frame(
+            indicators.get('current_price'),
+            indicators.get('sma_20'),
+            indicators.get('sma_50'),
+            indicators.get('rsi'),
+            indicators.get('trend', 'Unknown'),
+            indicators.get('volume_avg'),
+            indicators.get('price_change_1d', {}).get('percent'),
+            indicators.get('price_change_5d', {}).get('percent')
+        )
         
         # Display the summary table
-        if summary_data:
-            df = pd.DataFrame(summary_data)
-            
-            # Style the dataframe
-            styled_df = df.style.apply(lambda x: ['background-color: #f0f2f6' if i % 2 == 0 else '' for i in range(len(x))], axis=0)
+        if not df.empty:
+            # Style the dataframe with alternating row shading
+            styled_df = df.style.apply(_stripe_rows, axis=None)
             
             st.dataframe(
                 styled_df,
@@ -169,6 +96,121 @@ def render_technical_summary(indicators):
         st.error(f"❌ Error rendering technical summary: {str(e)}")
 
 
+def _stripe_rows(frame):
+    """Cell styles shading every other row, built in one vectorized pass."""
+    shade = np.where(np.arange(len(frame)) % 2 == 0, 'background-color: #f0f2f6', '')
+    return pd.DataFrame(np.repeat(shade[:, None], frame.shape[1], axis=1),
+                        index=frame.index, columns=frame.columns)
+
+
+_TREND_ICONS = {'bullish': '📈', 'bearish': '📉'}
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def technical_summary_frame(current_price, sma_20, sma_50, rsi_current, trend,
+                            avg_volume, change_1d, change_5d):
+    """
+    Build the technical summary table, cached across reruns.
+    
+    Keyed on the scalar indicator values rather than the indicators dict, so
+    widget interactions that leave the analysis unchanged skip the rebuild.
+    
+    Args:
+        current_price: Latest trading price
+        sma_20: 20-day SMA
+        sma_50: 50-day SMA
+        rsi_current: Latest RSI
+        trend: Trend label, or 'Unknown'
+        avg_volume: 20-day average volume
+        change_1d: 1-day price change in percent
+        change_5d: 5-day price change in percent
+    
+    Returns:
+        pd.DataFrame: Indicator, Value and Description columns (empty if no values)
+    """
+    summary_data = []
+    
+    # Current Price
+    if current_price is not None:
+        summary_data.append({
+            'Indicator': '💰 Current Price',
+            'Value': format_currency(current_price),
+            'Description': 'Latest trading price'
+        })
+    
+    # Moving Averages
+    if sma_20 is not None:
+        summary_data.append({
+            'Indicator': '📈 SMA 20',
+            'Value': format_currency(sma_20),
+            'Description': '20-day Simple Moving Average'
+        })
+    
+    if sma_50 is not None:
+        summary_data.append({
+            'Indicator': '📊 SMA 50',
+            'Value': format_currency(sma_50),
+            'Description': '50-day Simple Moving Average'
+        })
+    
+    # RSI
+    if rsi_current is not None:
+        rsi_interpretation = "Neutral"
+        if rsi_current > 70:
+            rsi_interpretation = "Overbought"
+        elif rsi_current < 30:
+            rsi_interpretation = "Oversold"
+        
+        summary_data.append({
+            'Indicator': '📉 RSI',
+            'Value': f"{rsi_current:.1f}",
+            'Description': f'Relative Strength Index ({rsi_interpretation})'
+        })
+    
+    # Trend Analysis
+    if trend != 'Unknown':
+        trend_icon = _TREND_ICONS.get(trend.lower(), '➡️')
+        summary_data.append({
+            'Indicator': f'{trend_icon} Trend',
+            'Value': trend.capitalize(),
+            'Description': 'Overall market trend direction'
+        })
+    
+    # Volume Analysis
+    if avg_volume is not None:
+        summary_data.append({
+            'Indicator': '📊 Avg Volume',
+            'Value': format_number(avg_volume, 0),
+            'Description': '20-day average trading volume'
+        })
+    
+    # Price changes
+    if change_1d is not None:
+        summary_data.append({
+            'Indicator': '📊 1-Day Change',
+            'Value': f"{change_1d:+.2f}%",
+            'Description': 'Price change from previous day'
+        })
+    
+    if change_5d is not None:
+        summary_data.append({
+            'Indicator': '📊 5-Day Change',
+            'Value': f"{change_5d:+.2f}%",
+            'Description': 'Price change over 5 days'
+        })
+    
+    return pd.DataFrame(summary_data, columns=['Indicator', 'Value', 'Description'])
+
+
+# Moving average signal -> (message, accent color) for render_market_status
+_MA_SIGNALS = {
+    'strong_bullish': ("• Strong bullish signal: Price &gt; SMA20 &gt; SMA50", COLORS['success']),
+    'strong_bearish': ("• Strong bearish signal: Price &lt; SMA20 &lt; SMA50", COLORS['danger']),
+    'bullish': ("• Short-term bullish: Price above SMA20", COLORS['primary']),
+    'bearish': ("• Short-term bearish: Price below SMA20", COLORS['warning']),
+}
+
+
 def render_market_status(indicators):
     """
     Display market status and trading signals.
@@ -179,22 +221,26 @@ def render_market_status(indicators):
     try:
         st.subheader("🎯 Market Status")
         
+        # Read every indicator used below once
+        current_price, sma_20, sma_50, rsi_current = (
+            indicators.get(name) for name in ('current_price', 'sma_20', 'sma_50', 'rsi')
+        )
+        trend = (indicators.get('trend') or 'Unknown').lower()
+        
         # Create columns for different status indicators
         col1, col2 = st.columns(2)
         
         with col1:
             # Trend status
-            trend = indicators.get('trend', 'Unknown')
-            if trend.lower() == 'bullish':
+            if trend == 'bullish':
                 st.success(f"📈 **Bullish Trend**")
-            elif trend.lower() == 'bearish':
+            elif trend == 'bearish':
                 st.error(f"📉 **Bearish Trend**")
             else:
                 st.info(f"➡️ **Neutral/Sideways**")
         
         with col2:
             # RSI status
-            rsi_current = indicators.get('rsi')
             if rsi_current is not None:
                 if rsi_current > 70:
                     st.warning(f"⚠️ **Overbought** (RSI: {rsi_current:.1f})")
@@ -203,22 +249,29 @@ def render_market_status(indicators):
                 else:
                     st.info(f"⚖️ **Neutral** (RSI: {rsi_current:.1f})")
         
-        # Moving average analysis
-        current_price = indicators.get('current_price')
-        sma_20 = indicators.get('sma_20')
-        sma_50 = indicators.get('sma_50')
-        
-        if all(x is not None for x in [current_price, sma_20, sma_50]):
-            st.markdown("**📊 Moving Average Analysis:**")
-            
+        # Moving average analysis: heading and signal in one element
+        if current_price is not None and sma_20 is not None and sma_50 is not None:
             if current_price > sma_20 > sma_50:
-                st.success("• Strong bullish signal: Price > SMA20 > SMA50")
+                signal = 'strong_bullish'
             elif current_price < sma_20 < sma_50:
-                st.error("• Strong bearish signal: Price < SMA20 < SMA50")
+                signal = 'strong_bearish'
             elif current_price > sma_20:
-                st.info("• Short-term bullish: Price above SMA20")
+                signal = 'bullish'
             elif current_price < sma_20:
-                st.warning("• Short-term bearish: Price below SMA20")
+                signal = 'bearish'
+            else:
+                signal = None
+            
+            if signal is None:
+                st.markdown("**📊 Moving Average Analysis:**")
+            else:
+                message, color = _MA_SIGNALS[signal]
+                st.markdown(
+                    f"<div style='border-left: 4px solid {color}; background-color: {COLORS['light_bg']}; "
+                    f"padding: 0.5rem 1rem; border-radius: 0.5rem;'>"
+                    f"<b>📊 Moving Average Analysis:</b><br>{message}</div>",
+                    unsafe_allow_html=True
+                )
             
     except Exception as e:
         st.error(f"❌ Error rendering market status: {str(e)}")
@@ -237,16 +290,21 @@ def render_data_info(analysis_data):
             period = analysis_data.get('period', 'Unknown')
             last_updated = analysis_data.get('last_updated', 'Unknown')
             
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(label="Symbol", value=symbol)
-            
-            with col2:
-                st.metric(label="Period", value=period.upper())
-            
-            with col3:
-                st.metric(label="Last Updated", value=str(last_updated)[:19] if last_updated != 'Unknown' else 'Unknown')
+            # Static values without deltas, so one HTML grid replaces three metric widgets
+            items = (
+                ("Symbol", symbol),
+                ("Period", period.upper()),
+                ("Last Updated", str(last_updated)[:19] if last_updated != 'Unknown' else 'Unknown'),
+            )
+            cells = "".join(
+                f"<div><span style='font-size: 0.875rem; opacity: 0.7;'>{label}</span><br>"
+                f"<span style='font-size: 1.5rem;'>{html.escape(value)}</span></div>"
+                for label, value in items
+            )
+            st.markdown(
+                f"<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;'>{cells}</div>",
+                unsafe_allow_html=True
+            )
             
             # Data quality indicators
             data = analysis_data.get('data')
@@ -286,6 +344,35 @@ def render_analysis_summary(analysis_data):
         st.error(f"❌ Error rendering analysis summary: {str(e)}")
 
 
+# Colors are filled in once at import; only the time fields vary per render
+_TIMESTAMP_TEMPLATE = f"""
+    <div style="
+        background-color: {COLORS['light_bg']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 8px;
+        padding: 12px;
+        margin: 10px 0;
+        text-align: center;
+    ">
+        <div style="color: {COLORS['neutral']}; font-size: 14px; margin-bottom: 4px;">
+            📅 Last Updated
+        </div>
+        <div style="color: {COLORS['text']}; font-weight: bold; font-size: 16px;">
+            {{formatted_time}}
+        </div>
+        <div style="color: {COLORS['neutral']}; font-size: 12px;">
+            {{time_ago}}
+        </div>
+    </div>
+    """
+
+
+@lru_cache(maxsize=128)
+def _parse_iso_timestamp(value):
+    """Parse an ISO-8601 string once; reruns show the same timestamp repeatedly."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 def render_last_updated_timestamp(timestamp=None, analysis_data=None):
     """
     Display the last updated timestamp prominently.
@@ -308,8 +395,8 @@ def render_last_updated_timestamp(timestamp=None, analysis_data=None):
         # Format timestamp
         if isinstance(last_updated, str):
             try:
-                last_updated = datetime.fromisoformat(last_updated.replace('Z', '+00:00'))
-            except:
+                last_updated = _parse_iso_timestamp(last_updated)
+            except ValueError:
                 last_updated = datetime.now(timezone.utc)
         
         # Format for display
@@ -318,26 +405,7 @@ def render_last_updated_timestamp(timestamp=None, analysis_data=None):
         
         # Create styled timestamp display
         st.markdown(
-            f"""
-            <div style="
-                background-color: {COLORS['light_bg']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 12px;
-                margin: 10px 0;
-                text-align: center;
-            ">
-                <div style="color: {COLORS['neutral']}; font-size: 14px; margin-bottom: 4px;">
-                    📅 Last Updated
-                </div>
-                <div style="color: {COLORS['text']}; font-weight: bold; font-size: 16px;">
-                    {formatted_time}
-                </div>
-                <div style="color: {COLORS['neutral']}; font-size: 12px;">
-                    {time_ago}
-                </div>
-            </div>
-            """,
+            _TIMESTAMP_TEMPLATE.format(formatted_time=formatted_time, time_ago=time_ago),
             unsafe_allow_html=True
         )
         
@@ -345,112 +413,117 @@ def render_last_updated_timestamp(timestamp=None, analysis_data=None):
         st.caption(f"⏰ Last updated: {datetime.now().strftime('%H:%M:%S')}")
 
 
-def get_time_ago_string(timestamp):
+# (upper bound in seconds, unit, seconds per unit) for get_time_ago_string
+_TIME_AGO_UNITS = (
+    (60, 'second', 1),
+    (3600, 'minute', 60),
+    (86400, 'hour', 3600),
+    (float('inf'), 'day', 86400),
+)
+
+
+def get_time_ago_string(timestamp, now=None):
     """
     Get a human-readable time ago string.
     
     Args:
         timestamp: The timestamp to compare against now
+        now: Current UTC datetime, so several timestamps in one render can share
+            a single clock reading (default: datetime.now(timezone.utc))
     
     Returns:
         str: Time ago string
     """
     try:
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         if timestamp.tzinfo is None:
             timestamp = timestamp.replace(tzinfo=timezone.utc)
         
-        diff = now - timestamp
-        seconds = int(diff.total_seconds())
-        
-        if seconds < 60:
-            return f"{seconds} seconds ago"
-        elif seconds < 3600:
-            minutes = seconds // 60
-            return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-        elif seconds < 86400:
-            hours = seconds // 3600
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        else:
-            days = seconds // 86400
-            return f"{days} day{'s' if days != 1 else ''} ago"
+        seconds = int((now - timestamp).total_seconds())
+        for limit, unit, unit_seconds in _TIME_AGO_UNITS:
+            if seconds < limit:
+                count = seconds // unit_seconds
+                return f"{count} {unit}{'s' if count != 1 else ''} ago"
     except:
         return "Recently"
 
 
-def apply_mobile_responsive_layout():
-    """
-    Apply mobile-responsive CSS styles to the Streamlit app.
-    """
-    st.markdown(
-        f"""
-        <style>
-        /* Mobile responsiveness */
-        @media (max-width: 768px) {{
-            .stApp > div:first-child {{
-                padding-top: 1rem;
-            }}
-            
-            .stMetric {{
-                background-color: {COLORS['light_bg']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 1rem;
-                margin: 0.5rem 0;
-            }}
-            
-            .stColumns > div {{
-                padding: 0 0.5rem;
-            }}
-            
-            .stDataFrame {{
-                font-size: 12px;
-            }}
-            
-            .stPlotlyChart {{
-                margin: 0 -1rem;
-            }}
-            
-            .stButton > button {{
-                width: 100%;
-                padding: 0.75rem;
-                font-size: 16px;
-                margin: 0.25rem 0;
-            }}
-            
-            .stTextInput > div > div > input {{
-                font-size: 16px;
-                padding: 0.75rem;
-            }}
-            
-            .stSelectbox > div > div > select {{
-                font-size: 16px;
-                padding: 0.75rem;
-            }}
+# Formatted once at import; Streamlit still needs it emitted on every run,
+# since elements a rerun does not emit are removed from the page
+_MOBILE_CSS = f"""
+    <style>
+    /* Mobile responsiveness */
+    @media (max-width: 768px) {{
+        .stApp > div:first-child {{
+            padding-top: 1rem;
+        }}
+        
+        .stMetric {{
+            background-color: {COLORS['light_bg']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 1rem;
+            margin: 0.5rem 0;
+        }}
+        
+        .stColumns > div {{
+            padding: 0 0.5rem;
+        }}
+        
+        .stDataFrame {{
+            font-size: 12px;
+        }}
+        
+        .stPlotlyChart {{
+            margin: 0 -1rem;
         }}
         
-        /* Touch-friendly buttons */
         .stButton > button {{
-            min-height: 44px;
-            touch-action: manipulation;
+            width: 100%;
+            padding: 0.75rem;
+            font-size: 16px;
+            margin: 0.25rem 0;
         }}
         
-        /* Improved readability */
-        .stMarkdown {{
-            line-height: 1.6;
+        .stTextInput > div > div > input {{
+            font-size: 16px;
+            padding: 0.75rem;
         }}
         
-        /* Better spacing on mobile */
-        @media (max-width: 768px) {{
-            .block-container {{
-                padding-left: 1rem;
-                padding-right: 1rem;
-            }}
+        .stSelectbox > div > div > select {{
+            font-size: 16px;
+            padding: 0.75rem;
         }}
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    }}
+    
+    /* Touch-friendly buttons */
+    .stButton > button {{
+        min-height: 44px;
+        touch-action: manipulation;
+    }}
+    
+    /* Improved readability */
+    .stMarkdown {{
+        line-height: 1.6;
+    }}
+    
+    /* Better spacing on mobile */
+    @media (max-width: 768px) {{
+        .block-container {{
+            padding-left: 1rem;
+            padding-right: 1rem;
+        }}
+    }}
+    </style>
+    """
+
+
+def apply_mobile_responsive_layout():
+    """
+    Apply mobile-responsive CSS styles to the Streamlit app.
+    """
+    st.markdown(_MOBILE_CSS, unsafe_allow_html=True)
 
 
 def create_mobile_friendly_metrics(metrics_data, layout='horizontal'):
@@ -481,6 +554,12 @@ def create_mobile_friendly_metrics(metrics_data, layout='horizontal'):
         st.error(f"❌ Error creating metrics: {str(e)}")
 
 
+# Magnitude thresholds for create_metric_card and the (divisor, format) used
+# below, between and above them
+_METRIC_SCALE_BOUNDS = (1_000, 1_000_000)
+_METRIC_SCALES = ((1, "{:.2f}"), (1_000, "{:.1f}K"), (1_000_000, "{:.2f}M"))
+
+
 def create_metric_card(label, value, delta=None):
     """
     Create a styled metric card.
@@ -493,12 +572,8 @@ def create_metric_card(label, value, delta=None):
     try:
         # Format value if it's a number
         if isinstance(value, (int, float)):
-            if abs(value) >= 1_000_000:
-                formatted_value = f"{value/1_000_000:.2f}M"
-            elif abs(value) >= 1_000:
-                formatted_value = f"{value/1_000:.1f}K"
-            else:
-                formatted_value = f"{value:.2f}"
+            divisor, fmt = _METRIC_SCALES[bisect_right(_METRIC_SCALE_BOUNDS, abs(value))]
+            formatted_value = fmt.format(value / divisor)
         else:
             formatted_value = str(value)
         
@@ -525,11 +600,8 @@ def render_responsive_data_table(data, title="Data Table"):
             st.info("No data available")
             return
         
-        # Convert to DataFrame if needed
-        if isinstance(data, list):
-            df = pd.DataFrame(data)
-        else:
-            df = data.copy()
+        # Convert to DataFrame if needed; st.dataframe does not mutate its input
+        df = pd.DataFrame(data) if isinstance(data, list) else data
         
         # Mobile-friendly table display
         st.subheader(title)
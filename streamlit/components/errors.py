@@ -6,11 +6,35 @@ and handling various types of analysis errors gracefully.
 """
 
 import streamlit as st
+import functools
 import logging
 import re
 from config.ui_config import ERROR_MESSAGES, COLORS
 
 
+# Static panels, each emitted as a single element
+_NO_DATA_MD = """👋 **Welcome to the Stock Dashboard!**
+
+📝 **Getting Started:**
+1. Enter a stock symbol in the sidebar (e.g., AAPL, GOOGL, MSFT)
+2. Select your preferred time period
+3. Choose your language preference
+4. Click 'Analyze' or press Enter to get started
+
+💡 **Popular symbols to try:** AAPL, GOOGL, MSFT, AMZN, TSLA, NVDA"""
+
+_DEMO_MODE_MD = """🎯 **Demo Mode**: You're using the demo version with sample data.
+
+**Demo limitations:**
+- Limited to popular stock symbols
+- Data may be delayed or simulated
+- Some features may be restricted"""
+
+_API_STATUS_MD = """⚠️ **API Status**: Some data sources may be experiencing delays.
+
+💡 Data may be slightly delayed or limited during peak usage times."""
+
+
 def handle_analysis_error(error_object, symbol):
     """
     Display user-friendly error messages for analysis errors.
@@ -23,7 +47,7 @@ def handle_analysis_error(error_object, symbol):
     error_message = str(error_object)
     
     # Log the error for debugging
-    logging.error(f"Analysis error for symbol {symbol}: {error_type} - {error_message}")
+    logging.error("Analysis error for symbol %s: %s - %s", symbol, error_type, error_message)
     
     # Classify the error type
     classified_error = classify_error(error_message, error_type)
@@ -32,10 +56,27 @@ def handle_analysis_error(error_object, symbol):
     display_classified_error(classified_error, symbol, error_type, error_message)
 
 
+# (error key, keywords) in priority order, each compiled into one alternation
+_ERROR_PATTERNS = tuple(
+    (error_key, re.compile("|".join(map(re.escape, keywords))))
+    for error_key, keywords in (
+        ('invalid_symbol', ("no data found", "invalid symbol", "not found", "ticker", "symbol")),
+        ('api_error', ("api key", "authentication", "unauthorized", "forbidden")),
+        ('network_error', ("network", "connection", "dns", "resolve", "unreachable")),
+        ('rate_limit', ("rate limit", "too many requests", "quota exceeded")),
+        ('timeout', ("timeout", "timed out", "time limit")),
+        ('insufficient_data', ("insufficient data", "not enough", "too few", "empty")),
+    )
+)
+
+
+@functools.lru_cache(maxsize=256)
 def classify_error(error_message, error_type):
     """
     Classify the error based on message content and type.
     
+    Memoized, since the same provider failures recur across reruns and sessions.
+    
     Args:
         error_message (str): The error message
         error_type (str): The error type name
@@ -45,36 +86,10 @@ def classify_error(error_message, error_type):
     """
     error_message_lower = error_message.lower()
     
-    # Check for specific error patterns
-    if any(pattern in error_message_lower for pattern in [
-        "no data found", "invalid symbol", "not found", "ticker", "symbol"
-    ]):
-        return 'invalid_symbol'
-    
-    elif any(pattern in error_message_lower for pattern in [
-        "api key", "authentication", "unauthorized", "forbidden"
-    ]):
-        return 'api_error'
-    
-    elif any(pattern in error_message_lower for pattern in [
-        "network", "connection", "dns", "resolve", "unreachable"
-    ]):
-        return 'network_error'
-    
-    elif any(pattern in error_message_lower for pattern in [
-        "rate limit", "too many requests", "quota exceeded"
-    ]):
-        return 'rate_limit'
-    
-    elif any(pattern in error_message_lower for pattern in [
-        "timeout", "timed out", "time limit"
-    ]):
-        return 'timeout'
-    
-    elif any(pattern in error_message_lower for pattern in [
-        "insufficient data", "not enough", "too few", "empty"
-    ]):
-        return 'insufficient_data'
+    # Categories are checked in priority order; the first match wins
+    for error_key, pattern in _ERROR_PATTERNS:
+        if pattern.search(error_message_lower):
+            return error_key
     
     # Default to generic error
     return 'generic'
@@ -101,9 +116,7 @@ def display_classified_error(error_key, symbol, error_type, error_message):
         
         # Display suggestions
         if error_config['suggestions']:
-            st.info("💡 **Suggestions:**")
-            for suggestion in error_config['suggestions']:
-                st.info(f"• {suggestion}")
+            render_suggestions("💡 **Suggestions:**", error_config['suggestions'])
     else:
         # Generic error fallback
         st.error(f"⚠️ **Analysis Error**: Unable to analyze '{symbol}' at this time.")
@@ -116,30 +129,21 @@ def display_classified_error(error_key, symbol, error_type, error_message):
         st.markdown(f"**Symbol:** `{symbol}`")
 
 
-def display_error_card(title, message, suggestions=None, error_type="error"):
+def render_suggestions(heading, suggestions):
     """
-    Display a styled error card with consistent formatting.
+    Display a heading and its suggestions as one info box with a bullet list.
     
     Args:
-        title (str): Error title
-        message (str): Error message
-        suggestions (list): List of suggestion strings
-        error_type (str): Type of error for styling ('error', 'warning', 'info')
+        heading (str): Markdown heading line
+        suggestions (list): Suggestion strings
     """
-    # Choose color and icon based on error type
-    if error_type == "error":
-        color = COLORS['danger']
-        icon = "❌"
-    elif error_type == "warning":
-        color = COLORS['warning']
-        icon = "⚠️"
-    else:
-        color = COLORS['primary']
-        icon = "ℹ️"
-    
-    # Create styled error card
-    st.markdown(
-        f"""
+    bullets = "\n".join(f"- {suggestion}" for suggestion in suggestions)
+    st.info(f"{heading}\n\n{bullets}")
+
+
+def _error_card_template(color, icon):
+    """Card HTML with the styling filled in and {title}/{message} left to format."""
+    return f"""
         <div style="
             border: 2px solid {color}; 
             border-radius: 10px; 
@@ -148,21 +152,40 @@ def display_error_card(title, message, suggestions=None, error_type="error"):
             background-color: {color}20;
         ">
             <h3 style="color: {color}; margin: 0 0 10px 0;">
-                {icon} {title}
+                {icon} {{title}}
             </h3>
             <p style="margin: 0 0 15px 0; color: {COLORS['text']};">
-                {message}
+                {{message}}
             </p>
         </div>
-        """,
-        unsafe_allow_html=True
-    )
+        """
+
+
+# Card templates per error type; anything else is rendered as 'info'
+_ERROR_CARD_TEMPLATES = {
+    'error': _error_card_template(COLORS['danger'], "❌"),
+    'warning': _error_card_template(COLORS['warning'], "⚠️"),
+    'info': _error_card_template(COLORS['primary'], "ℹ️"),
+}
+
+
+def display_error_card(title, message, suggestions=None, error_type="error"):
+    """
+    Display a styled error card with consistent formatting.
+    
+    Args:
+        title (str): Error title
+        message (str): Error message
+        suggestions (list): List of suggestion strings
+        error_type (str): Type of error for styling ('error', 'warning', 'info')
+    """
+    # Card template with the color and icon for this error type already filled in
+    template = _ERROR_CARD_TEMPLATES.get(error_type, _ERROR_CARD_TEMPLATES['info'])
+    st.markdown(template.format(title=title, message=message), unsafe_allow_html=True)
     
     # Display suggestions if provided
     if suggestions:
-        st.info("💡 **What you can try:**")
-        for suggestion in suggestions:
-            st.info(f"• {suggestion}")
+        render_suggestions("💡 **What you can try:**", suggestions)
 
 
 def show_validation_feedback(symbol, is_valid):
@@ -196,30 +219,22 @@ def handle_insufficient_data_error(symbol, period):
     st.error(f"❌ **{error_config['title']}**: {error_config['message']}")
     st.warning(f"Not enough data available for **{symbol}** over the **{period}** period.")
     
-    st.info("💡 **Suggestions:**")
-    for suggestion in error_config['suggestions']:
-        st.info(f"• {suggestion}")
-    
-    # Additional specific suggestions
-    st.info("• Try popular symbols like AAPL, GOOGL, or MSFT")
-    st.info("• Some symbols may have limited historical data")
+    render_suggestions("💡 **Suggestions:**", [
+        *error_config['suggestions'],
+        # Additional specific suggestions
+        "Try popular symbols like AAPL, GOOGL, or MSFT",
+        "Some symbols may have limited historical data",
+    ])
 
 
 def show_api_status_warning():
     """Show a warning about API status or limitations."""
-    st.warning("⚠️ **API Status**: Some data sources may be experiencing delays.")
-    st.info("💡 Data may be slightly delayed or limited during peak usage times.")
+    st.warning(_API_STATUS_MD)
 
 
 def show_demo_mode_info():
     """Show information about demo mode limitations."""
-    st.info("🎯 **Demo Mode**: You're using the demo version with sample data.")
-    st.markdown("""
-    **Demo limitations:**
-    • Limited to popular stock symbols
-    • Data may be delayed or simulated
-    • Some features may be restricted
-    """)
+    st.info(_DEMO_MODE_MD)
 
 
 def validate_and_suggest_symbol(symbol):
@@ -239,8 +254,8 @@ def validate_and_suggest_symbol(symbol):
             'suggestions': ['Try symbols like AAPL, GOOGL, MSFT']
         }
     
-    # Basic format validation
-    if not re.match(r'^[A-Z]{1,5}$', symbol.upper()):
+    # Basic format validation: 1-5 ASCII letters, checked without the regex engine
+    if not (len(symbol) <= 5 and symbol.isascii() and symbol.isalpha()):
         return {
             'valid': False,
             'message': f"'{symbol}' doesn't match typical symbol format",
@@ -289,16 +304,7 @@ def handle_info_message(message, symbol=None):
 
 def show_no_data_message():
     """Display a message when no analysis data is available."""
-    st.info("👋 **Welcome to the Stock Dashboard!**")
-    st.markdown("""
-    📝 **Getting Started:**
-    1. Enter a stock symbol in the sidebar (e.g., AAPL, GOOGL, MSFT)
-    2. Select your preferred time period
-    3. Choose your language preference
-    4. Click 'Analyze' or press Enter to get started
-    
-    💡 **Popular symbols to try:** AAPL, GOOGL, MSFT, AMZN, TSLA, NVDA
-    """)
+    st.info(_NO_DATA_MD)
 
 
 def show_loading_error():
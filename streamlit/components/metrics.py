@@ -6,6 +6,7 @@ using Streamlit's metric components with proper formatting.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from utils.formatters import format_currency, format_volume, format_percentage, format_change
 
@@ -26,75 +27,27 @@ def render_key_metrics(indicators, show_title=True):
         if show_title:
             st.subheader("📊 Key Metrics")
         
-        # Create three columns for metrics
-        col1, col2, col3 = st.columns(3)
-        
-        # Current Price with change
-        current_price = indicators.get('current_price')
         price_change_1d = indicators.get('price_change_1d', {})
-        
-        if current_price is not None:
-            with col1:
-                change_amount = price_change_1d.get('amount', 0)
-                change_percent = price_change_1d.get('percent', 0)
-                delta_text = f"{change_amount:+.2f} ({change_percent:+.2f}%)" if change_amount != 0 else None
-                
-                st.metric(
-                    label="💰 Current Price",
-                    value=format_currency(current_price),
-                    delta=delta_text
-                )
-        
-        # Average Volume
-        avg_volume = indicators.get('volume_avg')
-        
-        if avg_volume is not None:
-            with col2:
-                st.metric(
-                    label="📈 Avg Volume (20d)",
-                    value=format_volume(avg_volume)
-                )
-        
-        # RSI
-        rsi_value = indicators.get('rsi')
-        if rsi_value is not None:
-            with col3:
-                # Determine RSI status for better visualization
-                if rsi_value > 70:
-                    rsi_status = "Overbought"
-                elif rsi_value < 30:
-                    rsi_status = "Oversold"
-                else:
-                    rsi_status = "Neutral"
-                
-                st.metric(
-                    label=f"📉 RSI ({rsi_status})",
-                    value=f"{rsi_value:.1f}",
-                    help="RSI: >70 Overbought, <30 Oversold, 30-70 Neutral"
-                )
+        primary_metrics, additional_metrics = key_metric_values(
+            indicators.get('current_price'),
+            price_change_1d.get('amount', 0),
+            price_change_1d.get('percent', 0),
+            indicators.get('volume_avg'),
+            indicators.get('rsi'),
+            indicators.get('sma_20'),
+            indicators.get('sma_50'),
+            indicators.get('price_change_5d', {}).get('percent')
+        )
+        
+        # Current price, average volume and RSI in three columns
+        for column, metric in zip(st.columns(3), primary_metrics):
+            if metric is not None:
+                with column:
+                    st.metric(**metric)
         
         # Additional metrics row
         st.markdown("---")
         
-        # Create additional metrics if available
-        additional_metrics = []
-        
-        # Moving averages
-        sma_20 = indicators.get('sma_20')
-        sma_50 = indicators.get('sma_50')
-        
-        if sma_20 is not None and sma_50 is not None:
-            additional_metrics.extend([
-                ("📈 SMA 20", format_currency(sma_20)),
-                ("📊 SMA 50", format_currency(sma_50))
-            ])
-        
-        # Price changes
-        price_change_5d = indicators.get('price_change_5d', {})
-        if price_change_5d.get('percent') is not None:
-            change_5d = price_change_5d.get('percent', 0)
-            additional_metrics.append(("📈 5-Day Change", f"{change_5d:+.2f}%"))
-        
         # Display additional metrics in columns
         if additional_metrics:
             num_metrics = len(additional_metrics)
@@ -123,6 +76,76 @@ def render_key_metrics(indicators, show_title=True):
         st.error(f"❌ Error rendering metrics: {str(e)}")
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def key_metric_values(current_price, change_amount, change_percent, avg_volume,
+                      rsi_value, sma_20, sma_50, change_5d):
+    """
+    Format the key metrics, cached across reruns.
+    
+    Keyed on the scalar indicator values, so widget interactions that leave
+    the analysis unchanged skip the formatting work.
+    
+    Args:
+        current_price: Latest trading price
+        change_amount: 1-day price change amount
+        change_percent: 1-day price change in percent
+        avg_volume: 20-day average volume
+        rsi_value: Latest RSI
+        sma_20: 20-day SMA
+        sma_50: 50-day SMA
+        change_5d: 5-day price change in percent
+    
+    Returns:
+        tuple: (three st.metric kwargs dicts for price, volume and RSI, each
+        None when unavailable; list of (label, value) additional metrics)
+    """
+    price_metric = volume_metric = rsi_metric = None
+    
+    # Current Price with change
+    if current_price is not None:
+        delta_text = f"{change_amount:+.2f} ({change_percent:+.2f}%)" if change_amount != 0 else None
+        price_metric = {
+            'label': "💰 Current Price",
+            'value': format_currency(current_price),
+            'delta': delta_text
+        }
+    
+    # Average Volume
+    if avg_volume is not None:
+        volume_metric = {'label': "📈 Avg Volume (20d)", 'value': format_volume(avg_volume)}
+    
+    # RSI
+    if rsi_value is not None:
+        # Determine RSI status for better visualization
+        if rsi_value > 70:
+            rsi_status = "Overbought"
+        elif rsi_value < 30:
+            rsi_status = "Oversold"
+        else:
+            rsi_status = "Neutral"
+        
+        rsi_metric = {
+            'label': f"📉 RSI ({rsi_status})",
+            'value': f"{rsi_value:.1f}",
+            'help': "RSI: >70 Overbought, <30 Oversold, 30-70 Neutral"
+        }
+    
+    additional_metrics = []
+    
+    # Moving averages
+    if sma_20 is not None and sma_50 is not None:
+        additional_metrics.extend([
+            ("📈 SMA 20", format_currency(sma_20)),
+            ("📊 SMA 50", format_currency(sma_50))
+        ])
+    
+    # Price changes
+    if change_5d is not None:
+        additional_metrics.append(("📈 5-Day Change", f"{change_5d:+.2f}%"))
+    
+    return (price_metric, volume_metric, rsi_metric), additional_metrics
+
+
 def render_price_metrics(stock_data, show_title=True):
     """
     Render price-specific metrics from stock data.
@@ -138,32 +161,35 @@ def render_price_metrics(stock_data, show_title=True):
         if show_title:
             st.subheader("💹 Price Metrics")
         
-        latest_data = stock_data.iloc[-1]
+        # Read the last bar per column; iloc[-1] would build an upcast row Series
+        high, low, open_price, close = (
+            stock_data[column].to_numpy()[-1] for column in ('High', 'Low', 'Open', 'Close')
+        )
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             st.metric(
                 label="🔼 High",
-                value=format_currency(latest_data['High'])
+                value=format_currency(high)
             )
         
         with col2:
             st.metric(
                 label="🔽 Low",
-                value=format_currency(latest_data['Low'])
+                value=format_currency(low)
             )
         
         with col3:
             st.metric(
                 label="🟢 Open",
-                value=format_currency(latest_data['Open'])
+                value=format_currency(open_price)
             )
         
         with col4:
             st.metric(
                 label="🔴 Close",
-                value=format_currency(latest_data['Close'])
+                value=format_currency(close)
             )
             
     except Exception as e:
@@ -184,9 +210,10 @@ def render_trading_metrics(stock_data):
         st.subheader("📊 Trading Metrics")
         
         # Calculate some basic trading metrics
-        latest_volume = stock_data['Volume'].iloc[-1]
-        avg_volume = stock_data['Volume'].tail(20).mean()
-        price_range = stock_data['High'].iloc[-1] - stock_data['Low'].iloc[-1]
+        volume = stock_data['Volume'].to_numpy(dtype=np.float64)
+        latest_volume = volume[-1]
+        avg_volume = np.nanmean(volume[-20:])
+        price_range = stock_data['High'].to_numpy()[-1] - stock_data['Low'].to_numpy()[-1]
         
         col1, col2, col3 = st.columns(3)
         
@@ -16,6 +16,36 @@ def format_period_display(period):
     return PERIOD_DISPLAY.get(period, str(period))
 
 
+def _set_if_changed(key, value):
+    """Write a session state value only when it differs from the stored one."""
+    if st.session_state.get(key) != value:
+        st.session_state[key] = value
+
+
+def _select_symbol(symbol):
+    """
+    Button callback that makes symbol the current selection.
+
+    Callbacks run before the script, so the symbol input picks the new value up
+    in the same run instead of needing an extra st.rerun().
+    """
+    st.session_state.symbol = symbol
+    st.session_state.symbol_input = symbol
+
+
+def _apply_display_preset(prefs):
+    """Button callback that replaces the display preferences before the run."""
+    st.session_state.display_prefs = dict(prefs)
+
+
+# Category label, toggle key and (column, symbol, widget key) per button, laid out once
+_POPULAR_LAYOUT = tuple(
+    (f"📊 {category}", f"popular_open_{category}",
+     tuple((i % 2, symbol, f"popular_{symbol}") for i, symbol in enumerate(symbols)))
+    for category, symbols in POPULAR_STOCKS.items()
+)
+
+
 def render_popular_stocks():
     """
     Render popular stock selection buttons.
@@ -28,14 +58,17 @@ def render_popular_stocks():
     
     selected_symbol = None
     
-    for category, symbols in POPULAR_STOCKS.items():
-        with st.sidebar.expander(f"📊 {category}", expanded=False):
-            # Create columns for better layout
-            cols = st.columns(2)
-            for i, symbol in enumerate(symbols):
-                col = cols[i % 2]
-                if col.button(symbol, key=f"popular_{symbol}", use_container_width=True):
-                    selected_symbol = symbol
+    for label, open_key, buttons in _POPULAR_LAYOUT:
+        # Collapsed categories create no button widgets; the checkbox state lives
+        # in st.session_state under open_key
+        if not st.sidebar.checkbox(label, key=open_key):
+            continue
+        # Create columns for better layout
+        cols = st.sidebar.columns(2)
+        for column, symbol, key in buttons:
+            if cols[column].button(symbol, key=key, use_container_width=True,
+                                   on_click=_select_symbol, args=(symbol,)):
+                selected_symbol = symbol
     
     return selected_symbol
 
@@ -47,10 +80,10 @@ def render_symbol_input():
     Returns:
         tuple: (symbol, is_valid) - The entered symbol and its validation status
     """
-    # Symbol input
+    # Symbol input, seeded through its key since button callbacks also write to it
+    st.session_state.setdefault('symbol_input', st.session_state.get('symbol', ''))
     symbol = st.sidebar.text_input(
         "Stock Symbol",
-        value=st.session_state.get('symbol', ''),
         placeholder="e.g., AAPL, GOOGL",
         help="Enter a valid stock ticker symbol",
         key="symbol_input"
@@ -89,11 +122,8 @@ def render_controls():
     # Add some space
     st.sidebar.markdown("---")
     
-    # Check for popular stock selection first
-    popular_selection = render_popular_stocks()
-    if popular_selection:
-        st.session_state.symbol = popular_selection
-        st.rerun()
+    # Popular stock buttons select their symbol through a callback
+    render_popular_stocks()
     
     # Add separator
     st.sidebar.markdown("---")
@@ -126,22 +156,19 @@ def render_controls():
         st.sidebar.markdown("### 🕒 Recent Symbols")
         recent_cols = st.sidebar.columns(len(st.session_state.recent_symbols[:3]))
         for i, recent_symbol in enumerate(st.session_state.recent_symbols[:3]):
-            if recent_cols[i].button(recent_symbol, key=f"recent_{recent_symbol}"):
-                st.session_state.symbol = recent_symbol
-                st.rerun()
+            recent_cols[i].button(recent_symbol, key=f"recent_{recent_symbol}",
+                                  on_click=_select_symbol, args=(recent_symbol,))
     
-    # Update session state with current selections
+    # Update session state with current selections, skipping unchanged values
     if symbol and is_valid:
-        st.session_state.symbol = symbol
+        _set_if_changed('symbol', symbol)
         # Add to recent symbols
-        if 'recent_symbols' not in st.session_state:
-            st.session_state.recent_symbols = []
-        if symbol not in st.session_state.recent_symbols:
-            st.session_state.recent_symbols.insert(0, symbol)
-            st.session_state.recent_symbols = st.session_state.recent_symbols[:5]  # Keep only 5 recent
+        recent_symbols = st.session_state.setdefault('recent_symbols', [])
+        if symbol not in recent_symbols:
+            st.session_state.recent_symbols = [symbol, *recent_symbols[:4]]  # Keep only 5 recent
     
-    st.session_state.period = period
-    st.session_state.language = language
+    _set_if_changed('period', period)
+    _set_if_changed('language', language)
     
     # Display Controls Section
     render_display_controls()
@@ -216,20 +243,19 @@ def render_display_controls():
     col1, col2 = st.sidebar.columns(2)
     
     with col1:
-        if st.button("📊 All", key="preset_all", help="Show all sections"):
-            st.session_state.display_prefs = {key: True for key in st.session_state.display_prefs}
-            st.rerun()
+        st.button("📊 All", key="preset_all", help="Show all sections",
+                  on_click=_apply_display_preset,
+                  args=({key: True for key in st.session_state.display_prefs},))
     
     with col2:
-        if st.button("🎯 Essential", key="preset_essential", help="Show only essential sections"):
-            st.session_state.display_prefs = {
-                'show_price_charts': True,
-                'show_technical_indicators': True,
-                'show_metrics_analysis': True,
-                'show_ai_commentary': False,
-                'show_technical_summary': False
-            }
-            st.rerun()
+        st.button("🎯 Essential", key="preset_essential", help="Show only essential sections",
+                  on_click=_apply_display_preset, args=({
+                      'show_price_charts': True,
+                      'show_technical_indicators': True,
+                      'show_metrics_analysis': True,
+                      'show_ai_commentary': False,
+                      'show_technical_summary': False
+                  },))
 
 
 def get_display_preferences():
@@ -61,8 +61,7 @@ LAYOUT = {
 PERFORMANCE = {
     'cache_ttl': 300,  # 5 minutes
     'max_data_points': 1000,
-    'lazy_load_threshold': 500,
-    'spinner_delay': 0.5  # Delay before showing spinner
+    'lazy_load_threshold': 500
 }
 
 # Period display mappings
@@ -5,7 +5,7 @@ This module provides validation functions for user inputs,
 particularly for stock symbols and other user-provided data.
 """
 
-import re
+import functools
 
 
 def validate_stock_symbol(symbol):
@@ -21,24 +21,26 @@ def validate_stock_symbol(symbol):
     if not symbol:
         return {'is_valid': False, 'message': 'Symbol cannot be empty'}
     
+    is_valid, message = _validate_symbol_cached(symbol)
+    return {'is_valid': is_valid, 'message': message}
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_symbol_cached(symbol):
+    """
+    Memoized format check; reruns validate the same input repeatedly.
+    
+    Returns an immutable (is_valid, message) tuple so callers cannot alter
+    the cached result.
+    """
     # Remove whitespace and convert to uppercase
     symbol = symbol.strip().upper()
     
-    # Basic format validation
-    if not re.match(r'^[A-Z]{1,5}$', symbol):
-        return {
-            'is_valid': False, 
-            'message': 'Symbol must be 1-5 letters only'
-        }
-    
-    # Check for common invalid patterns
-    if len(symbol) < 1:
-        return {'is_valid': False, 'message': 'Symbol too short'}
-    
-    if len(symbol) > 5:
-        return {'is_valid': False, 'message': 'Symbol too long (max 5 characters)'}
+    # Format validation: 1-5 ASCII letters, checked without the regex engine
+    if not (1 <= len(symbol) <= 5 and symbol.isascii() and symbol.isalpha()):
+        return False, 'Symbol must be 1-5 letters only'
     
-    return {'is_valid': True, 'message': 'Valid symbol format'}
+    return True, 'Valid symbol format'
 
 
 def get_validation_color(is_valid):
@@ -5,10 +5,12 @@ These tests verify that all components work together correctly while
 mocking only the external API calls (yfinance and OpenAI).
 """
 
+import asyncio
 import pytest
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 from src.dashboard import StockDashboard
 from src.config import Config
@@ -205,13 +207,17 @@ class TestFullAnalysisWorkflow:
         
         symbols = dashboard.get_popular_symbols()
         
-        assert isinstance(symbols, list)
+        assert isinstance(symbols, tuple)
         assert len(symbols) > 0
+        # Same shared instance on every call
+        assert dashboard.get_popular_symbols() is symbols
         
         # Verify structure
         for symbol_info in symbols:
             assert 'symbol' in symbol_info
             assert 'name' in symbol_info
+            with pytest.raises(TypeError):
+                symbol_info['name'] = 'changed'
             assert isinstance(symbol_info['symbol'], str)
             assert isinstance(symbol_info['name'], str)
         
@@ -265,3 +271,225 @@ class TestComponentIntegration:
             
             # First two should have same commentary (cached)
             assert result1['commentary'] == result2['commentary']
+
+
+class TestLanguageIndependentData:
+    """Test that market data can be loaded separately from commentary."""
+    
+    def test_get_market_data_skips_commentary(self, dashboard, sample_stock_data):
+        """Test that loading market data never calls the AI generator."""
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data), \
+             patch.object(dashboard.ai_generator, 'generate_commentary') as mock_ai:
+            
+            market_data = dashboard.get_market_data("aapl", "1mo")
+            
+            assert market_data['symbol'] == "AAPL"
+            assert 'commentary' not in market_data
+            assert market_data['indicators']['current_price'] > 0
+            mock_ai.assert_not_called()
+    
+    def test_get_market_data_includes_chart_series(self, dashboard, sample_stock_data):
+        """Test that the full indicator series are returned alongside the latest values."""
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data):
+            market_data = dashboard.get_market_data("AAPL", "1mo")
+        
+        series = market_data['series']
+        assert set(series) == {'sma_20', 'sma_50', 'rsi'}
+        assert all(len(values) == len(sample_stock_data) for values in series.values())
+        assert series['rsi'][-1] == pytest.approx(market_data['indicators']['rsi'])
+    
+    def test_get_commentary_per_language_reuses_market_data(self, dashboard, sample_stock_data):
+        """Test that switching language only generates commentary, not data."""
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data) as mock_fetch, \
+             patch.object(dashboard.ai_generator, 'generate_commentary', return_value="Commentary.") as mock_ai:
+            
+            market_data = dashboard.get_market_data("AAPL", "1mo")
+            for language in ("en", "sv", "en"):
+                dashboard.get_commentary("AAPL", "1mo", market_data['indicators'], language)
+            
+            assert mock_fetch.call_count == 1
+            # The repeated English request is served from the commentary cache
+            assert mock_ai.call_count == 2
+
+
+class TestConcurrentAnalysis:
+    """Test concurrent multi-symbol analysis."""
+    
+    def test_get_stock_analyses_returns_results_in_symbol_order(self, dashboard, sample_stock_data):
+        """Test that concurrent analysis returns one result per symbol in order."""
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data) as mock_fetch, \
+             patch.object(dashboard.ai_generator, 'generate_commentary_async',
+                          new_callable=AsyncMock, return_value="Concurrent commentary.") as mock_ai:
+            
+            results = asyncio.run(dashboard.get_stock_analyses(["AAPL", "MSFT", "TSLA"], "1mo", "en"))
+            
+            assert [result['symbol'] for result in results] == ["AAPL", "MSFT", "TSLA"]
+            assert all(result['commentary'] == "Concurrent commentary." for result in results)
+            assert mock_fetch.call_count == 3
+            assert mock_ai.await_count == 3
+    
+    def test_async_analysis_matches_sync_result_keys(self, dashboard, sample_stock_data):
+        """Test that the sync and async paths return the same result shape."""
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data), \
+             patch.object(dashboard.ai_generator, 'generate_commentary', return_value="Commentary."), \
+             patch.object(dashboard.ai_generator, 'generate_commentary_async',
+                          new_callable=AsyncMock, return_value="Commentary."):
+            
+            sync_result = dashboard.get_stock_analysis("AAPL", "1mo", "en")
+            async_result = asyncio.run(dashboard.get_stock_analysis_async("MSFT", "1mo", "en"))
+        
+        assert set(async_result) == set(sync_result)
+        assert set(async_result['series']) == {'sma_20', 'sma_50', 'rsi'}
+    
+    def test_get_stock_analyses_isolates_failures(self, dashboard, sample_stock_data):
+        """Test that one failing symbol does not fail the whole batch."""
+        
+        def fetch(symbol, period):
+            if symbol == "FAIL":
+                raise ValueError("No data found for symbol: FAIL")
+            return sample_stock_data
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', side_effect=fetch), \
+             patch.object(dashboard.ai_generator, 'generate_commentary_async',
+                          new_callable=AsyncMock, return_value="Commentary."):
+            
+            results = asyncio.run(dashboard.get_stock_analyses(["AAPL", "FAIL"], "1mo", "en"))
+            
+            assert results[0]['symbol'] == "AAPL"
+            assert isinstance(results[1], ValueError)
+    
+    def test_get_stock_analyses_flushes_cache_writes_once(self, dashboard, sample_stock_data):
+        """Test that concurrent analysis batches its cache writes into one set_many."""
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data), \
+             patch.object(dashboard.ai_generator, 'generate_commentary_async',
+                          new_callable=AsyncMock, return_value="Batched commentary."), \
+             patch.object(dashboard.cache, 'set_many', wraps=dashboard.cache.set_many) as mock_set_many, \
+             patch.object(dashboard.cache, 'set_stock_data') as mock_set_stock, \
+             patch.object(dashboard.cache, 'set_commentary') as mock_set_commentary:
+            
+            asyncio.run(dashboard.get_stock_analyses(["AAPL", "MSFT"], "1mo", "en"))
+            
+            mock_set_many.assert_called_once()
+            mock_set_stock.assert_not_called()
+            mock_set_commentary.assert_not_called()
+            assert len(mock_set_many.call_args[1]['stock_data']) == 2
+            assert len(mock_set_many.call_args[1]['commentaries']) == 2
+        
+        assert dashboard.cache.get_stock_data("AAPL", "1mo") is not None
+    
+    def test_iter_stock_analyses_yields_every_symbol(self, dashboard, sample_stock_data):
+        """Test that streaming analysis yields each symbol once as it completes."""
+        
+        async def collect():
+            return [item async for item in dashboard.iter_stock_analyses(["AAPL", "MSFT"], "1mo", "en")]
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data), \
+             patch.object(dashboard.ai_generator, 'generate_commentary_async',
+                          new_callable=AsyncMock, return_value="Streamed commentary."):
+            
+            results = dict(asyncio.run(collect()))
+            
+            assert set(results) == {"AAPL", "MSFT"}
+            assert results["AAPL"]['commentary'] == "Streamed commentary."
+
+
+class TestPreloading:
+    """Test batched watchlist preloading."""
+    
+    def test_preload_fetches_only_uncached_symbols(self, dashboard, sample_stock_data):
+        """Test that preloading skips cached and invalid symbols and caches the rest."""
+        
+        dashboard.cache.set_stock_data("AAPL", "1mo", sample_stock_data)
+        
+        with patch.object(dashboard.data_provider, 'fetch_many',
+                          return_value={"MSFT": sample_stock_data}) as mock_fetch_many:
+            
+            count = dashboard.preload_stock_data(["AAPL", "msft", "BAD!"], "1mo")
+            
+            assert count == 1
+            mock_fetch_many.assert_called_once_with(["MSFT"], "1mo")
+        
+        # Later analysis of a preloaded symbol is served from the cache
+        with patch.object(dashboard.data_provider, 'fetch_stock_data') as mock_fetch:
+            assert dashboard._load_stock_data("MSFT", "1mo") is not None
+            mock_fetch.assert_not_called()
+    
+    def test_preload_skips_download_when_all_cached(self, dashboard, sample_stock_data):
+        """Test that a fully cached watchlist makes no network request."""
+        
+        dashboard.cache.set_stock_data("AAPL", "1mo", sample_stock_data)
+        
+        with patch.object(dashboard.data_provider, 'fetch_many') as mock_fetch_many:
+            assert dashboard.preload_stock_data(["AAPL"], "1mo") == 0
+            mock_fetch_many.assert_not_called()
+
+
+class TestIndicatorCaching:
+    """Test memoization of calculated indicators."""
+    
+    def test_indicators_reused_for_unchanged_data(self, dashboard, sample_stock_data):
+        """Test that unchanged data skips indicator recalculation."""
+        
+        with patch.object(dashboard.data_provider, 'fetch_stock_data', return_value=sample_stock_data), \
+             patch.object(dashboard.ai_generator, 'generate_commentary', return_value="Commentary."), \
+             patch.object(dashboard.calculator, 'calculate_indicators',
+                          wraps=dashboard.calculator.calculate_indicators) as mock_calc:
+            
+            result1 = dashboard.get_stock_analysis("AAPL", "1mo", "en")
+            result2 = dashboard.get_stock_analysis("AAPL", "1mo", "sv")
+            
+            assert mock_calc.call_count == 1
+            assert result1['indicators'] == result2['indicators']
+    
+    def test_indicators_recalculated_when_last_bar_changes(self, dashboard, sample_stock_data):
+        """Test that an updated last close invalidates the memoized indicators."""
+        updated_data = sample_stock_data.copy()
+        updated_data.iloc[-1, updated_data.columns.get_loc('Close')] += 5.0
+        
+        with patch.object(dashboard.calculator, 'calculate_indicators',
+                          wraps=dashboard.calculator.calculate_indicators) as mock_calc:
+            
+            first = dashboard._get_indicators("AAPL", "1mo", sample_stock_data)
+            second = dashboard._get_indicators("AAPL", "1mo", updated_data)
+            third = dashboard._get_indicators("AAPL", "3mo", sample_stock_data)
+            
+            assert mock_calc.call_count == 3
+            assert second['current_price'] == first['current_price'] + 5.0
+            assert third == first
+    
+    def test_indicator_cache_is_bounded(self, dashboard, sample_stock_data):
+        """Test that the indicator cache evicts the least recently used entry."""
+        dashboard.indicator_cache_size = 2
+        
+        for symbol in ("AAPL", "MSFT", "TSLA"):
+            dashboard._get_indicators(symbol, "1mo", sample_stock_data)
+        
+        assert len(dashboard._indicator_cache) == 2
+        assert all(key[0] != "AAPL" for key in dashboard._indicator_cache)
+    
+    def test_cached_indicators_are_returned_as_copies(self, dashboard, sample_stock_data):
+        """Test that mutating a returned indicator dict does not corrupt the cache."""
+        first = dashboard._get_indicators("AAPL", "1mo", sample_stock_data)
+        expected = dict(first)
+        first['current_price'] = -1.0
+        
+        assert dashboard._get_indicators("AAPL", "1mo", sample_stock_data) == expected
+    
+    def test_indicator_cache_survives_concurrent_access(self, dashboard, sample_stock_data):
+        """Test that concurrent lookups and evictions never raise."""
+        dashboard.indicator_cache_size = 2
+        symbols = ["AAPL", "MSFT", "TSLA", "NVDA"] * 50
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda symbol: dashboard._get_indicators(symbol, "1mo", sample_stock_data), symbols
+            ))
+        
+        assert len(results) == len(symbols)
+        assert len(dashboard._indicator_cache) == 2
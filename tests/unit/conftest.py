@@ -0,0 +1,14 @@
+"""
+Shared pytest setup for the unit tests.
+
+The Streamlit app and its components import their helpers relative to the
+streamlit/ directory (e.g. `from components import charts`), so it is put on
+sys.path once here instead of in every test module.
+"""
+
+import os
+import sys
+
+STREAMLIT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'streamlit'))
+if STREAMLIT_DIR not in sys.path:
+    sys.path.insert(0, STREAMLIT_DIR)
@@ -1,9 +1,12 @@
+import asyncio
 import pytest
 import time
 import hashlib
 import json
-from unittest.mock import Mock, patch, MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import pandas as pd
+from openai import RateLimitError
 from src.ai.commentary_generator import AICommentaryGenerator
 
 
@@ -50,7 +53,8 @@ class TestAICommentaryGenerator:
         
         assert generator.client is not None
         assert generator.min_interval == 2.0
-        assert generator.last_call_time == 0
+        assert generator.rate_limiter.rate == 0.5
+        assert generator.rate_limiter.capacity == 3
 
     def test_build_prompt_english(self, ai_generator, sample_indicators):
         """Test prompt building for English commentary"""
@@ -114,7 +118,7 @@ class TestAICommentaryGenerator:
         hash2 = ai_generator._create_content_hash("AAPL", sample_indicators, "1mo", "en")
         
         assert hash1 == hash2
-        assert len(hash1) == 32  # MD5 hash length
+        assert len(hash1) == 32  # 128-bit BLAKE2b digest
         assert isinstance(hash1, str)
 
     def test_create_content_hash_different_inputs(self, ai_generator, sample_indicators):
@@ -128,6 +132,17 @@ class TestAICommentaryGenerator:
         assert hash1 != hash3  # Different period
         assert hash1 != hash4  # Different language
 
+    def test_create_content_hash_field_boundaries(self, ai_generator, sample_indicators):
+        """Test that text fields cannot run together into the same hash"""
+        hash1 = ai_generator._create_content_hash("AB", sample_indicators, "1mo", "en")
+        hash2 = ai_generator._create_content_hash("A", sample_indicators, "B1mo", "en")
+        
+        bearish = dict(sample_indicators, trend='bearish')
+        hash3 = ai_generator._create_content_hash("AB", bearish, "1mo", "en")
+        
+        assert hash1 != hash2
+        assert hash1 != hash3  # Different trend
+
     def test_create_content_hash_rounded_values(self, ai_generator):
         """Test that hash uses rounded values for stability"""
         indicators1 = {
@@ -211,51 +226,49 @@ class TestAICommentaryGenerator:
         assert "+0.00%" in commentary  # Default value
         assert "neutral" in commentary  # Default trend
 
-    @patch('src.ai.commentary_generator.time.time')
-    def test_rate_limiting_delays_requests(self, mock_time, ai_generator, sample_indicators):
-        """Test that rate limiting enforces minimum interval between API calls"""
-        # Mock time progression: first call for elapsed calculation, second for updating last_call_time
-        mock_time.side_effect = [1001.0, 1003.0]  # 1 second elapsed, then after sleep
-        
+    def test_rate_limiting_acquires_token_per_call(self, ai_generator, sample_indicators):
+        """Test that every API call goes through the token-bucket rate limiter"""
         with patch.object(ai_generator.client.chat.completions, 'create') as mock_create, \
-             patch('src.ai.commentary_generator.time.sleep') as mock_sleep:
+             patch.object(ai_generator.rate_limiter, 'acquire') as mock_acquire:
             
             mock_create.return_value = Mock()
             mock_create.return_value.choices = [Mock()]
             mock_create.return_value.choices[0].message.content = "Test commentary"
             
-            # Set last call time to simulate previous call
-            ai_generator.last_call_time = 1000.0
-            
             ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
+            ai_generator.generate_commentary("MSFT", sample_indicators, "1mo", "en")
             
-            # Should sleep for (2.0 - 1.0) = 1.0 second
-            mock_sleep.assert_called_once_with(1.0)
+            assert mock_acquire.call_count == 2
 
-    @patch('src.ai.commentary_generator.time.time')
-    def test_rate_limiting_no_delay_when_sufficient_time_passed(self, mock_time, ai_generator, sample_indicators):
-        """Test that no delay occurs when sufficient time has passed"""
-        mock_time.return_value = 1005.0  # 5 seconds later
-        
-        with patch.object(ai_generator.client.chat.completions, 'create') as mock_create, \
-             patch('src.ai.commentary_generator.time.sleep') as mock_sleep:
-            
+    @patch('src.utils.rate_limiter.time.sleep')
+    def test_rate_limiting_allows_burst_without_delay(self, mock_sleep, ai_generator, sample_indicators):
+        """Test that calls within the burst capacity are not delayed"""
+        with patch.object(ai_generator.client.chat.completions, 'create') as mock_create:
             mock_create.return_value = Mock()
             mock_create.return_value.choices = [Mock()]
             mock_create.return_value.choices[0].message.content = "Test commentary"
             
-            ai_generator.last_call_time = 1000.0  # 5 seconds ago
-            
-            ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
+            for _ in range(3):
+                ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
             
-            # Should not sleep since 5 seconds > 2 seconds minimum interval
             mock_sleep.assert_not_called()
 
-    @patch('src.ai.commentary_generator.time.time')
-    def test_generate_commentary_successful_api_call(self, mock_time, ai_generator, sample_indicators):
-        """Test successful OpenAI API call"""
-        mock_time.return_value = 1000.0
+    def test_rate_limit_error_backs_off_and_falls_back(self, ai_generator, sample_indicators):
+        """Test that a 429 from OpenAI halves the limiter rate and returns fallback"""
+        rate_limit_error = RateLimitError(
+            "Too many requests", response=Mock(status_code=429), body=None
+        )
         
+        with patch.object(ai_generator.client.chat.completions, 'create') as mock_create:
+            mock_create.side_effect = rate_limit_error
+            
+            result = ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
+            
+            assert "AAPL is trading at $150.25" in result
+            assert ai_generator.rate_limiter.rate == 0.25
+
+    def test_generate_commentary_successful_api_call(self, ai_generator, sample_indicators):
+        """Test successful OpenAI API call"""
         with patch.object(ai_generator.client.chat.completions, 'create') as mock_create:
             mock_response = Mock()
             mock_response.choices = [Mock()]
@@ -302,22 +315,6 @@ class TestAICommentaryGenerator:
             assert "+2.50%" in result
             assert "bullish" in result
 
-    def test_generate_commentary_updates_last_call_time(self, ai_generator, sample_indicators):
-        """Test that last_call_time is updated after API call"""
-        with patch.object(ai_generator.client.chat.completions, 'create') as mock_create, \
-             patch('src.ai.commentary_generator.time.time') as mock_time:
-            
-            mock_create.return_value = Mock()
-            mock_create.return_value.choices = [Mock()]
-            mock_create.return_value.choices[0].message.content = "Test commentary"
-            mock_time.return_value = 1234.5
-            
-            initial_time = ai_generator.last_call_time
-            ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
-            
-            assert ai_generator.last_call_time == 1234.5
-            assert ai_generator.last_call_time != initial_time
-
     def test_generate_commentary_builds_correct_prompt(self, ai_generator, sample_indicators):
         """Test that generate_commentary uses the correct prompt"""
         with patch.object(ai_generator.client.chat.completions, 'create') as mock_create, \
@@ -360,3 +357,113 @@ class TestAICommentaryGenerator:
         assert "RSI: 65.2" in prompt
         assert "Trend: bullish" in prompt
         assert "Price Change: 2.50%" in prompt
+
+    def test_generate_commentary_async_successful_api_call(self, ai_generator, sample_indicators):
+        """Test successful async OpenAI API call"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "  Async commentary.  "
+        
+        with patch.object(ai_generator.async_client.chat.completions, 'create',
+                          new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = mock_response
+            
+            result = asyncio.run(
+                ai_generator.generate_commentary_async("AAPL", sample_indicators, "1mo", "en")
+            )
+            
+            assert result == "Async commentary."
+            mock_create.assert_awaited_once()
+            assert mock_create.call_args[1]['model'] == "gpt-3.5-turbo"
+
+    def test_generate_commentary_async_api_failure_fallback(self, ai_generator, sample_indicators):
+        """Test that async API failure triggers fallback commentary"""
+        with patch.object(ai_generator.async_client.chat.completions, 'create',
+                          new_callable=AsyncMock) as mock_create:
+            mock_create.side_effect = Exception("API Error")
+            
+            result = asyncio.run(
+                ai_generator.generate_commentary_async("AAPL", sample_indicators, "1mo", "en")
+            )
+            
+            assert "AAPL is trading at $150.25" in result
+
+    def test_generate_many_preserves_job_order(self, ai_generator, sample_indicators):
+        """Test that generate_many returns one commentary per job in order"""
+        jobs = [
+            ("AAPL", sample_indicators, "1mo", "en"),
+            ("MSFT", sample_indicators, "1mo", "en"),
+            ("TSLA", sample_indicators, "1mo", "sv")
+        ]
+        
+        async def fake_create(**kwargs):
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = kwargs['messages'][0]['content'].split()[0]
+            return response
+        
+        with patch.object(ai_generator, '_build_prompt', side_effect=lambda s, *a: s), \
+             patch.object(ai_generator.async_client.chat.completions, 'create',
+                          side_effect=fake_create):
+            results = asyncio.run(ai_generator.generate_many(jobs))
+        
+        assert results == ["AAPL", "MSFT", "TSLA"]
+
+    def test_generate_commentary_memoizes_successful_calls(self, ai_generator, sample_indicators):
+        """Test that identical requests are served from the in-process memo"""
+        with patch.object(ai_generator.client.chat.completions, 'create') as mock_create:
+            mock_create.return_value = Mock()
+            mock_create.return_value.choices = [Mock()]
+            mock_create.return_value.choices[0].message.content = "Memoized commentary"
+            
+            first = ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
+            second = ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
+            
+            assert first == second == "Memoized commentary"
+            mock_create.assert_called_once()
+
+    def test_generate_commentary_does_not_memoize_fallback(self, ai_generator, sample_indicators):
+        """Test that fallback commentary is not memoized so the API is retried"""
+        with patch.object(ai_generator.client.chat.completions, 'create') as mock_create:
+            mock_create.side_effect = Exception("API Error")
+            
+            ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
+            ai_generator.generate_commentary("AAPL", sample_indicators, "1mo", "en")
+            
+            assert mock_create.call_count == 2
+
+    @patch('src.ai.commentary_generator.time.monotonic')
+    def test_memo_entries_expire_after_ttl(self, mock_monotonic, ai_generator):
+        """Test that memoized commentary expires after memo_ttl"""
+        mock_monotonic.return_value = 1000.0
+        ai_generator._memo_set("hash", "Old commentary")
+        
+        assert ai_generator._memo_get("hash") == "Old commentary"
+        
+        mock_monotonic.return_value = 1000.0 + ai_generator.memo_ttl
+        assert ai_generator._memo_get("hash") is None
+
+    def test_memo_evicts_least_recently_used(self, ai_generator):
+        """Test that the memo stays bounded by memo_maxsize"""
+        ai_generator.memo_maxsize = 2
+        ai_generator._memo_set("a", "A")
+        ai_generator._memo_set("b", "B")
+        ai_generator._memo_get("a")  # Touch 'a' so 'b' is the oldest
+        ai_generator._memo_set("c", "C")
+        
+        assert ai_generator._memo_get("b") is None
+        assert ai_generator._memo_get("a") == "A"
+        assert ai_generator._memo_get("c") == "C"
+    
+    def test_memo_survives_concurrent_access(self, ai_generator):
+        """Test that concurrent lookups and evictions never raise"""
+        ai_generator.memo_maxsize = 4
+        
+        def churn(i):
+            ai_generator._memo_set(f"hash{i % 8}", f"Commentary {i}")
+            return ai_generator._memo_get(f"hash{(i + 1) % 8}")
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(2000)))
+        
+        assert len(ai_generator._memo) <= 4
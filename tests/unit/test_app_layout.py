@@ -0,0 +1,95 @@
+"""
+Unit tests for the Streamlit app layout functions.
+
+Rendering components are mocked so only the layout wiring is exercised.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import app
+
+
+class TestMobileLayout:
+    """Test suite for rendering MOBILE_LAYOUT"""
+    
+    @pytest.fixture
+    def display_prefs(self):
+        """Show only the AI commentary section"""
+        return {
+            'show_technical_indicators': False,
+            'show_metrics_analysis': False,
+            'show_price_charts': False,
+            'show_ai_commentary': True,
+            'show_technical_summary': False
+        }
+    
+    def test_ai_commentary_rendered_once(self, display_prefs):
+        """Test that the mobile layout renders AI commentary exactly once"""
+        with patch.object(app, 'render_ai_commentary') as mock_commentary, \
+             patch.object(app.st, 'markdown'):
+            app.render_layout(app.MOBILE_LAYOUT, None, {}, "Commentary.", {}, display_prefs)
+        
+        mock_commentary.assert_called_once_with("Commentary.", show_title=False)
+
+class TestLayoutDefinitions:
+    """Test suite for the desktop and mobile section tables"""
+    
+    @staticmethod
+    def _section_names(layout):
+        return sorted(name for _, columns in layout for items in columns for name, _ in items)
+    
+    def test_layouts_render_each_section_once(self):
+        """Test that both layouts contain every section exactly once"""
+        expected = sorted(app.SECTIONS)
+        
+        assert self._section_names(app.DESKTOP_LAYOUT) == expected
+        assert self._section_names(app.MOBILE_LAYOUT) == expected
+    
+    def test_disabled_sections_are_skipped(self):
+        """Test that display preferences and missing data hide sections"""
+        context = {'indicators': {}, 'commentary': ''}
+        
+        assert not app._section_enabled('rsi_gauge', context, {})
+        assert not app._section_enabled('ai_commentary', context, {})
+        assert not app._section_enabled('summary', context, {'show_technical_summary': False})
+        assert app._section_enabled('key_metrics', context, {})
+
+
+class TestChartFigures:
+    """Test suite for build_chart_figures"""
+    
+    def test_missing_series_are_computed_on_the_script_thread(self):
+        """Test that the cached series fallback runs before the worker threads"""
+        series = {'sma_20': None, 'sma_50': None, 'rsi': None}
+        with patch.object(app, 'chart_series', return_value=series) as mock_series, \
+             patch.object(app, 'build_price_chart_figure') as mock_price:
+            app.build_chart_figures("data", {}, {'show_technical_indicators': False})
+        
+        mock_series.assert_called_once_with("data")
+        mock_price.assert_called_once_with("data", {}, series)
+    
+    def test_hidden_charts_compute_nothing(self):
+        """Test that no series are computed when every chart is hidden"""
+        prefs = {'show_price_charts': False, 'show_technical_indicators': False}
+        with patch.object(app, 'chart_series') as mock_series:
+            assert app.build_chart_figures("data", {'rsi': 50.0}, prefs) == {}
+        
+        mock_series.assert_not_called()
+
+
+class TestPopularStocksPreload:
+    """Test suite for the background popular-stock preload"""
+    
+    def test_preload_runs_off_the_script_thread(self):
+        """Test that the preload warms every popular symbol on its own thread"""
+        dashboard = MagicMock()
+        dashboard.preload_stock_data.side_effect = Exception("Network error")
+        
+        thread = app.start_popular_stocks_preload.__wrapped__(dashboard, "3mo")
+        thread.join(timeout=5)
+        
+        assert thread.daemon and not thread.is_alive()
+        symbols = [symbol for group in app.POPULAR_STOCKS.values() for symbol in group]
+        dashboard.preload_stock_data.assert_called_once_with(symbols, "3mo")
@@ -0,0 +1,239 @@
+"""
+Unit tests for the chart components' cached series helpers.
+"""
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from components import charts
+from src.analysis.technical_calculator import TechnicalCalculator
+
+
+class TestCachedSeries:
+    """Test suite for sma_series_values and rsi_series_values"""
+    
+    def setup_method(self):
+        """Create a deterministic close price array"""
+        self.close = np.cumsum(np.random.default_rng(1).normal(0, 1, 120)) + 100
+    
+    def test_sma_matches_pandas_rolling(self):
+        """Test that the cached SMA equals a pandas rolling mean"""
+        expected = pd.Series(self.close).rolling(window=20).mean().to_numpy()
+        
+        np.testing.assert_allclose(charts.sma_series_values(self.close, 20), expected, equal_nan=True)
+    
+    def test_rsi_matches_backend_series(self):
+        """Test that the cached RSI equals the backend Wilder series"""
+        expected = TechnicalCalculator.calculate_rsi_series(pd.Series(self.close), window=14).to_numpy()
+        
+        np.testing.assert_allclose(charts.rsi_series_values(self.close, 14), expected, equal_nan=True)
+    
+    def test_repeat_calls_are_served_from_cache(self):
+        """Test that identical inputs return the cached result"""
+        charts.sma_series_values.clear()
+        
+        with patch.object(TechnicalCalculator, 'calculate_sma_series',
+                          wraps=TechnicalCalculator.calculate_sma_series) as mock_sma:
+            first = charts.sma_series_values(self.close, 50)
+            second = charts.sma_series_values(self.close.copy(), 50)
+        
+        assert mock_sma.call_count == 1
+        np.testing.assert_array_equal(first, second)
+    
+    def test_precomputed_series_skip_recalculation(self):
+        """Test that backend series are plotted without recomputing them"""
+        data = pd.DataFrame({
+            'Open': self.close, 'High': self.close + 1, 'Low': self.close - 1,
+            'Close': self.close, 'Volume': np.full(len(self.close), 1_000)
+        }, index=pd.date_range('2024-01-01', periods=len(self.close), freq='D'))
+        series = {
+            'sma_20': np.full(len(self.close), 101.0),
+            'sma_50': np.full(len(self.close), 102.0),
+            'rsi': np.full(len(self.close), 55.0)
+        }
+        
+        with patch.object(TechnicalCalculator, 'calculate_sma_series') as mock_sma, \
+             patch.object(TechnicalCalculator, 'calculate_rsi_series') as mock_rsi:
+            price_fig = charts.build_price_chart_figure(data, {'sma_20': 1.0, 'sma_50': 1.0}, series)
+            rsi_fig = charts.build_indicators_chart_figure({'rsi': 55.0}, data, series)
+        
+        mock_sma.assert_not_called()
+        mock_rsi.assert_not_called()
+        sma_20 = next(trace for trace in price_fig.data if trace.name == 'SMA 20')
+        assert sma_20.y[-1] == 101.0
+        assert rsi_fig.data[0].y[-1] == 55.0
+    
+    def test_builders_never_use_streamlit_cache(self):
+        """Test that the off-thread builders fall back to the pure helpers"""
+        data = pd.DataFrame({
+            'Open': self.close, 'High': self.close + 1, 'Low': self.close - 1,
+            'Close': self.close, 'Volume': np.full(len(self.close), 1_000)
+        }, index=pd.date_range('2024-01-01', periods=len(self.close), freq='D'))
+        
+        with patch.object(charts, 'sma_series_values', side_effect=AssertionError), \
+             patch.object(charts, 'rsi_series_values', side_effect=AssertionError):
+            price_fig = charts.build_price_chart_figure(data, {'sma_20': 1.0, 'sma_50': 1.0})
+            rsi_fig = charts.build_indicators_chart_figure({'rsi': 55.0}, data)
+        
+        assert {trace.name for trace in price_fig.data} >= {'SMA 20', 'SMA 50'}
+        assert rsi_fig is not None
+    
+    def test_chart_series_matches_backend_series(self):
+        """Test that the script-thread fallback returns every plotted series"""
+        data = pd.DataFrame({'Close': self.close})
+        
+        series = charts.chart_series(data)
+        
+        assert set(series) == {'sma_20', 'sma_50', 'rsi'}
+        np.testing.assert_allclose(series['rsi'], charts.rsi_series_values(self.close, 14), equal_nan=True)
+
+
+class TestImportCost:
+    """Test suite for the charts module's import-time dependencies"""
+    
+    def test_import_defers_technical_calculator(self):
+        """Test that importing the charts does not load the numba-backed calculator"""
+        code = (
+            "import sys; sys.path[:0] = [sys.argv[1], sys.argv[2]]; "
+            "import components.charts; "
+            "print('src.analysis.technical_calculator' in sys.modules)"
+        )
+        streamlit_dir = os.path.dirname(os.path.dirname(charts.__file__))
+        result = subprocess.run([sys.executable, "-c", code, streamlit_dir, os.path.dirname(streamlit_dir)],
+                                capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == "False"
+
+
+class TestDownsampleOhlcv:
+    """Test suite for downsample_ohlcv"""
+    
+    def setup_method(self):
+        """Create a long OHLCV frame"""
+        rng = np.random.default_rng(2)
+        close = np.cumsum(rng.normal(0, 1, 2500)) + 200
+        self.data = pd.DataFrame({
+            'Open': close + rng.normal(0, 0.5, 2500),
+            'High': close + 2,
+            'Low': close - 2,
+            'Close': close,
+            'Volume': rng.integers(1_000, 10_000, 2500)
+        }, index=pd.date_range('2015-01-01', periods=2500, freq='D'))
+    
+    def test_short_series_unchanged(self):
+        """Test that series within the limit are returned as-is"""
+        result, ends = charts.downsample_ohlcv(self.data.head(100), 1000)
+        
+        assert result is not None and len(result) == 100
+        assert ends is None
+    
+    def test_buckets_preserve_extremes_and_totals(self):
+        """Test that aggregation keeps range, closing price and volume"""
+        result, ends = charts.downsample_ohlcv(self.data, 1000)
+        
+        assert len(result) <= 1000
+        assert len(ends) == len(result)
+        assert result['High'].max() == self.data['High'].max()
+        assert result['Low'].min() == self.data['Low'].min()
+        assert result['Volume'].sum() == self.data['Volume'].sum()
+        assert result['Open'].iloc[0] == self.data['Open'].iloc[0]
+        assert result['Close'].iloc[-1] == self.data['Close'].iloc[-1]
+        assert ends[-1] == len(self.data) - 1
+    
+    def test_price_figure_payload_is_bounded(self):
+        """Test that the price chart never sends more than max_data_points bars"""
+        fig = charts.build_price_chart_figure(self.data, {'sma_20': 1.0, 'sma_50': 1.0})
+        
+        limit = charts.PERFORMANCE['max_data_points']
+        assert all(len(trace.x) <= limit for trace in fig.data)
+    
+    def test_downsampled_lines_share_candle_x(self):
+        """Test that moving averages are plotted at the same x as their candles"""
+        fig = charts.build_price_chart_figure(self.data, {'sma_20': 1.0, 'sma_50': 1.0})
+        
+        candles = next(trace for trace in fig.data if trace.name == 'Price')
+        for name in ('SMA 20', 'SMA 50'):
+            line = next(trace for trace in fig.data if trace.name == name)
+            assert list(line.x) == list(candles.x)
+    
+    def test_volume_colors_follow_candle_direction(self):
+        """Test that volume bars are green on up days and red on down days"""
+        data = self.data.head(3).copy()
+        data['Open'] = [10.0, 12.0, 11.0]
+        data['Close'] = [11.0, 11.0, 11.0]
+        
+        fig = charts.build_price_chart_figure(data, {})
+        volume = next(trace for trace in fig.data if trace.name == "Volume")
+        
+        assert list(volume.marker.color) == ['#00D4AA', '#FF6B6B', '#00D4AA']
+
+
+class TestPricePerformanceChart:
+    """Test suite for create_price_performance_chart"""
+    
+    @patch.object(charts, 'st')
+    def test_performance_is_percent_change_from_first_close(self, mock_st):
+        """Test that the plotted line is the percent change from the first close"""
+        data = pd.DataFrame(
+            {'Close': [50.0, 55.0, 45.0, 60.0]},
+            index=pd.date_range('2024-01-01', periods=4, freq='D')
+        )
+        
+        charts.create_price_performance_chart(data, "1 Month")
+        
+        fig = mock_st.plotly_chart.call_args[0][0]
+        np.testing.assert_allclose(fig.data[0].y, [0.0, 10.0, -10.0, 20.0])
+        assert fig.data[0].line.color == charts.COLORS['success']
+        mock_st.error.assert_not_called()
+    
+    @patch.object(charts, 'st')
+    def test_line_traces_use_webgl(self, mock_st):
+        """Test that the RSI and performance lines are WebGL traces"""
+        data = pd.DataFrame(
+            {'Close': np.linspace(100.0, 120.0, 40) + np.sin(np.arange(40))},
+            index=pd.date_range('2024-01-01', periods=40, freq='D')
+        )
+        
+        rsi_fig = charts.build_indicators_chart_figure({'rsi': 55.0}, data)
+        
+        assert rsi_fig.data[0].type == 'scattergl'
+        
+        charts.create_price_performance_chart(data, "1 Month")
+        
+        assert mock_st.plotly_chart.call_args[0][0].data[0].type == 'scattergl'
+
+
+class TestMiniChart:
+    """Test suite for create_mini_chart"""
+    
+    def test_mini_chart_uses_compact_numeric_arrays(self):
+        """Test that the mini chart plots NumPy arrays rather than Python lists"""
+        fig = charts.create_mini_chart(pd.Series([1.5, 2.5, 2.0]), title="Trend")
+        trace = fig.data[0]
+        
+        assert isinstance(trace.x, np.ndarray) and trace.x.dtype == np.int32
+        np.testing.assert_array_equal(trace.x, [0, 1, 2])
+        assert trace.y.dtype == np.float32
+        np.testing.assert_allclose(trace.y, [1.5, 2.5, 2.0])
+    
+    def test_empty_data_returns_none(self):
+        """Test that no figure is built for empty data"""
+        assert charts.create_mini_chart([]) is None
+
+
+class TestIndicatorsChart:
+    """Test suite for build_indicators_chart_figure"""
+    
+    def test_short_history_has_no_rsi_chart(self):
+        """Test that data too short for a single RSI value builds no figure"""
+        data = pd.DataFrame(
+            {'Close': np.linspace(100.0, 110.0, 14)},
+            index=pd.date_range('2024-01-01', periods=14, freq='D')
+        )
+        
+        assert charts.build_indicators_chart_figure({'rsi': 50.0}, data) is None
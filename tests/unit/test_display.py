@@ -0,0 +1,195 @@
+"""
+Unit tests for the display components.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from components import display
+
+
+class TestRenderAiCommentary:
+    """Test suite for render_ai_commentary"""
+    
+    @patch.object(display, 'st')
+    def test_commentary_is_rendered_in_one_element(self, mock_st):
+        """Test that the styled wrapper and text are emitted in a single markdown call"""
+        display.render_ai_commentary("**Bullish** momentum.", show_title=False)
+        
+        mock_st.markdown.assert_called_once()
+        body = mock_st.markdown.call_args[0][0]
+        assert body.startswith(display._COMMENTARY_OPEN)
+        assert "\n\n**Bullish** momentum.\n\n</div>" in body
+        mock_st.error.assert_not_called()
+    
+    @patch.object(display, 'st')
+    def test_commentary_html_is_escaped(self, mock_st):
+        """Test that HTML in the generated text is not rendered as markup"""
+        display.render_ai_commentary("<script>alert(1)</script>", show_title=False)
+        
+        body = mock_st.markdown.call_args[0][0]
+        assert "<script>" not in body
+        assert "&lt;script&gt;" in body
+
+
+class TestTechnicalSummaryFrame:
+    """Test suite for technical_summary_frame"""
+    
+    def test_rows_only_for_available_values(self):
+        """Test that missing indicators are left out of the table"""
+        df = display.technical_summary_frame(150.0, 148.0, None, 75.0, 'bullish', None, 1.25, None)
+        
+        assert list(df['Indicator']) == ['💰 Current Price', '📈 SMA 20', '📉 RSI', '📈 Trend', '📊 1-Day Change']
+        assert df.loc[2, 'Description'] == 'Relative Strength Index (Overbought)'
+        assert df.loc[4, 'Value'] == '+1.25%'
+    
+    def test_no_values_gives_empty_frame(self):
+        """Test that an all-missing input yields an empty table with the usual columns"""
+        df = display.technical_summary_frame(None, None, None, None, 'Unknown', None, None, None)
+        
+        assert df.empty
+        assert list(df.columns) == ['Indicator', 'Value', 'Description']
+    
+    @patch.object(display, 'technical_summary_frame', wraps=display.technical_summary_frame)
+    @patch.object(display, 'st')
+    def test_render_passes_scalar_indicator_values(self, mock_st, mock_frame):
+        """Test that the renderer keys the cached table on scalar values"""
+        indicators = {
+            'current_price': 150.0, 'sma_20': 148.0, 'sma_50': 145.0, 'rsi': 55.0,
+            'trend': 'neutral', 'volume_avg': 1_000_000.0,
+            'price_change_1d': {'amount': 1.0, 'percent': 0.5},
+            'price_change_5d': {'amount': 2.0, 'percent': 1.5}
+        }
+        
+        display.render_technical_summary(indicators)
+        
+        mock_frame.assert_called_once_with(150.0, 148.0, 145.0, 55.0, 'neutral', 1_000_000.0, 0.5, 1.5)
+        mock_st.dataframe.assert_called_once()
+        mock_st.error.assert_not_called()
+    
+    def test_stripe_rows_shades_every_other_row(self):
+        """Test that the stripe styles cover every cell of alternate rows"""
+        df = display.technical_summary_frame(150.0, 148.0, 145.0, None, 'Unknown', None, None, None)
+        
+        styles = display._stripe_rows(df)
+        
+        assert styles.shape == df.shape
+        assert (styles.iloc[[0, 2]] == 'background-color: #f0f2f6').all().all()
+        assert (styles.iloc[1] == '').all()
+        # The styler accepts the frame of styles as-is
+        df.style.apply(display._stripe_rows, axis=None).to_html()
+
+
+class TestTimeAgoString:
+    """Test suite for get_time_ago_string"""
+    
+    def setup_method(self):
+        """Fix the reference clock"""
+        self.now = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+    
+    def test_units_and_pluralization(self):
+        """Test that each range picks the right unit and plural form"""
+        cases = {
+            timedelta(seconds=1): "1 second ago",
+            timedelta(seconds=45): "45 seconds ago",
+            timedelta(minutes=1, seconds=5): "1 minute ago",
+            timedelta(hours=3): "3 hours ago",
+            timedelta(days=2, hours=5): "2 days ago",
+        }
+        
+        for delta, expected in cases.items():
+            assert display.get_time_ago_string(self.now - delta, now=self.now) == expected
+    
+    def test_naive_timestamp_is_treated_as_utc(self):
+        """Test that naive timestamps are compared as UTC"""
+        naive = datetime(2024, 6, 1, 11, 0, 0)
+        
+        assert display.get_time_ago_string(naive, now=self.now) == "1 hour ago"
+    
+    def test_invalid_timestamp_falls_back(self):
+        """Test that an unusable timestamp yields a generic label"""
+        assert display.get_time_ago_string("not a datetime", now=self.now) == "Recently"
+
+
+class TestMetricCard:
+    """Test suite for create_metric_card"""
+    
+    @patch.object(display, 'st')
+    def test_numeric_values_are_scaled(self, mock_st):
+        """Test that numbers are shown raw, in thousands or in millions"""
+        cases = [(999.5, "999.50"), (1_000, "1.0K"), (-25_400, "-25.4K"), (2_500_000, "2.50M")]
+        
+        for value, expected in cases:
+            display.create_metric_card("Metric", value)
+            assert mock_st.metric.call_args.kwargs['value'] == expected
+    
+    @patch.object(display, 'st')
+    def test_non_numeric_values_pass_through(self, mock_st):
+        """Test that strings are shown unchanged with the delta"""
+        display.create_metric_card("Trend", "Bullish", delta="+1%")
+        
+        mock_st.metric.assert_called_once_with(label="Trend", value="Bullish", delta="+1%")
+
+
+class TestMarketStatus:
+    """Test suite for render_market_status"""
+    
+    @patch.object(display, 'st')
+    def test_bullish_signals(self, mock_st):
+        """Test that a bullish setup shows the trend, RSI and MA signals"""
+        mock_st.columns.return_value = (mock_st, mock_st)
+        indicators = {'trend': 'Bullish', 'rsi': 75.0, 'current_price': 110.0, 'sma_20': 105.0, 'sma_50': 100.0}
+        
+        display.render_market_status(indicators)
+        
+        mock_st.success.assert_called_once_with("📈 **Bullish Trend**")
+        mock_st.markdown.assert_called_once()
+        signal = mock_st.markdown.call_args[0][0]
+        assert "Moving Average Analysis" in signal
+        assert "Strong bullish signal: Price &gt; SMA20 &gt; SMA50" in signal
+        assert display.COLORS['success'] in signal
+        mock_st.warning.assert_called_once_with("⚠️ **Overbought** (RSI: 75.0)")
+        mock_st.error.assert_not_called()
+
+
+class TestDataInfo:
+    """Test suite for render_data_info"""
+    
+    @patch.object(display, 'st')
+    def test_info_is_one_markdown_grid(self, mock_st):
+        """Test that symbol, period and timestamp render as a single escaped grid"""
+        analysis = {'symbol': 'AAPL', 'period': '1mo', 'last_updated': '2024-06-01 12:00:00+00:00', 'data': None}
+        
+        display.render_data_info(analysis)
+        
+        mock_st.metric.assert_not_called()
+        mock_st.markdown.assert_called_once()
+        grid = mock_st.markdown.call_args[0][0]
+        assert 'AAPL' in grid and '1MO' in grid and '2024-06-01 12:00:00<' in grid
+        mock_st.warning.assert_called_once_with("⚠️ Limited data available")
+
+
+class TestLastUpdatedTimestamp:
+    """Test suite for render_last_updated_timestamp"""
+    
+    def setup_method(self):
+        """Start each test with an empty parse cache"""
+        display._parse_iso_timestamp.cache_clear()
+    
+    @patch.object(display, 'st')
+    def test_repeated_timestamp_is_parsed_once(self, mock_st):
+        """Test that reruns with the same string reuse the parsed datetime"""
+        for _ in range(3):
+            display.render_last_updated_timestamp(analysis_data={'last_updated': '2024-06-01T12:00:00Z'})
+        
+        info = display._parse_iso_timestamp.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+        assert '2024-06-01 12:00:00 UTC' in mock_st.markdown.call_args[0][0]
+    
+    @patch.object(display, 'st')
+    def test_unparseable_timestamp_falls_back_to_now(self, mock_st):
+        """Test that a malformed string still renders a timestamp"""
+        display.render_last_updated_timestamp(timestamp='yesterday')
+        
+        mock_st.markdown.assert_called_once()
+        mock_st.caption.assert_not_called()
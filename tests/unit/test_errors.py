@@ -0,0 +1,113 @@
+"""
+Unit tests for the error handling components.
+"""
+
+from unittest.mock import patch
+
+from components import errors
+
+
+class TestValidateAndSuggestSymbol:
+    """Test suite for validate_and_suggest_symbol"""
+    
+    def test_valid_symbols_are_accepted_case_insensitively(self):
+        """Test that 1-5 letters pass regardless of case"""
+        for symbol in ("A", "aapl", "GOOGL"):
+            assert errors.validate_and_suggest_symbol(symbol)['valid'] is True
+    
+    def test_malformed_symbols_are_rejected(self):
+        """Test that digits, long symbols and trailing newlines fail"""
+        for symbol in ("AAPL1", "TOOLONG", "AAPL\n", "BRK.B", "ÅBC"):
+            result = errors.validate_and_suggest_symbol(symbol)
+            assert result['valid'] is False
+            assert result['suggestions']
+    
+    def test_empty_symbol_prompts_for_input(self):
+        """Test that an empty symbol asks the user to enter one"""
+        assert errors.validate_and_suggest_symbol("")['message'] == 'Please enter a stock symbol'
+
+
+class TestClassifyError:
+    """Test suite for classify_error"""
+    
+    def test_each_category_is_recognised(self):
+        """Test that a keyword from every category maps to its key"""
+        cases = {
+            "No data found for XYZ": 'invalid_symbol',
+            "Invalid API key provided": 'api_error',
+            "Connection reset by peer": 'network_error',
+            "429 Too Many Requests": 'rate_limit',
+            "Request timed out": 'timeout',
+            "Insufficient data for analysis": 'insufficient_data',
+            "Something odd happened": 'generic',
+        }
+        
+        for message, expected in cases.items():
+            assert errors.classify_error(message, 'Exception') == expected
+    
+    def test_earlier_category_wins(self):
+        """Test that priority order is kept when several categories match"""
+        assert errors.classify_error("Symbol lookup timed out", 'Exception') == 'invalid_symbol'
+    
+    def test_repeated_errors_are_memoized(self):
+        """Test that an identical error is classified from the cache"""
+        errors.classify_error.cache_clear()
+        
+        for _ in range(3):
+            errors.classify_error("Request timed out", 'TimeoutError')
+        
+        info = errors.classify_error.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+
+class TestSuggestions:
+    """Test suite for the suggestion rendering helpers"""
+    
+    @patch.object(errors, 'st')
+    def test_suggestions_render_as_one_info_box(self, mock_st):
+        """Test that every suggestion ends up in a single bullet list"""
+        errors.display_error_card("Oops", "Something failed", ["Retry", "Check symbol"])
+        
+        mock_st.info.assert_called_once_with("💡 **What you can try:**\n\n- Retry\n- Check symbol")
+    
+    @patch.object(errors, 'st')
+    def test_insufficient_data_adds_specific_suggestions(self, mock_st):
+        """Test that config and symbol-specific suggestions share one box"""
+        errors.handle_insufficient_data_error("AAPL", "1d")
+        
+        mock_st.info.assert_called_once()
+        body = mock_st.info.call_args[0][0]
+        assert body.startswith("💡 **Suggestions:**\n\n- ")
+        assert body.endswith("- Some symbols may have limited historical data")
+
+
+class TestStaticPanels:
+    """Test suite for the static information panels"""
+    
+    @patch.object(errors, 'st')
+    def test_no_data_message_is_one_element(self, mock_st):
+        """Test that the welcome panel is emitted in a single call"""
+        errors.show_no_data_message()
+        
+        mock_st.info.assert_called_once_with(errors._NO_DATA_MD)
+        mock_st.markdown.assert_not_called()
+    
+    @patch.object(errors, 'st')
+    def test_status_panels_are_one_element_each(self, mock_st):
+        """Test that the demo and API status panels each emit one element"""
+        errors.show_demo_mode_info()
+        errors.show_api_status_warning()
+        
+        mock_st.info.assert_called_once_with(errors._DEMO_MODE_MD)
+        mock_st.warning.assert_called_once_with(errors._API_STATUS_MD)
+    
+    @patch.object(errors, 'st')
+    def test_error_card_uses_type_styling(self, mock_st):
+        """Test that the card is styled by type and unknown types fall back to info"""
+        errors.display_error_card("Slow", "Data delayed", error_type="warning")
+        errors.display_error_card("Note", "Heads up", error_type="other")
+        
+        warning_card, info_card = (call.args[0] for call in mock_st.markdown.call_args_list)
+        assert errors.COLORS['warning'] in warning_card and "⚠️ Slow" in warning_card
+        assert "Data delayed" in warning_card
+        assert errors.COLORS['primary'] in info_card and "ℹ️ Note" in info_card
@@ -0,0 +1,38 @@
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from src.utils import jit
+from src.analysis import technical_calculator as tc
+from src.analysis.technical_calculator import TechnicalCalculator
+
+
+class TestNjitFallback:
+    """Test suite for the optional numba decorator"""
+
+    @patch.object(jit, 'NUMBA_AVAILABLE', False)
+    def test_bare_decorator_returns_function_unchanged(self):
+        """Test that @njit without numba leaves the function as plain Python"""
+        def kernel(x):
+            return x * 2
+
+        assert jit.njit(kernel) is kernel
+
+    @patch.object(jit, 'NUMBA_AVAILABLE', False)
+    def test_parameterized_decorator_returns_function_unchanged(self):
+        """Test that @njit(cache=True) without numba leaves the function unchanged"""
+        def kernel(x):
+            return x * 2
+
+        assert jit.njit(cache=True)(kernel) is kernel
+
+    def test_python_kernels_match_compiled_results(self):
+        """Test that the pure-Python kernel path agrees with the compiled one"""
+        prices = np.cumsum(np.random.default_rng(0).normal(0, 1, 300)) + 100
+        compiled = TechnicalCalculator._rsi_tail(prices, 14)
+
+        python_avgs = getattr(tc._wilder_averages, 'py_func', tc._wilder_averages)
+        python_rsi = getattr(tc._rsi_from_averages, 'py_func', tc._rsi_from_averages)
+        avg_gain, avg_loss = python_avgs(prices[-tc.RSI_LOOKBACK:], 14)
+
+        assert python_rsi(avg_gain, avg_loss) == pytest.approx(compiled)
@@ -0,0 +1,94 @@
+"""
+Unit tests for the metrics components.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from components import metrics
+
+
+class TestPriceAndTradingMetrics:
+    """Test suite for render_price_metrics and render_trading_metrics"""
+    
+    def setup_method(self):
+        """Create OHLCV data whose last bar is easy to check"""
+        self.data = pd.DataFrame({
+            'Open': np.linspace(100.0, 120.0, 30),
+            'High': np.linspace(101.0, 125.0, 30),
+            'Low': np.linspace(99.0, 118.0, 30),
+            'Close': np.linspace(100.5, 121.0, 30),
+            'Volume': np.full(30, 1_000_000)
+        }, index=pd.date_range('2024-01-01', periods=30, freq='D'))
+        self.data.loc[self.data.index[-1], 'Volume'] = 2_000_000
+    
+    @patch.object(metrics, 'st')
+    def test_price_metrics_show_latest_bar(self, mock_st):
+        """Test that the four price metrics come from the last row"""
+        mock_st.columns.return_value = (mock_st,) * 4
+        
+        metrics.render_price_metrics(self.data, show_title=False)
+        
+        values = [call.kwargs['value'] for call in mock_st.metric.call_args_list]
+        assert values == [
+            metrics.format_currency(125.0), metrics.format_currency(118.0),
+            metrics.format_currency(120.0), metrics.format_currency(121.0)
+        ]
+        mock_st.error.assert_not_called()
+    
+    @patch.object(metrics, 'st')
+    def test_trading_metrics_compare_volume_to_20_day_mean(self, mock_st):
+        """Test volume, volume-vs-average and range from the tail of the data"""
+        mock_st.columns.return_value = (mock_st,) * 3
+        
+        metrics.render_trading_metrics(self.data)
+        
+        volume, vs_avg, price_range = mock_st.metric.call_args_list
+        assert volume.kwargs['value'] == metrics.format_volume(2_000_000)
+        # The 20-bar mean is 1.05M, so today's volume is ~90% above it
+        assert vs_avg.kwargs['value'] == metrics.format_percentage((2_000_000 - 1_050_000) / 1_050_000)
+        assert price_range.kwargs['value'] == metrics.format_currency(7.0)
+        mock_st.error.assert_not_called()
+
+
+class TestKeyMetrics:
+    """Test suite for render_key_metrics and key_metric_values"""
+    
+    def test_values_are_formatted_per_metric(self):
+        """Test the primary and additional metric formatting"""
+        (price, volume, rsi), additional = metrics.key_metric_values(
+            150.0, 1.5, 1.0, 2_500_000.0, 75.0, 148.0, 145.0, -2.25
+        )
+        
+        assert price == {'label': "💰 Current Price", 'value': metrics.format_currency(150.0),
+                         'delta': "+1.50 (+1.00%)"}
+        assert volume['value'] == metrics.format_volume(2_500_000.0)
+        assert rsi['label'] == "📉 RSI (Overbought)" and rsi['value'] == "75.0"
+        assert additional == [("📈 SMA 20", metrics.format_currency(148.0)),
+                              ("📊 SMA 50", metrics.format_currency(145.0)),
+                              ("📈 5-Day Change", "-2.25%")]
+    
+    def test_missing_values_are_skipped(self):
+        """Test that unavailable indicators produce no metric"""
+        primary, additional = metrics.key_metric_values(None, 0, 0, None, None, None, None, None)
+        
+        assert primary == (None, None, None)
+        assert additional == []
+    
+    @patch.object(metrics, 'st')
+    def test_render_emits_one_metric_per_value(self, mock_st):
+        """Test that the renderer lays out the cached metrics"""
+        mock_st.columns.side_effect = lambda n: (mock_st,) * n
+        indicators = {
+            'current_price': 150.0, 'price_change_1d': {'amount': 0.0, 'percent': 0.0},
+            'volume_avg': 1_000.0, 'rsi': 50.0, 'sma_20': 149.0, 'sma_50': 148.0,
+            'price_change_5d': {'amount': 1.0, 'percent': 0.7}
+        }
+        
+        metrics.render_key_metrics(indicators, show_title=False)
+        
+        assert mock_st.metric.call_count == 6
+        assert mock_st.metric.call_args_list[0].kwargs['delta'] is None
+        mock_st.error.assert_not_called()
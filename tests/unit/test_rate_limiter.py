@@ -0,0 +1,107 @@
+import pytest
+import asyncio
+from unittest.mock import patch
+
+from src.utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test suite for the TokenBucket rate limiter"""
+
+    def test_init_starts_full(self):
+        """Test that a new bucket starts with full burst capacity"""
+        bucket = TokenBucket(rate=2.0, capacity=3)
+
+        assert bucket.tokens == 3
+        assert bucket.rate == 2.0
+        assert bucket.max_rate == 2.0
+
+    def test_init_rejects_invalid_parameters(self):
+        """Test that non-positive rate and sub-unit capacity are rejected"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1.0, capacity=0.5)
+
+    @patch('src.utils.rate_limiter.time.monotonic')
+    def test_reserve_within_capacity_returns_no_wait(self, mock_monotonic):
+        """Test that tokens within the burst are granted immediately"""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1.0, capacity=2)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+
+    @patch('src.utils.rate_limiter.time.monotonic')
+    def test_reserve_when_empty_returns_refill_wait(self, mock_monotonic):
+        """Test that an empty bucket reports the time until the next token"""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=0.5, capacity=1)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(2.0)
+        # Second queued caller waits for the token after that
+        assert bucket.reserve() == pytest.approx(4.0)
+
+    @patch('src.utils.rate_limiter.time.monotonic')
+    def test_refill_is_capped_at_capacity(self, mock_monotonic):
+        """Test that idle time never accumulates more than capacity tokens"""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1.0, capacity=2)
+        bucket.reserve()
+
+        mock_monotonic.return_value = 1000.0
+        bucket.reserve()
+
+        assert bucket.tokens == pytest.approx(1.0)
+
+    @patch('src.utils.rate_limiter.time.sleep')
+    @patch('src.utils.rate_limiter.time.monotonic')
+    def test_acquire_sleeps_only_when_empty(self, mock_monotonic, mock_sleep):
+        """Test that acquire blocks only once the burst is spent"""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=2.0, capacity=1)
+
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(pytest.approx(0.5))
+
+    @patch('src.utils.rate_limiter.asyncio.sleep')
+    @patch('src.utils.rate_limiter.time.monotonic')
+    def test_acquire_async_awaits_refill(self, mock_monotonic, mock_sleep):
+        """Test that acquire_async awaits asyncio.sleep instead of blocking"""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1.0, capacity=1)
+
+        async def run():
+            await bucket.acquire_async()
+            await bucket.acquire_async()
+
+        asyncio.run(run())
+
+        mock_sleep.assert_awaited_once_with(pytest.approx(1.0))
+
+    def test_decrease_rate_halves_down_to_minimum(self):
+        """Test multiplicative decrease is bounded by min_rate"""
+        bucket = TokenBucket(rate=1.0, min_rate=0.3)
+
+        bucket.decrease_rate()
+        assert bucket.rate == 0.5
+
+        bucket.decrease_rate()
+        assert bucket.rate == 0.3
+
+    def test_increase_rate_is_capped_at_initial_rate(self):
+        """Test additive increase never exceeds the configured rate"""
+        bucket = TokenBucket(rate=1.0, rate_step=0.2)
+        bucket.decrease_rate()
+
+        bucket.increase_rate()
+        assert bucket.rate == pytest.approx(0.7)
+
+        for _ in range(5):
+            bucket.increase_rate()
+        assert bucket.rate == 1.0
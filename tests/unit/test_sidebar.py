@@ -0,0 +1,76 @@
+"""
+Unit tests for the sidebar controls.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from components import sidebar
+from config.ui_config import POPULAR_STOCKS
+
+
+class TestPopularStocks:
+    """Test suite for render_popular_stocks"""
+    
+    def test_layout_covers_every_popular_symbol(self):
+        """Test that the precomputed layout alternates columns per category"""
+        assert [label for label, _, _ in sidebar._POPULAR_LAYOUT] == [f"📊 {category}" for category in POPULAR_STOCKS]
+        for (_, _, buttons), symbols in zip(sidebar._POPULAR_LAYOUT, POPULAR_STOCKS.values()):
+            assert [symbol for _, symbol, _ in buttons] == list(symbols)
+            assert [column for column, _, _ in buttons] == [i % 2 for i in range(len(symbols))]
+    
+    @patch.object(sidebar, 'st')
+    def test_clicked_button_returns_its_symbol(self, mock_st):
+        """Test that the symbol of the pressed button is returned"""
+        target = next(iter(POPULAR_STOCKS.values()))[0]
+        column = MagicMock()
+        column.button.side_effect = lambda symbol, **kwargs: symbol == target
+        mock_st.sidebar.columns.return_value = (column, column)
+        mock_st.sidebar.checkbox.return_value = True
+        
+        assert sidebar.render_popular_stocks() == target
+        assert column.button.call_count == sum(len(symbols) for symbols in POPULAR_STOCKS.values())
+    
+    @patch.object(sidebar, 'st')
+    def test_collapsed_categories_skip_buttons(self, mock_st):
+        """Test that buttons are only created for the open category"""
+        second = list(POPULAR_STOCKS.values())[1]
+        mock_st.sidebar.checkbox.side_effect = [i == 1 for i in range(len(POPULAR_STOCKS))]
+        column = MagicMock()
+        column.button.return_value = False
+        mock_st.sidebar.columns.return_value = (column, column)
+        
+        assert sidebar.render_popular_stocks() is None
+        mock_st.sidebar.columns.assert_called_once_with(2)
+        assert [c.args[0] for c in column.button.call_args_list] == list(second)
+        assert [c.kwargs['key'] for c in mock_st.sidebar.checkbox.call_args_list] == [
+            f"popular_open_{category}" for category in POPULAR_STOCKS
+        ]
+
+
+class TestSelectionCallbacks:
+    """Test suite for the button callbacks that replace st.rerun()"""
+    
+    @patch.object(sidebar, 'st')
+    def test_select_symbol_updates_selection_and_input(self, mock_st):
+        """Test that a selected symbol also seeds the symbol input widget"""
+        mock_st.session_state = MagicMock()
+        
+        sidebar._select_symbol('MSFT')
+        
+        assert mock_st.session_state.symbol == 'MSFT'
+        assert mock_st.session_state.symbol_input == 'MSFT'
+        mock_st.rerun.assert_not_called()
+    
+    @patch.object(sidebar, 'st')
+    def test_popular_buttons_use_select_callback(self, mock_st):
+        """Test that popular stock buttons select through a callback"""
+        column = MagicMock()
+        column.button.return_value = False
+        mock_st.sidebar.columns.return_value = (column, column)
+        mock_st.sidebar.checkbox.return_value = True
+        
+        sidebar.render_popular_stocks()
+        
+        kwargs = column.button.call_args.kwargs
+        assert kwargs['on_click'] is sidebar._select_symbol
+        assert kwargs['args'] == (column.button.call_args.args[0],)
@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import threading
 import time
 import tempfile
 import sqlite3
@@ -63,6 +64,24 @@ class TestSimpleCache:
             with sqlite3.connect(str(db_path)) as conn:
                 cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='cache'")
                 assert cursor.fetchone() is not None
+            
+            cache.close()
+    
+    def test_file_cache_uses_persistent_wal_connection(self):
+        """Test that file-based caches keep one connection in WAL mode"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = SimpleCache(str(Path(temp_dir) / 'cache.db'))
+            connection = cache._connection
+            
+            assert connection is not None
+            journal_mode = connection.execute('PRAGMA journal_mode').fetchone()[0]
+            assert journal_mode.lower() == 'wal'
+            
+            cache.set_commentary('hash', 'commentary')
+            assert cache.get_commentary('hash') == 'commentary'
+            assert cache._connection is connection
+            
+            cache.close()
     
     def test_stock_data_storage_and_retrieval(self, test_cache, sample_stock_data):
         """Test storing and retrieving stock data"""
@@ -118,6 +137,14 @@ class TestSimpleCache:
             assert retrieved_data is not None
             pd.testing.assert_frame_equal(retrieved_data, sample_stock_data, check_freq=False, check_dtype=False)
     
+    def test_explicit_now_is_used_for_freshness(self, test_cache, sample_stock_data):
+        """Test that a caller-supplied clock reading drives the age check"""
+        test_cache.set_commentary('hash', 'Commentary')
+        stored_at = time.time()
+        
+        assert test_cache.get_commentary('hash', max_age_hours=1, now=stored_at + 1800) == 'Commentary'
+        assert test_cache.get_commentary('hash', max_age_hours=1, now=stored_at + 7200) is None
+    
     def test_commentary_storage_and_retrieval(self, test_cache):
         """Test storing and retrieving AI commentary"""
         content_hash = 'test_hash_123'
@@ -240,6 +267,97 @@ class TestSimpleCache:
                 cursor = conn.execute('SELECT data FROM cache WHERE key = ?', (old_key,))
                 assert cursor.fetchone() is None
     
+    def test_set_many_stores_stock_data_and_commentary(self, test_cache, sample_stock_data):
+        """Test batched writes are readable through the regular getters"""
+        test_cache.set_many(
+            stock_data=[('AAPL', '1mo', sample_stock_data), ('MSFT', '1mo', sample_stock_data)],
+            commentaries=[('hash1', 'First commentary'), ('hash2', 'Second commentary')]
+        )
+        
+        assert test_cache.get_stock_data('AAPL', '1mo') is not None
+        assert test_cache.get_stock_data('MSFT', '1mo') is not None
+        assert test_cache.get_commentary('hash1') == 'First commentary'
+        assert test_cache.get_commentary('hash2') == 'Second commentary'
+    
+    def test_set_many_rolls_back_on_failure(self, test_cache, sample_stock_data):
+        """Test that a failing batch leaves no partial writes behind"""
+        with pytest.raises(sqlite3.Error):
+            # A None value violates the NOT NULL constraint on data
+            test_cache.set_many(commentaries=[('good', 'Commentary'), ('bad', None)])
+        
+        assert test_cache.get_commentary('good') is None
+        assert not test_cache._connection.in_transaction
+    
+    def test_set_many_with_no_items_is_noop(self, test_cache):
+        """Test that an empty batch does not touch the database"""
+        test_cache.set_many()
+        
+        count = test_cache._connection.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+        assert count == 0
+    
+    def test_timestamp_index_created(self, test_cache):
+        """Test that cleanup queries are backed by an index on timestamp"""
+        cursor = test_cache._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='cache'"
+        )
+        index_names = [row[0] for row in cursor.fetchall()]
+        
+        assert 'idx_cache_timestamp' in index_names
+    
+    def test_background_cleanup_removes_old_entries(self, test_cache):
+        """Test that the background thread runs cleanup_old_data periodically"""
+        with patch.object(test_cache, 'cleanup_old_data') as mock_cleanup:
+            test_cache.start_background_cleanup(interval_hours=0.01 / 3600, max_age_hours=24)
+            time.sleep(0.1)
+            test_cache.close()
+        
+        assert mock_cleanup.call_count >= 1
+        mock_cleanup.assert_called_with(24)
+        assert test_cache._cleanup_thread is None
+    
+    def test_cleanup_after_close_is_a_no_op(self, test_cache):
+        """Test that a sweep reaching a closed cache deletes nothing instead of raising"""
+        test_cache.close()
+        
+        assert test_cache.cleanup_old_data() == 0
+    
+    def test_use_after_close_raises_clear_error(self, test_cache, sample_stock_data):
+        """Test that reads and writes on a closed cache raise ProgrammingError"""
+        test_cache.close()
+        
+        with pytest.raises(sqlite3.ProgrammingError, match="cache is closed"):
+            test_cache.get_stock_data("AAPL", "1mo")
+        with pytest.raises(sqlite3.ProgrammingError, match="cache is closed"):
+            test_cache.set_stock_data("AAPL", "1mo", sample_stock_data)
+        with pytest.raises(sqlite3.ProgrammingError, match="cache is closed"):
+            test_cache.set_commentary("hash", "Commentary")
+        with pytest.raises(sqlite3.ProgrammingError, match="cache is closed"):
+            test_cache.set_many(commentaries=[("hash", "Commentary")])
+        with pytest.raises(sqlite3.ProgrammingError, match="cache is closed"):
+            test_cache._delete("stock_AAPL_1mo")
+    
+    def test_background_cleanup_survives_racing_close(self, test_cache):
+        """Test that closing during back-to-back sweeps never kills the thread with an error"""
+        errors = []
+        with patch.object(threading, 'excepthook', side_effect=errors.append):
+            test_cache.start_background_cleanup(interval_hours=0.0001 / 3600)
+            time.sleep(0.05)
+            test_cache.close()
+        
+        assert errors == []
+    
+    def test_background_cleanup_starts_only_once(self, test_cache):
+        """Test that repeated start calls reuse the running thread"""
+        test_cache.start_background_cleanup()
+        thread = test_cache._cleanup_thread
+        
+        test_cache.start_background_cleanup()
+        
+        assert test_cache._cleanup_thread is thread
+        assert thread.daemon
+        test_cache.close()
+        assert not thread.is_alive()
+    
     def test_different_symbols_and_periods_are_cached_separately(self, test_cache, sample_stock_data):
         """Test that different symbols and periods are cached independently"""
         # Store data for different symbols and periods
@@ -354,6 +472,29 @@ class TestSimpleCache:
         pd.testing.assert_frame_equal(retrieved, empty_df, check_freq=False, check_dtype=False, 
                                     check_index_type=False, check_column_type=False)
     
+    def test_dataframe_round_trip_preserves_dtypes(self, test_cache):
+        """Test that Parquet storage keeps dtypes and timezone-aware index exactly"""
+        index = pd.date_range('2024-01-01', periods=3, tz='America/New_York', name='Date')
+        data = pd.DataFrame({
+            'Close': [104.0, 105.0, 106.0],
+            'Volume': [1000000, 1100000, 1200000]
+        }, index=index)
+        
+        test_cache.set_stock_data('AAPL', '1mo', data)
+        retrieved = test_cache.get_stock_data('AAPL', '1mo', max_age_hours=1)
+        
+        pd.testing.assert_frame_equal(retrieved, data, check_freq=False)
+    
+    def test_dataframe_stored_as_blob(self, test_cache, sample_stock_data):
+        """Test that DataFrames are persisted as binary blobs"""
+        test_cache.set_stock_data('AAPL', '1d', sample_stock_data)
+        
+        row = test_cache._connection.execute(
+            'SELECT data FROM cache WHERE key = ?', ('stock_AAPL_1d',)
+        ).fetchone()
+        
+        assert isinstance(row[0], bytes)
+    
     def test_cache_returns_none_for_nonexistent_key(self, test_cache):
         """Test that cache returns None for non-existent keys"""
         # Try to retrieve non-existent stock data
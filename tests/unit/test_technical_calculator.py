@@ -57,6 +57,26 @@ class TestTechnicalCalculator:
         expected_sma_5 = (10 + 20 + 30 + 40 + 50) / 5  # All values
         assert sma_5 == expected_sma_5
     
+    def test_sma_matches_pandas_rolling_mean(self):
+        """Test tail-slice SMA matches the last value of a full rolling mean"""
+        close_prices = self.sample_data['Close']
+        
+        for window in (5, 20, 50):
+            expected = close_prices.rolling(window=window).mean().iloc[-1]
+            assert TechnicalCalculator.calculate_sma(close_prices, window) == pytest.approx(expected)
+    
+    def test_sma_series_matches_pandas_rolling_mean(self):
+        """Test the running-sum SMA series against pandas rolling, including NaN gaps"""
+        close_prices = self.sample_data['Close'].copy()
+        close_prices.iloc[30] = np.nan
+        
+        for window in (5, 20, 50):
+            expected = close_prices.rolling(window=window).mean()
+            result = TechnicalCalculator.calculate_sma_series(close_prices, window)
+            
+            assert result.index.equals(close_prices.index)
+            np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), equal_nan=True)
+    
     def test_sma_insufficient_data_returns_none(self):
         """Test SMA returns None when insufficient data"""
         prices = pd.Series([10, 20, 30])
@@ -89,6 +109,76 @@ class TestTechnicalCalculator:
         # For this alternating pattern, RSI should be around middle range
         assert 30 <= rsi <= 70  # Reasonable range for this pattern
     
+    def test_rsi_uses_wilder_smoothing(self):
+        """Test RSI against a hand-computed Wilder-smoothed value"""
+        # Deltas +1, -1, +1 with window 2:
+        # seed gain/loss = 0.5/0.5, then gain = (0.5 + 1) / 2, loss = 0.5 / 2
+        # RS = 0.75 / 0.25 = 3 -> RSI = 75
+        prices = pd.Series([1.0, 2.0, 1.0, 2.0])
+        
+        assert TechnicalCalculator.calculate_rsi(prices, 2) == pytest.approx(75.0)
+    
+    def test_rsi_series_matches_latest_rsi(self):
+        """Test the charting RSI series ends at the scalar RSI value"""
+        close_prices = self.sample_data['Close']
+        
+        rsi_series = TechnicalCalculator.calculate_rsi_series(close_prices)
+        
+        assert len(rsi_series) == len(close_prices)
+        assert rsi_series.index.equals(close_prices.index)
+        assert rsi_series.iloc[:14].isna().all()
+        assert rsi_series.iloc[-1] == pytest.approx(TechnicalCalculator.calculate_rsi(close_prices))
+    
+    def test_indicator_series_match_individual_series(self):
+        """Test the chart series bundle matches the standalone series helpers"""
+        close_prices = self.sample_data['Close']
+        
+        series = self.calculator.calculate_indicator_series(self.sample_data)
+        
+        np.testing.assert_allclose(series['sma_20'], TechnicalCalculator.calculate_sma_series(close_prices, 20))
+        np.testing.assert_allclose(series['sma_50'], TechnicalCalculator.calculate_sma_series(close_prices, 50))
+        np.testing.assert_allclose(series['rsi'], TechnicalCalculator.calculate_rsi_series(close_prices))
+    
+    def test_rsi_long_history_uses_bounded_lookback(self):
+        """Test that capping the RSI warm-up does not measurably change the value"""
+        np.random.seed(7)
+        long_prices = pd.Series(np.random.randn(2000).cumsum() + 500)
+        
+        rsi = TechnicalCalculator.calculate_rsi(long_prices)
+        full_history_rsi = TechnicalCalculator.calculate_rsi_series(long_prices).iloc[-1]
+        
+        assert rsi == pytest.approx(full_history_rsi, abs=1e-6)
+    
+    def test_rsi_recovers_from_nan_in_seed_window(self):
+        """Test that a NaN close early on reseeds the RSI instead of poisoning it"""
+        close_prices = self.sample_data['Close'].reset_index(drop=True)
+        with_gap = close_prices.copy()
+        with_gap.iloc[5] = np.nan
+        
+        rsi = TechnicalCalculator.calculate_rsi(with_gap)
+        
+        # Smoothing restarts after the gap, as if the history began at bar 6
+        assert rsi == pytest.approx(TechnicalCalculator.calculate_rsi(close_prices.iloc[6:]))
+    
+    def test_rsi_nan_last_close_returns_nan(self):
+        """Test that a NaN latest close yields NaN rather than a stale RSI"""
+        close_prices = self.sample_data['Close'].copy()
+        close_prices.iloc[-1] = np.nan
+        
+        assert np.isnan(TechnicalCalculator.calculate_rsi(close_prices))
+    
+    def test_rsi_series_gaps_match_rolling_window(self):
+        """Test that a NaN close blanks the chart series only until a full window passes"""
+        close_prices = self.sample_data['Close'].copy()
+        close_prices.iloc[5] = np.nan
+        
+        rsi_series = TechnicalCalculator.calculate_rsi_series(close_prices)
+        rolling = close_prices.diff().rolling(window=14).mean()
+        
+        np.testing.assert_array_equal(rsi_series.isna().to_numpy(), rolling.isna().to_numpy())
+        assert rsi_series.notna().sum() == len(close_prices) - 20
+        assert rsi_series.iloc[-1] == pytest.approx(TechnicalCalculator.calculate_rsi(close_prices))
+    
     def test_rsi_insufficient_data_returns_none(self):
         """Test RSI returns None when insufficient data"""
         # RSI needs window + 1 data points
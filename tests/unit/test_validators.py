@@ -0,0 +1,38 @@
+"""
+Unit tests for the Streamlit input validators.
+"""
+
+from utils import validators
+
+
+class TestValidateStockSymbol:
+    """Test suite for validate_stock_symbol"""
+    
+    def test_valid_symbols_are_normalised(self):
+        """Test that surrounding whitespace and case are ignored"""
+        for symbol in ("A", " aapl ", "GOOGL"):
+            assert validators.validate_stock_symbol(symbol) == {
+                'is_valid': True, 'message': 'Valid symbol format'
+            }
+    
+    def test_invalid_formats_are_rejected(self):
+        """Test that digits, punctuation and long symbols fail with one message"""
+        for symbol in ("AAPL1", "BRK.B", "TOOLONG", "   ", "ÅBC"):
+            result = validators.validate_stock_symbol(symbol)
+            assert result == {'is_valid': False, 'message': 'Symbol must be 1-5 letters only'}
+    
+    def test_empty_symbol(self):
+        """Test that an empty input reports that a symbol is required"""
+        assert validators.validate_stock_symbol("")['message'] == 'Symbol cannot be empty'
+    
+    def test_repeated_input_is_memoized(self):
+        """Test that identical reruns reuse the cached check and return fresh dicts"""
+        validators._validate_symbol_cached.cache_clear()
+        
+        first = validators.validate_stock_symbol("MSFT")
+        first['is_valid'] = False
+        second = validators.validate_stock_symbol("MSFT")
+        
+        assert second['is_valid'] is True
+        info = validators._validate_symbol_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
@@ -11,7 +11,7 @@ import time
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 
-from src.data.yfinance_provider import YFinanceProvider
+from src.data.yfinance_provider import YFinanceProvider, _clean_symbol_cached
 
 
 class TestYFinanceProvider:
@@ -88,7 +88,7 @@ class TestYFinanceProvider:
             self.provider.fetch_stock_data("AAPL", "1d")
     
     @patch('src.data.yfinance_provider.yf.Ticker')
-    @patch('src.data.yfinance_provider.time.sleep')
+    @patch('src.utils.rate_limiter.time.sleep')
     def test_rate_limiting_delays_requests(self, mock_sleep, mock_ticker):
         """Test rate limiting behavior"""
         # Setup mock
@@ -96,9 +96,11 @@ class TestYFinanceProvider:
         mock_instance.history.return_value = self.sample_data
         mock_ticker.return_value = mock_instance
         
+        provider = YFinanceProvider(min_interval=60.0, burst=1)
+        
         # Make two consecutive calls
-        self.provider.fetch_stock_data("AAPL", "1mo")
-        self.provider.fetch_stock_data("GOOGL", "1mo")
+        provider.fetch_stock_data("AAPL", "1mo")
+        provider.fetch_stock_data("GOOGL", "1mo")
         
         # Assert sleep was called due to rate limiting
         mock_sleep.assert_called()
@@ -161,6 +163,10 @@ class TestYFinanceProvider:
         
         with pytest.raises(ValueError, match="Invalid symbol format"):
             self.provider._clean_symbol("ABC@")
+        
+        # Only ASCII letters are accepted
+        with pytest.raises(ValueError, match="Invalid symbol format"):
+            self.provider._clean_symbol("ÅBC")
     
     @patch('src.data.yfinance_provider.yf.Ticker')
     def test_fetch_stock_data_with_api_exception(self, mock_ticker):
@@ -172,33 +178,37 @@ class TestYFinanceProvider:
         with pytest.raises(ValueError, match="Failed to fetch data for AAPL"):
             self.provider.fetch_stock_data("AAPL", "1mo")
     
-    @patch('src.data.yfinance_provider.time.time')
-    def test_rate_limiting_timing(self, mock_time):
+    @patch('src.utils.rate_limiter.time.monotonic')
+    def test_rate_limiting_timing(self, mock_monotonic):
         """Test rate limiting timing calculations"""
-        # Setup mock time sequence
-        mock_time.side_effect = [0.0, 0.5, 1.0, 2.0]  # Sequence of time calls
+        mock_monotonic.return_value = 0.0
         
-        provider = YFinanceProvider(min_interval=1.0)
+        provider = YFinanceProvider(min_interval=1.0, burst=2)
         
-        # First call should not sleep (no previous call)
-        provider._apply_rate_limiting()
-        
-        # Second call should sleep because only 0.5 seconds elapsed
-        with patch('src.data.yfinance_provider.time.sleep') as mock_sleep:
+        with patch('src.utils.rate_limiter.time.sleep') as mock_sleep:
+            # Calls within the burst allowance should not sleep
+            provider._apply_rate_limiting()
             provider._apply_rate_limiting()
-            mock_sleep.assert_called_once_with(0.5)  # Should sleep for remaining time
+            mock_sleep.assert_not_called()
+            
+            # Third call 0.5 seconds later waits for the rest of the refill
+            mock_monotonic.return_value = 0.5
+            provider._apply_rate_limiting()
+            mock_sleep.assert_called_once_with(pytest.approx(0.5))
     
     def test_provider_initialization(self):
         """Test provider initialization with different parameters"""
         # Default initialization
         provider1 = YFinanceProvider()
         assert provider1.min_interval == 1.0
-        assert provider1.last_call_time == 0
+        assert provider1.rate_limiter.rate == 1.0
+        assert provider1.rate_limiter.capacity == 5
         
         # Custom initialization
-        provider2 = YFinanceProvider(min_interval=2.0)
+        provider2 = YFinanceProvider(min_interval=2.0, burst=1)
         assert provider2.min_interval == 2.0
-        assert provider2.last_call_time == 0
+        assert provider2.rate_limiter.rate == 0.5
+        assert provider2.rate_limiter.capacity == 1
     
     @patch('src.data.yfinance_provider.yf.Ticker')
     def test_symbol_case_handling(self, mock_ticker):
@@ -241,9 +251,8 @@ class TestYFinanceProvider:
         result = self.provider.fetch_stock_data("AAPL", "1mo")
         
         # Assert DataFrame structure
-        expected_columns = ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
-        for col in expected_columns:
-            assert col in result.columns
+        expected_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        assert list(result.columns) == expected_columns
         
         assert len(result) > 0
         assert isinstance(result.index, pd.DatetimeIndex)
@@ -256,10 +265,12 @@ class TestYFinanceProvider:
         mock_instance.history.return_value = self.sample_data
         mock_ticker.return_value = mock_instance
         
-        with patch('src.data.yfinance_provider.time.sleep') as mock_sleep:
+        provider = YFinanceProvider(min_interval=60.0, burst=1)
+        
+        with patch('src.utils.rate_limiter.time.sleep') as mock_sleep:
             # Make two validation calls quickly
-            self.provider.validate_symbol("AAPL")
-            self.provider.validate_symbol("GOOGL")
+            provider.validate_symbol("AAPL")
+            provider.validate_symbol("GOOGL")
             
             # Assert sleep was called due to rate limiting
             assert mock_sleep.called
@@ -291,10 +302,167 @@ class TestYFinanceProvider:
         mock_instance.history.return_value = self.sample_data
         mock_ticker.return_value = mock_instance
         
-        with patch('src.data.yfinance_provider.time.sleep') as mock_sleep:
-            # Make multiple calls
-            for symbol in ["AAPL", "GOOGL", "MSFT", "AMZN"]:
-                self.provider.fetch_stock_data(symbol, "1mo")
+        provider = YFinanceProvider(min_interval=60.0)
+        
+        with patch('src.utils.rate_limiter.time.sleep') as mock_sleep:
+            # Make more calls than the burst allowance
+            for symbol in ["AAPL", "GOOGL", "MSFT", "AMZN", "META", "NVDA", "TSLA"]:
+                provider.fetch_stock_data(symbol, "1mo")
             
-            # Should have called sleep multiple times due to rate limiting
-            assert mock_sleep.call_count >= 3  # Should sleep for most calls except first
+            # The first five calls use the burst; the rest wait for refills
+            assert mock_sleep.call_count == 2
+    
+    def _ticker_histories(self, mock_ticker, histories):
+        """Make yf.Ticker(symbol).history() return per-symbol data (empty if unknown)"""
+        def make_ticker(symbol):
+            ticker = Mock()
+            ticker.history.return_value = histories.get(symbol, self.empty_data)
+            return ticker
+        mock_ticker.side_effect = make_ticker
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_fetch_many_returns_one_frame_per_symbol(self, mock_ticker):
+        """Test that each unique symbol is fetched once"""
+        self._ticker_histories(mock_ticker, {'AAPL': self.sample_data, 'MSFT': self.sample_data * 2})
+        
+        result = self.provider.fetch_many(["aapl", "MSFT", "AAPL"], "1mo")
+        
+        assert sorted(call[0][0] for call in mock_ticker.call_args_list) == ["AAPL", "MSFT"]
+        assert set(result) == {"AAPL", "MSFT"}
+        assert list(result["AAPL"].columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+        pd.testing.assert_series_equal(result["MSFT"]['Close'], self.sample_data['Close'] * 2, check_names=False)
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_fetch_many_matches_fetch_stock_data(self, mock_ticker):
+        """Test that batched frames are identical to single-symbol fetches"""
+        tz_data = self.sample_data.tz_localize('America/New_York')
+        self._ticker_histories(mock_ticker, {'AAPL': tz_data})
+        
+        batched = self.provider.fetch_many(["AAPL"], "1mo")["AAPL"]
+        single = self.provider.fetch_stock_data("AAPL", "1mo")
+        
+        pd.testing.assert_frame_equal(batched, single)
+        assert str(batched.index.tz) == 'America/New_York'
+        assert batched['Volume'].dtype == self.sample_data['Volume'].dtype
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_fetch_many_omits_missing_and_short_symbols(self, mock_ticker):
+        """Test that symbols without enough data are left out of the result"""
+        self._ticker_histories(mock_ticker, {'AAPL': self.sample_data, 'SHORT': self.insufficient_data})
+        
+        result = self.provider.fetch_many(["AAPL", "SHORT", "GONE"], "1mo")
+        
+        assert set(result) == {"AAPL"}
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_fetch_many_chunks_and_rate_limits_per_chunk(self, mock_ticker):
+        """Test that large symbol lists are rate limited once per chunk of 20"""
+        self._ticker_histories(mock_ticker, {})
+        symbols = [f"S{i}" for i in range(45)]
+        
+        with patch.object(self.provider, '_apply_rate_limiting') as mock_limit:
+            self.provider.fetch_many(symbols, "1mo")
+        
+        assert mock_ticker.call_count == 45
+        assert mock_limit.call_count == 3
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_fetch_many_omits_failed_symbols(self, mock_ticker):
+        """Test that a network failure for one symbol does not fail the batch"""
+        def make_ticker(symbol):
+            ticker = Mock()
+            if symbol == "MSFT":
+                ticker.history.side_effect = Exception("Network error")
+            else:
+                ticker.history.return_value = self.sample_data
+            return ticker
+        mock_ticker.side_effect = make_ticker
+        
+        result = self.provider.fetch_many(["AAPL", "MSFT"], "1mo")
+        
+        assert set(result) == {"AAPL"}
+    
+    def test_fetch_many_rejects_invalid_symbols(self):
+        """Test that invalid symbols raise before anything is fetched"""
+        with pytest.raises(ValueError, match="Invalid symbol format"):
+            self.provider.fetch_many(["AAPL", "BAD!"], "1mo")
+    
+    def test_ensure_contiguous_columns_copies_strided_views(self):
+        """Test that columns viewing a row-major array are made contiguous"""
+        values = np.random.uniform(100, 110, (30, 3))
+        data = pd.DataFrame(values, columns=['Open', 'Close', 'Volume'], copy=False)
+        assert not data['Close'].to_numpy().flags['C_CONTIGUOUS']
+        
+        result = YFinanceProvider._ensure_contiguous_columns(data)
+        
+        for column in result.columns:
+            assert result[column].to_numpy().flags['C_CONTIGUOUS']
+        np.testing.assert_array_equal(result.to_numpy(), values)
+    
+    def test_clean_symbol_is_memoized(self):
+        """Test that repeated symbols are served from the cache"""
+        _clean_symbol_cached.cache_clear()
+        
+        self.provider._clean_symbol("msft")
+        self.provider._clean_symbol("msft")
+        
+        info = _clean_symbol_cached.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        
+        # Invalid symbols keep raising on every call
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid symbol format"):
+                self.provider._clean_symbol("AB@")
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_validate_symbol_reuses_recent_success(self, mock_ticker):
+        """Test that a recently validated symbol skips the network call"""
+        mock_instance = Mock()
+        mock_instance.history.return_value = self.sample_data
+        mock_ticker.return_value = mock_instance
+        
+        assert self.provider.validate_symbol("AAPL") is True
+        assert self.provider.validate_symbol("aapl") is True
+        
+        assert mock_ticker.call_count == 1
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_fetch_seeds_validation_cache(self, mock_ticker):
+        """Test that a successful fetch makes later validation free"""
+        mock_instance = Mock()
+        mock_instance.history.return_value = self.sample_data
+        mock_ticker.return_value = mock_instance
+        
+        self.provider.fetch_stock_data("MSFT", "1mo")
+        assert self.provider.validate_symbol("MSFT") is True
+        
+        assert mock_ticker.call_count == 1
+    
+    @patch('src.data.yfinance_provider.time.monotonic')
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_validation_cache_expires(self, mock_ticker, mock_monotonic):
+        """Test that validations older than valid_ttl are repeated"""
+        mock_instance = Mock()
+        mock_instance.history.return_value = self.sample_data
+        mock_ticker.return_value = mock_instance
+        mock_monotonic.return_value = 1000.0
+        
+        with patch.object(self.provider, '_apply_rate_limiting'):
+            self.provider.validate_symbol("AAPL")
+            mock_monotonic.return_value = 1000.0 + self.provider.valid_ttl + 1
+            self.provider.validate_symbol("AAPL")
+        
+        assert mock_ticker.call_count == 2
+    
+    @patch('src.data.yfinance_provider.yf.Ticker')
+    def test_invalid_symbols_are_not_cached(self, mock_ticker):
+        """Test that failed validations are retried"""
+        mock_instance = Mock()
+        mock_instance.history.return_value = self.empty_data
+        mock_ticker.return_value = mock_instance
+        
+        assert self.provider.validate_symbol("NOPE") is False
+        assert self.provider.validate_symbol("NOPE") is False
+        
+        assert mock_ticker.call_count == 2